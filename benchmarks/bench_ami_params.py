@@ -0,0 +1,88 @@
+"""
+Benchmark of the compiled ``AMI_Init()`` parameter string encoder, against the original recursive ``sexpr()`` one.
+
+Usage::
+
+    python benchmarks/bench_ami_params.py [--repeat N] [--taps N] [--depth N]
+
+The parameter tree is a chain of ``depth`` nested groups, each holding a list of ``taps`` tap weights,
+which mimics large, hierarchical, vendor models (e.g. - a many tap DFE behind several levels of grouping).
+Three sweep styles are timed:
+
+    - "one tap":  each call changes a single tap weight (the typical sweep/optimizer step),
+    - "all taps": each call changes every tap weight,
+    - "repeat":   the same few parameter sets are seen over and over (e.g. - re-running a corner table).
+"""
+
+import argparse
+import time
+
+from pyibisami.ami import model
+from pyibisami.ami.model import encode_ami_params, sexpr
+
+
+def reference_encoding(ami_params: dict) -> bytes:
+    "The parameter string, as ``AMIModel.initialize()`` originally built it."
+    text = f"({ami_params['root_name']} "
+    for pname, pval in ami_params.items():
+        if pname != "root_name":
+            text += sexpr(pname, pval)
+    return (text + ")").encode("utf-8")
+
+
+def make_params(ntaps: int, depth: int, step: int, nchanged: int) -> dict:
+    "Parameter tree, with the first ``nchanged`` taps of each group depending upon ``step``."
+    group: dict = {}
+    for level in reversed(range(depth)):
+        group = {
+            "enable": True,
+            "mode": "adaptive",
+            "taps": {str(n + 1): (0.001 * (n + step) if n < nchanged else 0.001 * n) for n in range(ntaps)},
+            **({"sub": group} if group else {}),
+            "level": level,
+        }
+    return {"root_name": "big_rx", "rx": group, "ctle_gain": 6}
+
+
+def bench(encode, cases: list[dict], repeat: int) -> float:
+    "Best-of-``repeat`` time, per call, to encode all cases."
+    best = float("inf")
+    for _ in range(repeat):
+        model._encode_ami_params.cache_clear()  # pylint: disable=protected-access
+        model._ami_params_template.cache_clear()  # pylint: disable=protected-access
+        t_start = time.perf_counter()
+        for params in cases:
+            encode(params)
+        best = min(best, time.perf_counter() - t_start)
+    return best / len(cases)
+
+
+def main():
+    "Run the benchmark and report timing."
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5, help="Number of repetitions; the best is reported.")
+    parser.add_argument("--taps", type=int, default=200, help="Number of taps per group.")
+    parser.add_argument("--depth", type=int, default=8, help="Number of nested groups.")
+    parser.add_argument("--calls", type=int, default=200, help="Number of calls per repetition.")
+    args = parser.parse_args()
+
+    sweeps = {
+        "one tap": [make_params(args.taps, args.depth, step, 1) for step in range(args.calls)],
+        "all taps": [make_params(args.taps, args.depth, step, args.taps) for step in range(args.calls)],
+        "repeat": [make_params(args.taps, args.depth, step % 4, args.taps) for step in range(args.calls)],
+    }
+    for cases in sweeps.values():
+        for params in cases[:5]:
+            assert encode_ami_params(params) == reference_encoding(params), "Encodings differ!"
+
+    nchars = len(reference_encoding(sweeps["one tap"][0]))
+    print(f"{args.depth} groups of {args.taps} taps; {nchars} characters per parameter string.")
+    print(f"{'sweep':<10} {'sexpr (us)':>11} {'compiled (us)':>14} {'speedup':>8}")
+    for name, cases in sweeps.items():
+        t_ref = bench(reference_encoding, cases, args.repeat)
+        t_new = bench(encode_ami_params, cases, args.repeat)
+        print(f"{name:<10} {t_ref * 1e6:>11.1f} {t_new * 1e6:>14.1f} {t_ref / t_new:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
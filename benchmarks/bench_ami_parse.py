@@ -0,0 +1,120 @@
+"""
+Benchmark of the hand-written AMI S-expression parser, against the original ``parsec`` based one.
+
+Usage::
+
+    python benchmarks/bench_ami_parse.py [--repeat N] [AMI_FILE ...]
+
+With no files given, the example Tx model's ``.ami`` file is generated (from ``tests/examples/example_tx.py``)
+and used, along with a large synthetic ``.ami`` file and a batch of typical ``AMI_GetWave()`` output strings.
+"""
+
+import argparse
+import io
+import time
+from pathlib import Path
+
+import em
+
+from pyibisami.ami.config import param_types
+from pyibisami.ami.parser import ami_parse_fast, ami_parse_parsec
+
+EXAMPLES = Path(__file__).resolve().parent.parent / "tests" / "examples"
+AMI_TEMPLATE = Path(__file__).resolve().parent.parent / "src" / "pyibisami" / "ami" / "generic.ami.em"
+
+
+def example_ami() -> str:
+    "Render the example Tx model's ``.ami`` file."
+    cfg: dict = {}
+    exec((EXAMPLES / "example_tx.py").read_text(encoding="utf-8"), cfg)  # pylint: disable=exec-used
+    output = io.StringIO()
+    interpreter = em.Interpreter(
+        output=output,
+        globals={
+            "ami_params": cfg["ami_params"],
+            "param_types": param_types,
+            "model_name": cfg["kFileBaseName"],
+            "description": cfg["kDescription"],
+            "date": "",
+        },
+    )
+    try:
+        interpreter.string(AMI_TEMPLATE.read_text(encoding="utf-8"))
+        return output.getvalue()
+    finally:
+        interpreter.shutdown()
+
+
+def synthetic_ami(nparams: int = 2000) -> str:
+    "A large ``.ami`` file, typical of vendor models with many tunable parameters."
+    params = "\n".join(
+        f"""        (param_{n}  | Parameter {n}.
+            (Usage In) (Type Float) (Range {n}.0 -1.5e-3 {n + 10}.5)
+            (Description "Synthetic parameter number {n}.")
+        )"""
+        for n in range(nparams)
+    )
+    return f"""(big_model
+    (Description "Synthetic model.")
+    (Reserved_Parameters
+        (AMI_Version (Usage Info) (Type String) (Value "7.0"))
+        (Init_Returns_Impulse (Usage Info) (Type Boolean) (Value True))
+        (GetWave_Exists (Usage Info) (Type Boolean) (Value True))
+    )
+    (Model_Specific
+{params}
+    )
+)
+"""
+
+
+def getwave_outputs(ncalls: int = 2000) -> list[str]:
+    "Output parameter strings, as returned by a typical Rx model's ``AMI_GetWave()``."
+    return [
+        f"(rx_model (cdr_locked True) (cdr_phase {n * 1.25e-13:.6e}) "
+        f"(dfe_tap1 {0.01 * n:.4f}) (dfe_tap2 {-0.002 * n:.4f}) (dfe_tap3 {0.0005 * n:.4f}) (ctle_gain {n % 7}))"
+        for n in range(ncalls)
+    ]
+
+
+def bench(texts: list[str], repeat: int) -> tuple[float, float]:
+    "Best-of-``repeat`` time to parse all of ``texts``, for each parser; verifies that the results agree."
+    for text in texts:
+        assert ami_parse_fast(text) == ami_parse_parsec(text), "Parsers disagree!"
+    times = []
+    for parse in [ami_parse_parsec, ami_parse_fast]:
+        best = float("inf")
+        for _ in range(repeat):
+            t_start = time.perf_counter()
+            for text in texts:
+                parse(text)
+            best = min(best, time.perf_counter() - t_start)
+        times.append(best)
+    return times[0], times[1]
+
+
+def main():
+    "Run the benchmark and report timing."
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=3, help="Number of repetitions; the best is reported.")
+    parser.add_argument("files", nargs="*", type=Path, help="AMI files to parse.")
+    args = parser.parse_args()
+
+    if args.files:
+        cases = [(file.name, [file.read_text(encoding="utf-8")]) for file in args.files]
+    else:
+        cases = [
+            ("example_tx.ami", [example_ami()]),
+            ("synthetic.ami", [synthetic_ami()]),
+            ("GetWave outputs", getwave_outputs()),
+        ]
+
+    print(f"{'input':<20} {'chars':>9} {'parsec (s)':>11} {'fast (s)':>10} {'speedup':>8}")
+    for name, texts in cases:
+        t_parsec, t_fast = bench(texts, args.repeat)
+        nchars = sum(map(len, texts))
+        print(f"{name:<20} {nchars:>9} {t_parsec:>11.4g} {t_fast:>10.4g} {t_parsec / t_fast:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Benchmark of ``pyibisami.common.deconv_same()`` run time, across row sizes, for each deconvolution method.
+
+Usage::
+
+    python benchmarks/bench_deconv.py [--max-lstsq N]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from pyibisami.common import deconv_same
+
+ROW_SIZES = [128, 512, 1024, 2048, 4096, 16384, 65536]
+
+
+def make_case(n: int):
+    "Delayed first order channel, with a 3-tap FIR filter; returns output, input, and expected response."
+    x = np.zeros(n)
+    x[3:] = 0.2 * 0.8 ** np.arange(n - 3)
+    h = np.zeros(n)
+    h[[0, n // 8, n // 4]] = [1.0, -0.3, 0.1]
+    return np.convolve(x, h)[:n], x, np.roll(h, (n - 1) // 2)
+
+
+def main():
+    "Run the benchmark and report timing and accuracy."
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--max-lstsq", type=int, default=4096, help="Largest row size to try with 'lstsq'.")
+    args = parser.parse_args()
+
+    print(f"{'row_size':>9} {'method':>6} {'time (s)':>10} {'max|err|':>10}")
+    for n in ROW_SIZES:
+        y, x, h = make_case(n)
+        for method in ["lstsq", "fft"]:
+            if method == "lstsq" and n > args.max_lstsq:
+                continue
+            t_start = time.perf_counter()
+            h_est = deconv_same(y, x, method=method)
+            elapsed = time.perf_counter() - t_start
+            print(f"{n:9d} {method:>6} {elapsed:10.4g} {np.abs(h_est - h).max():10.3g}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Benchmark of ``AMIModel.getWave()`` throughput, in samples/second.
+
+Compares the original, per-sample ctypes marshalling scheme against the
+current NumPy buffer path (both with a freshly allocated output array and
+in place), using the bundled example Tx model.
+
+With ``--stub``, the call into the model is replaced by a no-op,
+which isolates the cost of the Python side wrapper from that of the model itself.
+
+Usage::
+
+    python benchmarks/bench_getwave.py [--nbits N] [--bits-per-call B] [--stub]
+"""
+
+import argparse
+import sys
+import time
+from ctypes import byref, c_double
+from pathlib import Path
+
+import numpy as np
+
+from pyibisami.ami.model import AMIModel, AMIModelInitializer
+
+EXAMPLES_DIR = Path(__file__).parents[1] / "tests" / "examples"
+if sys.platform == "win32":
+    DLL_PATH = EXAMPLES_DIR / "example_tx_x86_amd64.dll"
+elif sys.platform.startswith("linux"):
+    DLL_PATH = EXAMPLES_DIR / "example_tx_x86_amd64.so"
+else:
+    DLL_PATH = EXAMPLES_DIR / "example_tx_x86_amd64_osx.so"
+
+NSPB = 32
+BIT_TIME = 100e-12
+
+
+def legacy_getwave(model: AMIModel, wave, bits_per_call: int):
+    """The original ``getWave()`` implementation, which marshals every sample through Python."""
+    samps_per_call = NSPB * bits_per_call
+    Signal = c_double * samps_per_call
+    Clocks = c_double * (bits_per_call + 8)
+    idx = 0
+    _clock_times = Clocks(0.0)
+    wave_out: list[float] = []
+    clock_times: list[float] = []
+    params_out: list[str] = []
+    input_len = len(wave)
+    while idx < input_len:
+        remaining_samps = input_len - idx
+        if remaining_samps < samps_per_call:
+            Signal = c_double * remaining_samps
+            tmp_wave = wave[idx:]
+        else:
+            tmp_wave = wave[idx: idx + samps_per_call]
+        _wave = Signal(*tmp_wave)
+        model._amiGetWave(  # pylint: disable=protected-access
+            byref(_wave), len(_wave), byref(_clock_times),
+            byref(model._ami_params_out), model._ami_mem_handle  # pylint: disable=protected-access
+        )
+        wave_out.extend(_wave)
+        clock_times.extend(_clock_times)
+        params_out.append(model.ami_params_out)
+        idx += len(_wave)
+    return np.array(wave_out), np.array(clock_times[: len(wave_out) // NSPB]), params_out
+
+
+def new_model() -> AMIModel:
+    "Load and initialize a fresh instance of the example model."
+    model = AMIModel(str(DLL_PATH))
+    model.initialize(
+        AMIModelInitializer(
+            {"root_name": "example_tx", "tx_tap_nm1": 3},
+            sample_interval=c_double(BIT_TIME / NSPB),
+            bit_time=c_double(BIT_TIME),
+        )
+    )
+    return model
+
+
+def main():
+    "Run the benchmark and report throughput."
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--nbits", type=int, default=100_000)
+    parser.add_argument("--bits-per-call", type=int, default=4)
+    parser.add_argument("--stub", action="store_true", help="Replace the model's AMI_GetWave() with a no-op.")
+    args = parser.parse_args()
+
+    wave = np.repeat(np.random.default_rng(0).choice([-0.5, 0.5], args.nbits), NSPB)
+    nsamps = len(wave)
+
+    def run(label, fn):
+        model = new_model()
+        if args.stub:
+            model._amiGetWave = lambda *_args: 1  # pylint: disable=protected-access
+        t_start = time.perf_counter()
+        result = fn(model)
+        elapsed = time.perf_counter() - t_start
+        print(f"{label:>10}: {nsamps / elapsed:12.4g} samples/s  ({elapsed:.3f} s)")
+        return result[0]
+
+    ref = run("legacy", lambda m: legacy_getwave(m, wave, args.bits_per_call))
+    out = run("numpy", lambda m: m.getWave(wave, bits_per_call=args.bits_per_call))
+    buf = wave.copy()
+    inp = run("in-place", lambda m: m.getWave(buf, bits_per_call=args.bits_per_call, out=buf))
+    assert np.array_equal(ref, out) and np.array_equal(ref, inp), "Results differ!"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Benchmark of lazy (i.e. - section indexed) and parallel IBIS file parsing, against a full serial parse.
+
+Usage::
+
+    python benchmarks/bench_ibis_parse.py [--models N] [--workers N ...] [IBIS_FILE]
+
+With no file given, a synthetic IBIS file, with ``N`` models, is used.
+The parallel parse is timed for each of the given numbers of worker processes
+(default: 1, 2, 4, ..., up to the CPU count), in order to show its scaling across cores.
+The bulk I-V table parser is also timed against ``many1(vi_line)``, on a dense table.
+"""
+
+import argparse
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+
+from parsec import many1
+
+from pyibisami.ibis.parser import iv_table, parse_ibis_file, scan_ibis_file, vi_line
+
+
+def synthetic_ibis(nmodels: int, nwave: int = 100) -> str:
+    "IBIS file with one component and ``nmodels`` models, each with I-V tables and a [Rising Waveform] table."
+    iv = "\n".join(f"{v:.2f}    {v * 1e-2:.3e}    {v * 1e-2:.3e}    {v * 1e-2:.3e}" for v in (-1.8, 0.0, 1.8, 3.6))
+    wave = "\n".join(f"{n * 10}p    {n / nwave:.4f}    {n / nwave:.4f}    {n / nwave:.4f}" for n in range(nwave))
+    pins = "\n".join(f"{n}p     SIG_{n}             model_{n}" for n in range(nmodels))
+    models = "\n".join(
+        f"""[Model]   model_{n}
+Model_type   I/O
+C_comp     1.00p    0.01p    5.00p
+[Algorithmic Model]
+Executable linux_gcc4.1.2_64          model_{n}.so   model_{n}.ami
+[End Algorithmic Model]
+[Voltage_Range]         1.80     1.62     1.98
+[Pulldown]
+{iv}
+[Pullup]
+{iv}
+[Ramp]
+dV/dt_r    0.540/108.00p    0.512/511.58p    0.566/56.57p
+dV/dt_f    0.540/108.00p    0.512/511.58p    0.566/56.57p
+[Rising Waveform]
+R_fixture = 50
+{wave}
+[Falling Waveform]
+R_fixture = 50
+{wave}
+"""
+        for n in range(nmodels)
+    )
+    return f"""[IBIS Ver]   5.1
+[File Name]  synthetic.ibs
+[File Rev]   v0.1
+[Component]    Synthetic
+[Manufacturer] (n/a)
+[Package]
+R_pkg     0.10     0.00     0.50
+L_pkg    10.00n    0.10n   50.00n
+C_pkg     1.00p    0.01p    5.00p
+[Pin]  signal_name        model_name
+{pins}
+{models}
+[END]
+"""
+
+
+def timed(func, *args, **kwargs):
+    "Call ``func`` and return its result and the elapsed time."
+    t_start = time.perf_counter()
+    rslt = func(*args, **kwargs)
+    return rslt, time.perf_counter() - t_start
+
+
+def best_of(func, *args, repeat: int = 5):
+    "The shortest of ``repeat`` timings of ``func``, so as not to be thrown by other activity on the machine."
+    return min(timed(func, *args)[1] for _ in range(repeat))
+
+
+def main():
+    "Run the benchmark and report timing."
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--models", type=int, default=100, help="Number of models in the synthetic file.")
+    parser.add_argument("--workers", type=int, nargs="+", help="Numbers of worker processes to try.")
+    parser.add_argument("file", nargs="?", type=Path, help="IBIS file to parse.")
+    args = parser.parse_args()
+
+    contents = args.file.read_text(encoding="utf-8") if args.file else synthetic_ibis(args.models)
+    (status, eager), t_full = timed(parse_ibis_file, contents, cache=False)  # First, so as to pay for all imports.
+    assert status == "Success!", status
+    sections, t_scan = timed(scan_ibis_file, contents)
+    (status, lazy), t_lazy = timed(parse_ibis_file, contents, lazy=True, cache=False)
+    assert status == "Success!", status
+    name = next(iter(lazy["models"]))
+    _, t_one = timed(lazy["models"].__getitem__, name)
+    (status, selected), t_selected = timed(parse_ibis_file, contents, cache=False, models=[name])
+    assert status == "Success!", status
+    assert list(selected["models"]) == [name]
+    # pylint: disable=protected-access
+    np.testing.assert_equal(eager["models"][name]._subDict, lazy["models"][name]._subDict)
+
+    print(f"{len(contents)} characters; {len(sections)} sections; {len(eager['models'])} models.")
+    print(f"scan:                {t_scan:8.3f} s")
+    print(f"lazy parse:          {t_lazy:8.3f} s")
+    print(f"  + one model:       {t_one:8.3f} s")
+    print(f"selected parse:      {t_selected:8.3f} s")
+    print(f"full parse:          {t_full:8.3f} s")
+    print(f"speedup (one model): {t_full / (t_lazy + t_one):8.1f}")
+    print(f"speedup (selected):  {t_full / t_selected:8.1f}")
+
+    table = "".join(
+        f"{n * 0.01:.3f}  {n * 1e-5:.4e}  {n * 0.9:.3f}m  {n * 1.1:.3f}mA  | row {n}\n" for n in range(200)
+    )
+    t_rows, t_bulk = best_of(many1(vi_line), table, 0), best_of(iv_table, table, 0)
+    print("\nI-V table (200 rows):")
+    print(f"many1(vi_line):      {t_rows:8.4f} s")
+    print(f"iv_table:            {t_bulk:8.4f} s")
+    print(f"speedup:             {t_rows / t_bulk:8.1f}")
+
+    ncpus = os.cpu_count() or 1
+    workers = args.workers or [2**n for n in range(ncpus.bit_length()) if 2**n <= ncpus]
+    print(f"\nparallel parse ({ncpus} CPUs):")
+    print(f"{'workers':>7} {'time (s)':>9} {'speedup':>8}")
+    for nworkers in workers:
+        (status, parallel), t_parallel = timed(parse_ibis_file, contents, cache=False, workers=nworkers)
+        assert status == "Success!", status
+        assert list(parallel["models"]) == list(eager["models"])
+        print(f"{nworkers:>7} {t_parallel:>9.3f} {t_full / t_parallel:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
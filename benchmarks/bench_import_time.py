@@ -0,0 +1,57 @@
+"""
+Benchmark of the import times of the *PyIBIS-AMI* modules, each in a fresh interpreter.
+
+Usage::
+
+    python benchmarks/bench_import_time.py [--repeat N] [MODULE ...]
+
+The heavy GUI/plotting/numerics packages should only be imported where they're actually needed,
+which ``tests/test_import_time.py`` checks; this reports what that buys, in wall clock time.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+MODULES = [
+    "pyibisami.ami.model",
+    "pyibisami.ami.parser",
+    "pyibisami.ibis.parser",
+    "pyibisami.ibis.file",
+    "pyibisami.ibis.library",
+    "pyibisami.ami.config",
+    "pyibisami.tools.run_tests",
+    "pyibisami.tools.run_notebook",
+    "pyibisami.testing.test_models",
+    "pyibisami.testing.ami_test_config",
+]
+
+
+def import_time(module: str) -> float:
+    "Time taken to import a module in a fresh interpreter."
+    code = (
+        "import json, time\n"
+        "t_start = time.perf_counter()\n"
+        f"import {module}\n"
+        "print(json.dumps(time.perf_counter() - t_start))\n"
+    )
+    rslt = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return json.loads(rslt.stdout.splitlines()[-1])
+
+
+def main():
+    "Run the benchmark and report timing."
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=3, help="Number of repetitions; the best is reported.")
+    parser.add_argument("modules", nargs="*", default=MODULES, help="Modules to import.")
+    args = parser.parse_args()
+
+    print(f"{'module':<36} {'import (s)':>10}")
+    for module in args.modules:
+        best = min(import_time(module) for _ in range(args.repeat))
+        print(f"{module:<36} {best:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
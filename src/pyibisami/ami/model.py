@@ -8,17 +8,31 @@ Original Date:   July 3, 2012
 Copyright (c) 2019 David Banas; All rights reserved World wide.
 """
 
-import copy as cp
-from ctypes import CDLL, byref, c_char_p, c_double  # pylint: disable=no-name-in-module
+import _ctypes
+import glob
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+from time import perf_counter
+from collections.abc import Iterable, Iterator
+from ctypes import CDLL, POINTER, byref, c_char_p, c_double, sizeof  # pylint: disable=no-name-in-module
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import compress
+from operator import ne
 from pathlib import Path
 from typing import Any, Optional, TypeAlias, TypedDict
 
-from matplotlib import pyplot as plt
 import numpy as np
 from numpy.random     import default_rng
 
-from pyibisami.common import Cvec, Rvec, deconv_same
+from pyibisami.common import Cvec, Rvec, convolve, deconv_same
+from pyibisami.ami.stats import AMIModelStats, instrument_default
+from pyibisami.util.cache import DiskCache, default_cache_dir, file_digest, make_key
+
+INIT_CACHE_ENV = "PYIBISAMI_INIT_CACHE"
 
 VALID_RESPONSE_KEYS = [
     "imp_resp_init",    # The model's impulse response, from its `AMI_Init()` function (V/sample).
@@ -50,7 +64,20 @@ AmiModelResponseValue: TypeAlias = Rvec | tuple[Rvec, Rvec, Rvec, Rvec, Rvec, Cv
 AmiModelResponses: TypeAlias = dict[AmiModelResponseKey, AmiModelResponseValue]
 
 
-def loadWave(filename: str) -> tuple[Rvec, Rvec]:
+def _wave_cache_file(filename: str) -> Path:
+    """
+    Name of the binary sidecar cache file for the given waveform file.
+
+    The name is keyed on the source file's size and modification time,
+    so that a stale cache is never used.
+    """
+    path = Path(filename)
+    stat = path.stat()
+    key = hashlib.sha1(f"{stat.st_size}:{stat.st_mtime_ns}".encode()).hexdigest()[:16]
+    return path.with_name(f"{path.name}.{key}.npy")
+
+
+def loadWave(filename: str, cache: bool = False) -> tuple[Rvec, Rvec]:
     """
     Load a waveform file.
 
@@ -64,22 +91,35 @@ def loadWave(filename: str) -> tuple[Rvec, Rvec]:
     Args:
         filename: Name of waveform file to read in.
 
+    Keyword Args:
+        cache: Keep a binary (``.npy``) copy of the parsed waveform alongside the source file,
+            and memory-map it in place of parsing the source file, on subsequent loads.
+            Default: False
+
     Returns:
         A pair of *NumPy* arrays containing the time and voltage values, respectively.
+        (When ``cache`` is True, these are read-only views of the memory-mapped cache.)
     """
 
-    with open(filename, "r", encoding="utf-8") as theFile:
-        theFile.readline()  # Consume the header line.
-        time = []
-        voltage = []
-        for line in theFile:
-            tmp = list(map(float, line.split()))
-            time.append(tmp[0])
-            voltage.append(tmp[1])
-        return (np.array(time), np.array(voltage))
+    if cache:
+        cache_file = _wave_cache_file(filename)
+        if cache_file.exists():
+            wave = np.load(cache_file, mmap_mode="r")
+            return (wave[0], wave[1])
+
+    wave = np.loadtxt(filename, skiprows=1, usecols=(0, 1), ndmin=2, encoding="utf-8").T
+
+    if cache:
+        for stale_file in cache_file.parent.glob(f"{glob.escape(Path(filename).name)}.*.npy"):
+            stale_file.unlink(missing_ok=True)
+        try:
+            np.save(cache_file, wave)
+        except OSError:  # Caching is opportunistic; e.g. - the directory may be read-only.
+            pass
+    return (wave[0], wave[1])
 
 
-def interpFile(filename: str, sample_per: float) -> Rvec:
+def interpFile(filename: str, sample_per: float, cache: bool = False) -> Rvec:
     """
     Read in a waveform from a file, and convert it to the given sample rate,
     using linear interpolation.
@@ -88,28 +128,33 @@ def interpFile(filename: str, sample_per: float) -> Rvec:
         filename: Name of waveform file to read in.
         sample_per: New sample interval, in seconds.
 
+    Keyword Args:
+        cache: Passed through to ``loadWave()``.
+            Default: False
+
     Returns:
         A *NumPy* array containing the resampled waveform.
     """
 
-    impulse = loadWave(filename)
-    ts = impulse[0]
+    ts, vs = loadWave(filename, cache=cache)
     ts = ts - ts[0]
-    vs = impulse[1]
     tmax = ts[-1]
     # Build new impulse response, at new sampling period, using linear interpolation.
-    res = []
-    t = 0.0
-    i = 0
-    while t < tmax:
-        while ts[i] <= t:
-            i = i + 1
-        res.append(vs[i - 1] + (vs[i] - vs[i - 1]) * (t - ts[i - 1]) / (ts[i] - ts[i - 1]))
-        t = t + sample_per
-    return np.array(res)
+    # (The new time vector is accumulated, rather than multiplied out, to reproduce
+    # the sample count of the original iterative implementation exactly.)
+    t = np.cumsum(np.concatenate(([0.0], np.full(int(np.ceil(tmax / sample_per)) + 1, sample_per))))
+    return np.interp(t[t < tmax], ts, vs)
 
 
 _DEFAULT_ROW_SIZE = 128
+_DoublePtr = POINTER(c_double)
+
+
+def _readonly_view(buf) -> Rvec:
+    "Read-only *NumPy* view of a ``ctypes`` array of ``c_double``."
+    arr = np.ctypeslib.as_array(buf)
+    arr.flags.writeable = False
+    return arr
 
 
 class _InitData(TypedDict):
@@ -120,6 +165,19 @@ class _InitData(TypedDict):
     bit_time: c_double
 
 
+def _unload_library(dll: CDLL) -> None:
+    """
+    Unload a library loaded via ``CDLL``.
+
+    Notes:
+        1. None of the library's functions may be called afterward.
+    """
+    if sys.platform == "win32":
+        _ctypes.FreeLibrary(dll._handle)  # pylint: disable=protected-access
+    else:
+        _ctypes.dlclose(dll._handle)  # pylint: disable=protected-access
+
+
 class AMIModelInitializer:
     """
     Class containing the initialization data for an instance of ``AMIModel``.
@@ -203,20 +261,48 @@ class AMIModelInitializer:
             f"`ami_params`: {self.ami_params}",
             f"`info_params`: {self.info_params}"])
 
+    def __getstate__(self):
+        "Replace ctypes members with plain Python values, for pickling (e.g. - when sending to ``AMIModelPool``)."
+        state = self.__dict__.copy()
+        state["_init_data"] = {
+            **self._init_data,
+            "channel_response": self.channel_response_array.copy(),
+            "sample_interval": self.sample_interval,
+            "bit_time": self.bit_time,
+        }
+        return state
+
+    def __setstate__(self, state):
+        init_data = state["_init_data"]
+        init_data["channel_response"] = np.ctypeslib.as_ctypes(init_data["channel_response"])
+        init_data["sample_interval"] = c_double(init_data["sample_interval"])
+        init_data["bit_time"] = c_double(init_data["bit_time"])
+        self.__dict__.update(state)
+
     def _getChannelResponse(self):
-        return list(map(float, self._init_data["channel_response"]))
+        return self.channel_response_array.tolist()
 
     def _setChannelResponse(self, h):
         if isinstance(h, str) and Path(h).is_file():
             h = interpFile(h, self.sample_interval)
-        Vector = c_double * len(h)
-        self._init_data["channel_response"] = Vector(*h)
+        # The ctypes array shares memory with (and keeps alive) this private copy of `h`.
+        self._init_data["channel_response"] = np.ctypeslib.as_ctypes(np.array(h, dtype=np.float64))
         self.row_size = len(h)
 
+    @property
+    def channel_response_array(self) -> Rvec:
+        """
+        Read-only *NumPy* view of the channel impulse response to be passed to ``AMI_Init()``.
+
+        Notes:
+            1. Shares memory with the ``ctypes`` buffer handed to the model; no copy is made.
+        """
+        return _readonly_view(self._init_data["channel_response"])
+
     channel_response = property(
         _getChannelResponse,
         _setChannelResponse,
-        doc="Channel impulse response to be passed to AMI_Init(). May be a file name.",
+        doc="Channel impulse response to be passed to AMI_Init(), as a list. May be set to a file name.",
     )
 
     def _getRowSize(self):
@@ -258,6 +344,135 @@ class AMIModelInitializer:
     bit_time = property(_getBitTime, _setBitTime, doc="Link unit interval.")
 
 
+def sexpr(pname: str, pval: Any) -> str:
+    """
+    Create an S-expression from a parameter name/value pair, calling
+    recursively as needed to elaborate sub-parameter dictionaries.
+
+    Args:
+        pname: Parameter name.
+        pval: Parameter value.
+
+    Returns:
+        A string containing the S-expression constructed.
+    """
+    if isinstance(pval, str):
+        return f'({pname} "{pval}")'
+    if isinstance(pval, dict):
+        subs = []
+        for sname in pval:
+            subs.append(sexpr(sname, pval[sname]))
+        return f"({pname} {' '.join(subs)})"
+    return f"({pname} {pval})"
+
+
+# Shape of a (sub-)parameter dictionary: its parameter names, and (in the same order)
+# either the shape of each sub-parameter dictionary, or the type of each leaf value.
+AmiParamsShape: TypeAlias = tuple[tuple[str, ...], tuple[Any, ...]]
+
+
+def _flatten_ami_params(params: dict[str, Any], leaves: list[Any]) -> AmiParamsShape:
+    "Append the leaf values of ``params``, in order, to ``leaves``, and return its shape."
+    values = params.values()
+    kinds = tuple(map(type, values))
+    if not any(issubclass(kind, dict) for kind in set(kinds)):  # The common case, handled at C speed.
+        leaves.extend(values)
+        return tuple(params), kinds
+    subs: list[AmiParamsShape | type] = []
+    for value, kind in zip(values, kinds):
+        if isinstance(value, dict):
+            subs.append(_flatten_ami_params(value, leaves))
+        else:
+            subs.append(kind)
+            leaves.append(value)
+    return tuple(params), tuple(subs)
+
+
+class _AmiParamsTemplate:  # pylint: disable=too-few-public-methods
+    """
+    Compiled ``AMI_Init()`` parameter string, for ``ami_params`` dictionaries of a particular shape.
+
+    The text between the leaf values is rendered once, here;
+    ``render()`` then only needs to format those leaf values which differ from the previous call.
+    """
+
+    def __init__(self, root_name: Any, shape: AmiParamsShape):
+        literals: list[str] = []
+        kinds: list[type] = []
+        text = f"({root_name} "
+
+        def add(shape: AmiParamsShape, separator: str) -> None:
+            nonlocal text
+            for n, (name, kind) in enumerate(zip(*shape)):
+                if n:
+                    text += separator
+                if isinstance(kind, tuple):  # Sub-parameter dictionary.
+                    text += f"({name} "
+                    add(kind, " ")
+                    text += ")"
+                else:
+                    kinds.append(kind)
+                    is_str = issubclass(kind, str)
+                    literals.append(text + (f'({name} "' if is_str else f"({name} "))
+                    text = '")' if is_str else ")"
+
+        add(shape, "")  # Top level parameters are simply concatenated, while sub-parameters are space separated.
+        literals.append(text + ")")
+        pieces: list[str] = [literals[0]]
+        for literal in literals[1:]:
+            pieces.extend(["", literal])
+        self._last: tuple[Optional[list[Any]], list[str]] = (None, pieces)  # Previous leaf values and pieces.
+        # Can the leaf values be compared using `!=` (i.e. - not, e.g., arrays)?
+        self._comparable = all(issubclass(kind, (int, float, str)) for kind in kinds)
+
+    def render(self, leaves: list[Any]) -> str:
+        "Render the parameter string, for the given leaf values (whose types must match the template's shape)."
+        last_leaves, pieces = self._last
+        pieces = list(pieces)
+        if last_leaves is None or not self._comparable:
+            pieces[1::2] = [f"{value}" for value in leaves]
+        else:
+            for n in compress(range(len(leaves)), map(ne, leaves, last_leaves)):
+                pieces[2 * n + 1] = f"{leaves[n]}"
+        self._last = (leaves, pieces)  # A single assignment, so that concurrent renderers never see a mismatch.
+        return "".join(pieces)
+
+
+@lru_cache(maxsize=64)
+def _ami_params_template(root_name: Any, shape: AmiParamsShape) -> _AmiParamsTemplate:
+    return _AmiParamsTemplate(root_name, shape)
+
+
+@lru_cache(maxsize=256)
+def _encode_ami_params(root_name: Any, shape: AmiParamsShape, leaves: tuple[Any, ...]) -> bytes:
+    # Leaf types are part of `shape`; so, 1, 1.0, and True, which are equal and hash alike, never share an entry.
+    return _ami_params_template(root_name, shape).render(list(leaves)).encode("utf-8")
+
+
+def encode_ami_params(ami_params: dict[str, Any]) -> bytes:
+    """
+    Encode an ``ami_params`` dictionary as the ``AMI_Init()`` parameter string.
+
+    Args:
+        ami_params: The AMI parameter values, including the ``root_name``.
+
+    Returns:
+        The UTF-8 encoded parameter string, identical to that built by ``sexpr()``.
+
+    Notes:
+        1. Parameter strings are compiled into templates, once per dictionary shape,
+        and the encoded strings for recently seen parameter values are cached,
+        which makes repeated initialization during sweeps/optimization cheap, even for large parameter trees.
+    """
+    root_name = ami_params["root_name"]
+    leaves: list[Any] = []
+    shape = _flatten_ami_params({key: val for key, val in ami_params.items() if key != "root_name"}, leaves)
+    try:
+        return _encode_ami_params(root_name, shape, tuple(leaves))
+    except TypeError:  # Unhashable leaf values (e.g. - lists); render, without caching.
+        return _ami_params_template(root_name, shape).render(leaves).encode("utf-8")
+
+
 class AMIModel:  # pylint: disable=too-many-instance-attributes
     """
     Class defining the structure and behavior of an IBIS-AMI Model.
@@ -269,21 +484,75 @@ class AMIModel:  # pylint: disable=too-many-instance-attributes
 
     _getwave_step_response_out_params: Optional[list[str]] = None
     _info_params: Optional[dict[str, Any]] = None
+    _clock_times: Optional[Rvec] = None
+    _pending_channel: Any = None  # Channel response awaiting a deferred ``AMI_Init()`` (ctypes array).
 
-    def __init__(self, filename: str):
+    def __init__(
+        self, filename: str, private_copy: bool = False,
+        init_cache: Optional[bool | DiskCache] = None, instrument: Optional[bool] = None
+    ):
         """
         Load the dll and bind the 3 AMI functions.
 
         Args:
             filename: The DLL/SO file name.
 
+        Keyword Args:
+            private_copy: Load a private copy of the DLL/SO, made in a temporary directory, when True.
+                Default: False
+            init_cache: Cache of ``AMI_Init()`` results to use; may be:
+
+                - a ``DiskCache`` instance,
+                - True, to use the default cache location, or
+                - False, to disable caching.
+
+                Default: None (Means "Use the default cache if the ``PYIBISAMI_INIT_CACHE`` environment variable
+                is set to a non-empty value other than "0"; don't cache otherwise.")
+            instrument: Collect per call timing and throughput statistics, in ``stats``, when True.
+                Default: None (Means "Collect if the ``PYIBISAMI_INSTRUMENT`` environment variable
+                is set to a non-empty value other than "0".")
+
         Raises:
             OSError: If given file cannot be opened.
+
+        Notes:
+            1. The dynamic loader hands back the same library (and, therefore, the same global state)
+            each time a given file is loaded into a process.
+            So, several instances of one model can only run concurrently (e.g. - in a thread pool),
+            if each loads its own private copy.
+            (*ctypes* releases the GIL, for the duration of each call into the model.)
+
+            2. Only the DLL/SO itself is copied.
+            Models which locate auxiliary files relative to their own location may not work in this mode.
+
+            3. ``AMI_Init()`` results are cached under a key formed from: a hash of the DLL/SO contents,
+            the AMI parameter string, the channel response, and the remaining ``AMI_Init()`` arguments.
+            On a cache hit, the actual call to ``AMI_Init()`` is deferred until ``AMI_GetWave()`` is needed.
         """
 
         self._filename = filename
         self._ami_mem_handle = None
+        self._init_pending = False
+        if init_cache is None:
+            init_cache = os.environ.get(INIT_CACHE_ENV, "0") not in ("", "0")
+        if init_cache is True:
+            init_cache = DiskCache(default_cache_dir() / "ami_init")
+        self._init_cache: Optional[DiskCache] = init_cache or None
+        if instrument is None:
+            instrument = instrument_default()
+        self.stats: Optional[AMIModelStats] = AMIModelStats() if instrument else None
+        self._tmp_dir: Optional[str] = None
+        self._private_dll: Optional[CDLL] = None
+        if private_copy:
+            self._tmp_dir = tempfile.mkdtemp(prefix="pyibisami_")
+            try:
+                filename = shutil.copy2(filename, self._tmp_dir)
+            except OSError:
+                shutil.rmtree(self._tmp_dir, ignore_errors=True)
+                raise
         my_dll = CDLL(filename)
+        if private_copy:
+            self._private_dll = my_dll
         self._amiInit = my_dll.AMI_Init
         self._amiClose = my_dll.AMI_Close
         try:
@@ -299,9 +568,16 @@ class AMIModel:  # pylint: disable=too-many-instance-attributes
         function explicitly, and guards against memory leaks, during
         PyLab command prompt operation, by ensuring that ``AMI_Close()``
         gets called automagically when the model goes out of scope.
+
+        Also unloads and removes any private copy of the DLL/SO.
         """
         if self._ami_mem_handle:
             self._amiClose(self._ami_mem_handle)
+        if getattr(self, "_private_dll", None) is not None:
+            _unload_library(self._private_dll)
+            self._private_dll = None
+        if getattr(self, "_tmp_dir", None):
+            shutil.rmtree(self._tmp_dir, ignore_errors=True)
 
     def __str__(self):
         return "\n\t".join([
@@ -347,7 +623,9 @@ class AMIModel:  # pylint: disable=too-many-instance-attributes
         self._channel_response = (   # pylint: disable=attribute-defined-outside-init
             init_object._init_data["channel_response"]  # pylint: disable=protected-access
         )
-        self._initOut = cp.copy(self._channel_response)  # type: ignore  # pylint: disable=attribute-defined-outside-init
+        self._initOut = np.ctypeslib.as_ctypes(  # pylint: disable=attribute-defined-outside-init
+            np.array(self._channel_response, dtype=np.float64)
+        )
         self._row_size = init_object.row_size  # pylint: disable=attribute-defined-outside-init
         self._num_aggressors = init_object.num_aggressors  # pylint: disable=attribute-defined-outside-init
         self._sample_interval = c_double(init_object.sample_interval)  # pylint: disable=attribute-defined-outside-init
@@ -363,86 +641,118 @@ class AMIModel:  # pylint: disable=too-many-instance-attributes
             )
 
         # Construct the AMI parameters string.
-        def sexpr(pname: str, pval: Any) -> str:
-            """
-            Create an S-expression from a parameter name/value pair, calling
-            recursively as needed to elaborate sub-parameter dictionaries.
-
-            Args:
-                pname: Parameter name.
-                pval: Parameter value.
-
-            Returns:
-                A string containing the S-expression constructed.
-            """
-            if isinstance(pval, str):
-                return f'({pname} "{pval}")'
-            if isinstance(pval, dict):
-                subs = []
-                for sname in pval:
-                    subs.append(sexpr(sname, pval[sname]))
-                return f"({pname} {' '.join(subs)})"
-            return f"({pname} {pval})"
-
         root_name = init_object.ami_params['root_name']
         self._root_name = root_name  # pylint: disable=attribute-defined-outside-init
-        ami_params_in = f"({root_name} "
-        for item in list(init_object.ami_params.items()):
-            if item[0] != "root_name":
-                ami_params_in += sexpr(item[0], item[1])
-        ami_params_in += ")"
-        self._ami_params_in = ami_params_in.encode("utf-8")  # pylint: disable=attribute-defined-outside-init
+        self._ami_params_in = (  # pylint: disable=attribute-defined-outside-init
+            encode_ami_params(init_object.ami_params)
+        )
 
         # Set handle types.
         self._ami_params_out = c_char_p(b"")  # pylint: disable=attribute-defined-outside-init
         self._ami_mem_handle = c_char_p(None)  # type: ignore  # pylint: disable=attribute-defined-outside-init
         self._msg = c_char_p(b"")  # pylint: disable=attribute-defined-outside-init
 
-        # Call AMI_Init(), via our Python wrapper.
+        # Call AMI_Init(), unless its results are available from the cache.
+        self._init_pending = False  # pylint: disable=attribute-defined-outside-init
+        cached = None
+        if self._init_cache is not None:
+            init_key = make_key(
+                file_digest(self._filename),
+                self._ami_params_in,
+                bytes(self._channel_response),
+                f"{self._row_size} {self._num_aggressors} {self._sample_interval.value!r} {self._bit_time.value!r}",
+            )
+            cached = self._init_cache.get(init_key)
+        if cached is not None and len(cached["initOut"]) == len(self._initOut):
+            # `AMI_Init()` must still see the original channel response, when (if) it's eventually called.
+            self._pending_channel = np.ctypeslib.as_ctypes(np.ctypeslib.as_array(self._initOut).copy())
+            np.ctypeslib.as_array(self._initOut)[:] = cached["initOut"]
+            self._ami_params_out = c_char_p(  # pylint: disable=attribute-defined-outside-init
+                cached["ami_params_out"].tobytes())
+            self._msg = c_char_p(cached["msg"].tobytes())  # pylint: disable=attribute-defined-outside-init
+            self._init_pending = True  # pylint: disable=attribute-defined-outside-init
+        else:
+            self._ami_init(self._initOut, self._ami_params_out, self._msg)
+            if self._init_cache is not None:
+                self._init_cache.put(
+                    init_key,
+                    initOut=np.ctypeslib.as_array(self._initOut),
+                    ami_params_out=np.frombuffer(self._ami_params_out.value or b"", dtype=np.uint8),
+                    msg=np.frombuffer(self._msg.value or b"", dtype=np.uint8),
+                )
+
+        # Initialize attributes used by getWave().
+        bit_time = init_object.bit_time
+        sample_interval = init_object.sample_interval
+        # ToDo: Fix this. There isn't actually a requirement that `bit_time` be an integral multiple of `sample_interval`.
+        # And there may be an advantage to having it not be!
+        # if (bit_time % sample_interval) > (sample_interval / 100):
+        #     raise ValueError(
+        #         f"Bit time ({bit_time * 1e9: 6.3G} ns) must be an integral multiple of sample interval ({sample_interval * 1e9: 6.3G} ns)."
+        #     )
+        self._samps_per_bit = int(bit_time / sample_interval)  # pylint: disable=attribute-defined-outside-init
+        self._bits_per_call = (  # pylint: disable=attribute-defined-outside-init
+            init_object.row_size / self._samps_per_bit
+        )
+        self._getwave_step_response_out_params = None
+
+    def _ami_init(self, init_out: Any, ami_params_out: c_char_p, msg: c_char_p) -> None:
+        """
+        Call ``AMI_Init()``, via our Python wrapper, using the arguments prepared by ``initialize()``.
+
+        Args:
+            init_out: The ``ctypes`` array holding the channel response, which the model overwrites.
+            ami_params_out: Receives the output parameter string.
+            msg: Receives the model's message.
+        """
+        self._init_pending = False  # pylint: disable=attribute-defined-outside-init
+        t_start = perf_counter()
         try:
             self._amiInit(
-                byref(self._initOut),  # type: ignore
+                byref(init_out),
                 self._row_size,
                 self._num_aggressors,
                 self._sample_interval,
                 self._bit_time,
                 self._ami_params_in,  # Prevents model from mucking up our input parameter string.
-                byref(self._ami_params_out),
+                byref(ami_params_out),
                 byref(self._ami_mem_handle),  # type: ignore
-                byref(self._msg),
+                byref(msg),
             )
         except OSError as err:
             print("pyibisami.ami_model.AMIModel.initialize(): Call to AMI_Init() bombed:")
             print(err)
             print(f"AMI_Init() address = {self._amiInit}")
             print("Values sent into AMI_Init():")
-            print(f"&initOut = {byref(self._initOut)}")  # type: ignore
+            print(f"&initOut = {byref(init_out)}")
             print(f"row_size = {self._row_size}")
             print(f"num_aggressors = {self._num_aggressors}")
             print(f"sample_interval = {self._sample_interval}")
             print(f"bit_time = {self._bit_time}")
-            print(f"ami_params_in = {ami_params_in}")
-            print(f"&ami_params_out = {byref(self._ami_params_out)}")
+            print(f"ami_params_in = {self._ami_params_in!r}")
+            print(f"&ami_params_out = {byref(ami_params_out)}")
             print(f"&ami_mem_handle = {byref(self._ami_mem_handle)}")  # type: ignore
-            print(f"&msg = {byref(self._msg)}")
+            print(f"&msg = {byref(msg)}")
             raise
+        if self.stats is not None:
+            self.stats.record(
+                "AMI_Init", perf_counter() - t_start,
+                samples=self._row_size, nbytes=sizeof(init_out) + len(self._ami_params_in)
+            )
 
-        # Initialize attributes used by getWave().
-        bit_time = init_object.bit_time
-        sample_interval = init_object.sample_interval
-        # ToDo: Fix this. There isn't actually a requirement that `bit_time` be an integral multiple of `sample_interval`.
-        # And there may be an advantage to having it not be!
-        # if (bit_time % sample_interval) > (sample_interval / 100):
-        #     raise ValueError(
-        #         f"Bit time ({bit_time * 1e9: 6.3G} ns) must be an integral multiple of sample interval ({sample_interval * 1e9: 6.3G} ns)."
-        #     )
-        self._samps_per_bit = int(bit_time / sample_interval)  # pylint: disable=attribute-defined-outside-init
-        self._bits_per_call = (  # pylint: disable=attribute-defined-outside-init
-            init_object.row_size / self._samps_per_bit
-        )
-        self._getwave_step_response_out_params = None
+    def _deferred_ami_init(self) -> None:
+        """
+        Make the ``AMI_Init()`` call deferred by a cache hit in ``initialize()``.
 
-    def getWave(self, wave: Rvec, bits_per_call: int = 0) -> tuple[Rvec, Rvec, list[str]]:
+        The model is initialized on (a scratch copy of) the original channel response,
+        and its outputs are discarded, leaving the cached results in place.
+        """
+        channel, self._pending_channel = self._pending_channel, None
+        self._ami_init(channel, c_char_p(b""), c_char_p(b""))
+
+    def getWave(
+        self, wave: Rvec, bits_per_call: int = 0, out: Optional[Rvec] = None
+    ) -> tuple[Rvec, Rvec, list[str]]:
         """
         Performs time domain processing of input waveform, using the ``AMI_GetWave()`` function.
 
@@ -452,6 +762,12 @@ class AMIModel:  # pylint: disable=too-many-instance-attributes
         Keyword Args:
             bits_per_call: Number of bits to use, per call to ``AMI_GetWave()``.
                 Default: 0 (Means "Use existing value.")
+            out: Preallocated output buffer, which must be a writeable, C-contiguous,
+                ``float64`` *NumPy* array of the same length as ``wave``.
+                The model processes successive chunks of this buffer in place,
+                and the returned waveform and clock times are views.
+                Passing ``wave`` itself processes the input in place.
+                Default: None (Means "Allocate a new output array.")
 
         Returns:
             A tuple containing
@@ -460,53 +776,152 @@ class AMIModel:  # pylint: disable=too-many-instance-attributes
                 - the recovered slicer sampling instants, and
                 - the list of output parameter strings received from each call to ``AMI_GetWave()``.
 
+        Raises:
+            ValueError: If ``out`` is given, but unsuitable for use as an output buffer.
+
         Notes:
             1. The returned clock times are given in "pre-edge-aligned" fashion,
             which means their values are: sampling instant - ui/2.
+
+            2. No per-sample Python objects are created; the model is handed pointers
+            directly into the output buffer, one chunk at a time.
         """
 
+        t_start = perf_counter()
         if bits_per_call:
             self._bits_per_call = int(bits_per_call)  # pylint: disable=attribute-defined-outside-init
         bits_per_call = int(self._bits_per_call)
         samps_per_call = int(self._samps_per_bit * bits_per_call)
 
-        # Create the required C types.
-        Signal = c_double * samps_per_call
-        Clocks = c_double * (bits_per_call + 8)  # The "+8" is critical, to prevent access violations by the model. Value increased from +1 to +8 to avoid access violations for specific SERDES models.
-
-        idx = 0  # Holds the starting index of the next processing chunk.
-        _clock_times = Clocks(0.0)
-        wave_out: list[float] = []
-        clock_times: list[float] = []
-        params_out: list[str] = []
         input_len = len(wave)
-        while idx < input_len:
-            remaining_samps = input_len - idx
-            if remaining_samps < samps_per_call:
-                Signal = c_double * remaining_samps
-                tmp_wave = wave[idx:]
-            else:
-                tmp_wave = wave[idx: idx + samps_per_call]
-            _wave = Signal(*tmp_wave)
-            try:
-                self._amiGetWave(
-                    byref(_wave), len(_wave), byref(_clock_times),
-                    byref(self._ami_params_out), self._ami_mem_handle
-                )  # type: ignore
-            except OSError:
-                print(self)
-                print(f"byref(_wave): {byref(_wave)}")
-                print(f"len(_wave): {len(_wave)}")
-                print(f"byref(_clock_times): {byref(_clock_times)}")
-                print(f"byref(self._ami_params_out): {byref(self._ami_params_out)}")
-                print(f"self._ami_mem_handle: {self._ami_mem_handle}")
-                raise
-            wave_out.extend(_wave)
-            clock_times.extend(_clock_times)
+        if out is None:
+            wave_out = np.array(wave, dtype=np.float64)  # Fresh, C-contiguous copy.
+        else:
+            if not (isinstance(out, np.ndarray) and out.dtype == np.float64 and out.flags.c_contiguous and
+                    out.flags.writeable and len(out) == input_len):
+                raise ValueError(
+                    "`out` must be a writeable, C-contiguous, `float64` array of the same length as `wave`."
+                )
+            if out is not wave:
+                out[:] = wave
+            wave_out = out
+
+        # The "+8" is critical, to prevent access violations by the model.
+        # Value increased from +1 to +8 to avoid access violations for specific SERDES models.
+        n_calls = -(-input_len // samps_per_call)
+        clock_times = np.zeros(n_calls * bits_per_call + 8)
+        params_out: list[str] = []
+        for n, idx in enumerate(range(0, input_len, samps_per_call)):
+            self._call_getwave(wave_out[idx: idx + samps_per_call], clock_times[n * bits_per_call:])
             params_out.append(self.ami_params_out)
-            idx += len(_wave)
 
-        return np.array(wave_out), np.array(clock_times[: len(wave_out) // self._samps_per_bit]), params_out
+        self._clock_times = clock_times[: input_len // self._samps_per_bit]
+        if self.stats is not None:
+            self.stats.record(
+                "getWave", perf_counter() - t_start,
+                samples=input_len, nbytes=wave_out.nbytes + clock_times.nbytes, chunks=n_calls
+            )
+        return wave_out, self._clock_times, params_out
+
+    def iter_getwave(
+        self, source: Rvec | Iterable | str | Path, bits_per_call: int = 0
+    ) -> Iterator[tuple[Rvec, Rvec, str]]:
+        """
+        Streaming version of ``getWave()``, for input waveforms too long to hold in memory.
+
+        Args:
+            source: The input waveform, given as any of:
+
+                - a *NumPy* array, including a ``np.memmap``,
+                - the name of a ``.npy`` file, which will be memory-mapped, or
+                - any iterable of samples and/or chunks of samples (e.g. - a generator).
+
+        Keyword Args:
+            bits_per_call: Number of bits to use, per call to ``AMI_GetWave()``.
+                Default: 0 (Means "Use existing value.")
+
+        Yields:
+            For each call to ``AMI_GetWave()``, a tuple containing
+
+                - the processed chunk of the waveform,
+                - the recovered slicer sampling instants, for that chunk, and
+                - the output parameter string returned by that call.
+
+        Notes:
+            1. The input is re-chunked, so that every call to ``AMI_GetWave()``,
+            except possibly the last, receives exactly ``bits_per_call`` bits' worth of samples,
+            regardless of how ``source`` happens to be chunked.
+            Concatenating the yielded chunks therefore reproduces the output of ``getWave()``.
+
+            2. Memory use is bounded by the size of one call's worth of samples,
+            plus the size of the largest chunk delivered by ``source``.
+        """
+
+        if bits_per_call:
+            self._bits_per_call = int(bits_per_call)  # pylint: disable=attribute-defined-outside-init
+        bits_per_call = int(self._bits_per_call)
+        samps_per_bit = self._samps_per_bit
+        samps_per_call = int(samps_per_bit * bits_per_call)
+
+        samples = np.load(source, mmap_mode="r") if isinstance(source, (str, Path)) else source
+        chunks: Iterable
+        if isinstance(samples, np.ndarray):
+            chunks = (samples[idx: idx + samps_per_call] for idx in range(0, len(samples), samps_per_call))
+        else:
+            chunks = samples
+
+        wave = np.empty(samps_per_call)
+        clock_times = np.zeros(bits_per_call + 8)  # See `getWave()`, re: the "+8".
+        n_buf = 0
+
+        def process(nsamps: int) -> tuple[Rvec, Rvec, str]:
+            wave_out = wave[:nsamps].copy()
+            clock_times[:] = 0.0
+            self._call_getwave(wave_out, clock_times)
+            return wave_out, clock_times[: nsamps // samps_per_bit].copy(), self.ami_params_out
+
+        for chunk in chunks:
+            chunk = np.asarray(chunk, dtype=np.float64).ravel()
+            while len(chunk):
+                n = min(samps_per_call - n_buf, len(chunk))
+                wave[n_buf: n_buf + n] = chunk[:n]
+                chunk = chunk[n:]
+                n_buf += n
+                if n_buf == samps_per_call:
+                    yield process(n_buf)
+                    n_buf = 0
+        if n_buf:
+            yield process(n_buf)
+
+    def _call_getwave(self, wave: Rvec, clock_times: Rvec) -> None:
+        """
+        Process one chunk of waveform in place, via a single call to ``AMI_GetWave()``.
+
+        Args:
+            wave: C-contiguous ``float64`` chunk of waveform to be processed.
+            clock_times: C-contiguous ``float64`` buffer, for receiving the recovered clock times.
+        """
+        if self._init_pending:
+            self._deferred_ami_init()
+        t_start = perf_counter()
+        try:
+            self._amiGetWave(
+                wave.ctypes.data_as(_DoublePtr), len(wave), clock_times.ctypes.data_as(_DoublePtr),
+                byref(self._ami_params_out), self._ami_mem_handle
+            )  # type: ignore
+        except OSError:
+            print(self)
+            print(f"wave: {wave.ctypes.data_as(_DoublePtr)}")
+            print(f"len(wave): {len(wave)}")
+            print(f"clock_times: {clock_times.ctypes.data_as(_DoublePtr)}")
+            print(f"byref(self._ami_params_out): {byref(self._ami_params_out)}")
+            print(f"self._ami_mem_handle: {self._ami_mem_handle}")
+            raise
+        if self.stats is not None:
+            self.stats.record(
+                "AMI_GetWave", perf_counter() - t_start,
+                samples=len(wave), nbytes=wave.nbytes + clock_times.nbytes, chunks=1
+            )
 
     def get_responses(  # pylint: disable=too-many-locals
         self,
@@ -556,6 +971,7 @@ class AMIModel:  # pylint: disable=too-many-instance-attributes
             2. Implement `ignore_bits`.
         """
 
+        t_start = perf_counter()
         rslt: AmiModelResponses = {}
 
         # Capture needed parameter definitions.
@@ -567,8 +983,8 @@ class AMIModel:  # pylint: disable=too-many-instance-attributes
             ignore_bits = info_params["Ignore_Bits"].pvalue
 
         # Capture/convert instance variables.
-        chnl_imp = np.array(self.channel_response[:self.row_size]) * ts   # input (a.k.a. - "channel") impulse response (V/sample)
-        out_imp = np.array(self.initOut[:self.row_size]) * ts             # output impulse response (V/sample)
+        chnl_imp = self.channel_response_array[:self.row_size] * ts   # input (a.k.a. - "channel") impulse response (V/sample)
+        out_imp = self.initOut_array[:self.row_size] * ts             # output impulse response (V/sample)
 
         # Calculate some needed intermediate values.
         nspui = int(ui / ts)            # samps per UI
@@ -590,7 +1006,7 @@ class AMIModel:  # pylint: disable=too-many-instance-attributes
             h_init = np.roll(out_imp, pad_samps)
             s_init = np.cumsum(h_init)                 # Step response.
             p_init = s_init - np.pad(s_init[:-nspui], (nspui, 0), mode='constant', constant_values=0)
-            H_init = np.fft.rfft(self.initOut)
+            H_init = np.fft.rfft(self.initOut_array)
             H_init *= s_init[-1] / np.abs(H_init[0])   # Normalize for proper d.c.
             rslt[OUT_RESP_INIT] = (t, h_init, s_init, p_init, f, H_init)
 
@@ -609,6 +1025,7 @@ class AMIModel:  # pylint: disable=too-many-instance-attributes
             ).repeat(nspui) - 0.5   # Apply oversampling.
             wave_out, _, _ = self.getWave(u, bits_per_call=bits_per_call)
             if debug:
+                from matplotlib import pyplot as plt  # pylint: disable=import-outside-toplevel
                 plt.plot(wave_out)
                 plt.show()
 
@@ -616,9 +1033,10 @@ class AMIModel:  # pylint: disable=too-many-instance-attributes
             rslt[IMP_RESP_GETW] = np.diff(wave_out[(ignore_bits + max_run_length) * nspui:])
 
             # Get step response of channel + model.
-            wave_in = np.convolve(u, chnl_imp)[:len(u)]
+            wave_in = convolve(u, chnl_imp)[:len(u)]
             wave_out, _, self._getwave_step_response_out_params = self.getWave(wave_in, bits_per_call=bits_per_call)
             if debug:
+                from matplotlib import pyplot as plt  # pylint: disable=import-outside-toplevel
                 plt.plot(wave_out)
                 plt.show()
             s_getw = wave_out[ignore_bits * nspui:][:len(t)] + 0.5
@@ -635,6 +1053,8 @@ class AMIModel:  # pylint: disable=too-many-instance-attributes
             H_getw = np.fft.rfft(h_getw)
             rslt[OUT_RESP_GETW] = (t, h_getw, s_getw, p_getw, f, H_getw)
 
+        if self.stats is not None:
+            self.stats.record("get_responses", perf_counter() - t_start)
         return rslt
 
     @property
@@ -648,14 +1068,24 @@ class AMIModel:  # pylint: disable=too-many-instance-attributes
         return self._amiGetWave is not None
 
     def _getInitOut(self):
-        return list(map(float, self._initOut))
+        return self.initOut_array.tolist()
 
-    initOut = property(_getInitOut, doc="Channel response convolved with model impulse response.")
+    initOut = property(_getInitOut, doc="Channel response convolved with model impulse response, as a list.")
+
+    @property
+    def initOut_array(self) -> Rvec:
+        """Read-only *NumPy* view of the channel response convolved with model impulse response."""
+        return _readonly_view(self._initOut)
 
     def _getChannelResponse(self):
-        return list(map(float, self._channel_response))
+        return self.channel_response_array.tolist()
 
-    channel_response = property(_getChannelResponse, doc="Channel response passed to initialize().")
+    channel_response = property(_getChannelResponse, doc="Channel response passed to initialize(), as a list.")
+
+    @property
+    def channel_response_array(self) -> Rvec:
+        """Read-only *NumPy* view of the channel response passed to initialize()."""
+        return _readonly_view(self._channel_response)
 
     def _getRowSize(self):
         return self._row_size
@@ -700,7 +1130,7 @@ class AMIModel:  # pylint: disable=too-many-instance-attributes
     msg = property(_getMsg, doc="Message returned by most recent call to AMI_Init() or AMI_GetWave().")
 
     def _getClockTimes(self):
-        return self.clock_times
+        return self._clock_times
 
     clock_times = property(_getClockTimes, doc="Clock times returned by most recent call to getWave().")
 
@@ -10,20 +10,24 @@ Copyright (c) 2019 David Banas; all rights reserved World wide.
 from __future__     import annotations
 from ctypes         import c_double
 from dataclasses    import dataclass
+import os
 import re
-from typing         import Any, NewType, Optional, TypeAlias
-from collections.abc import Callable
+from typing         import TYPE_CHECKING, Any, NewType, Optional, TypeAlias
+from collections.abc import Callable, Iterable, Mapping
 
 import numpy as np
 from numpy.typing import NDArray
 from parsec import ParseError, generate, many, regex, string
-from traits.api import Bool, Enum, HasTraits, Range, Trait, TraitType
-from traitsui.api import Group, HGroup, Item, VGroup, View
-from traitsui.menu import ModalButtons
+from traits.api import Bool, Enum, HasTraits, Range, Trait, TraitError, TraitType
 
 from .model                     import AMIModelInitializer
 from .parameter                 import AmiParamTuner, AMIParamError, AMIParameter
 from .reserved_parameter_names  import AmiReservedParameterName, RESERVED_PARAM_NAMES
+from ..                         import __version__
+from ..util.cache               import DiskCache, make_key, parse_cache
+
+if TYPE_CHECKING:
+    from traitsui.api import Group, Item  # Imported where they're used, since `traitsui` is slow to import.
 
 # New types and aliases.
 # Parameters  = NewType('Parameters',  dict[str, AMIParameter] | dict[str, 'Parameters'])
@@ -33,6 +37,7 @@ ParamName  = NewType("ParamName", str)
 Parameters:  TypeAlias = dict[ParamName, "'AMIParameter' | 'Parameters'"]
 ParamValue:  TypeAlias = int | float | str | list["ParamValue"]
 ParamValues: TypeAlias = dict[ParamName, "'ParamValue'   | 'ParamValues'"]
+ParamPath:   TypeAlias = tuple[str, ...]  # Node names, starting with "Reserved_Parameters" or "Model_Specific".
 
 # AMI parameter tree structure.
 AmiName = NewType("AmiName", str)
@@ -62,9 +67,9 @@ ReservedParamDict: TypeAlias = dict[AmiReservedParameterName, AMIParameter]
 ModelSpecificDict: TypeAlias = dict[ParamName, "'AMIParameter' | 'ModelSpecificDict'"]
 
 __all__ = [  # ruff: ignore=RUF022
-    "ParamName", "ParamValue", "Parameters", "ParamValues",
+    "ParamName", "ParamValue", "Parameters", "ParamValues", "ParamPath", "ParamVectorMap",
     "AmiName", "AmiAtom", "AmiNode", "AmiNodeParser", "AmiParser",
-    "ami_parse", "AMIParamConfigurator"]
+    "ami_parse", "ami_parse_fast", "ami_parse_parsec", "AMIParamConfigurator"]
 
 #####
 # AMI parameter configurator.
@@ -102,12 +107,20 @@ class AMIParamConfigurator(HasTraits):
 
     Any errors or warnings encountered while parsing are available, in
     the ``ami_parsing_errors`` property.
+
+    Parameter values are held in a plain dictionary; the traits and GUI items
+    are only built the first time the GUI is needed, which keeps batch (i.e. - headless)
+    usage fast, even for models with hundreds of parameters.
     """
 
-    def __init__(self, ami_file_contents_str: str) -> None:
+    def __init__(self, ami_file_contents_str: str, cache: Optional[bool | DiskCache] = None) -> None:
         """
         Args:
             ami_file_contents_str: The unprocessed contents of the AMI file, as a single string.
+
+        Keyword Args:
+            cache: Cache of parse results (see ``parse_ami_file_contents()``).
+                Default: None (Means "Use the default cache, if the ``PYIBISAMI_PARSE_CACHE`` env. variable is set.")
         """
 
         # Super-class initialization is ABSOLUTELY NECESSARY, in order
@@ -120,22 +133,25 @@ class AMIParamConfigurator(HasTraits):
          root_name,
          description,
          reserved_param_dict,
-         model_specific_dict) = parse_ami_file_contents(ami_file_contents_str)
+         model_specific_dict) = parse_ami_file_contents(ami_file_contents_str, cache=cache)
         if errors:
             err_msgs = ["AMI parsing errors:"]
             err_msgs.extend(errors)
             raise RuntimeError("\n\t".join(err_msgs))
         if not reserved_param_dict:
             raise ValueError("No 'Reserved_Parameters' section found!")
-        gui_items, new_traits = make_gui(model_specific_dict)
-        trait_names = []
-        for trait in new_traits:
-            self.add_trait(trait[0], trait[1])
-            trait_names.append(trait[0])
-        self._param_trait_names = trait_names
+        # Parameter values are kept in a plain dictionary, keyed by fully hierarchical trait name;
+        # the corresponding traits and GUI items are only built if the GUI is actually used.
+        self._param_values: dict[str, Any] = param_values(model_specific_dict)
+        self._content: Optional[Group] = None
+        self._mapped_traits: dict[str, dict[str, Any]] = {}
+        # Flat index, from full parameter path to parameter and trait name (None, if not an *In*/*InOut* parameter).
+        self._param_index: dict[ParamPath, tuple[AMIParameter, Optional[str]]] = {
+            **_index_params(reserved_param_dict, ("Reserved_Parameters",)),
+            **_index_params(model_specific_dict, ("Model_Specific",), self._param_values),
+        }
         self._root_name = root_name
         self._ami_parsing_errors = errors + warnings
-        self._content = gui_items
         self._reserved_param_dict = reserved_param_dict
         self._model_specific_dict = model_specific_dict
         self._description = description
@@ -149,8 +165,48 @@ class AMIParamConfigurator(HasTraits):
         # self.configure_traits(kind='modal')  # Waiting for Enthought/Traits PR1841 to be accepted.
         self.configure_traits()
 
+    def _build_gui(self) -> None:
+        """
+        Create the parameter traits and GUI items, initialized from the current parameter values,
+        and keep the parameter values in sync with subsequent (i.e. - user initiated) trait changes.
+        """
+        if self._content is not None:
+            return
+        gui_items, new_traits = make_gui(self._model_specific_dict)
+        for tname, trait in new_traits:
+            self.add_trait(tname, trait)
+            mapping = getattr(self.trait(tname).handler, "map", None)
+            if mapping:
+                self._mapped_traits[tname] = mapping
+            self._push_param_value(tname)
+        self.on_trait_change(self._param_trait_changed, list(self._param_values))
+        self._content = gui_items
+
+    def _push_param_value(self, tname: str) -> None:
+        "Copy a parameter value into its trait."
+        value = self._param_values[tname]
+        mapping = self._mapped_traits.get(tname)
+        try:
+            if mapping is None:
+                setattr(self, tname, value)
+                return
+            for key, mapped_value in mapping.items():
+                if mapped_value == value:
+                    setattr(self, tname, key)
+                    return
+        except TraitError:
+            pass
+        setattr(self, f"{tname}_", value)  # Bypass validation, as was always done for sweeps.
+
+    def _param_trait_changed(self, _obj, tname: str, new: Any) -> None:
+        "Copy a (user initiated) trait change into the parameter values."
+        self._param_values[tname] = getattr(self, tname + "_") if tname in self._mapped_traits else new
+
     def default_traits_view(self):
         "Default Traits/UI view definition."
+        from traitsui.api import ModalButtons, View  # pylint: disable=import-outside-toplevel
+
+        self._build_gui()
         view = View(
             resizable=False,
             buttons=ModalButtons,
@@ -159,22 +215,37 @@ class AMIParamConfigurator(HasTraits):
         view.set_content(self._content)
         return view
 
+    def _lookup_param(self, branch_names: ParamPath | list[str]) -> tuple[AMIParameter, Optional[str]]:
+        """
+        Find a parameter, and its trait name, via the flat parameter index.
+
+        Raises:
+            ValueError: If there is no node at ``branch_names``.
+            TypeError: If the node at ``branch_names`` is not a parameter (i.e. - is a branch).
+        """
+        try:
+            return self._param_index[tuple(branch_names)]
+        except KeyError:
+            pass
+        # Not found; walk the tree, in order to report exactly why.
+        param_dict: Any = self.ami_param_defs
+        for branch_name in branch_names:
+            if not isinstance(param_dict, dict) or branch_name not in param_dict:
+                keys = param_dict.keys() if isinstance(param_dict, dict) else []
+                raise ValueError(
+                    f"Failed parameter tree search looking for: {branch_name}; available keys: {keys}"
+                )
+            param_dict = param_dict[branch_name]
+        raise TypeError(f"{param_dict} is not of type: AMIParameter!")
+
     def fetch_param(self, branch_names):
         """Returns the parameter found by traversing 'branch_names' or None if
         not found.
 
         Note: 'branch_names' should *not* begin with 'root_name'.
         """
-        param_dict = self.ami_param_defs
-        while branch_names:
-            branch_name = branch_names.pop(0)
-            if branch_name in param_dict:
-                param_dict = param_dict[branch_name]
-            else:
-                return None
-        if isinstance(param_dict, AMIParameter):
-            return param_dict
-        return None
+        entry = self._param_index.get(tuple(branch_names))
+        return entry[0] if entry else None
 
     def fetch_param_val(self, branch_names):
         """Returns the value of the parameter found by traversing
@@ -200,54 +271,77 @@ class AMIParamConfigurator(HasTraits):
             branch_names: A sequence of node names, used to traverse the parameter tree.
             new_val: The value to assign to the target parameter.
 
+        Raises:
+            ValueError: If there is no node at ``branch_names``.
+            TypeError: If the node at ``branch_names`` is not a parameter.
+
         Notes:
             1. ``branch_names`` should *not* begin with <root_name>.
             2. Be careful! There is no checking done here!
         """
+        param, tname = self._lookup_param(branch_names)
+        new_val = coerce_param_val(param, new_val)
+        # `pvalue`, for 'List' format, holds the list of *legal* values, not the
+        # current one (that lives in `_param_values`) -- leave it alone, to avoid corrupting it.
+        if param.pformat != "List":
+            param.pvalue = new_val
+        if tname is not None:
+            self._param_values[tname] = new_val
+            if self._content is not None:
+                self._push_param_value(tname)
+
+    def get_many(self, paths: Iterable[ParamPath | list[str]]) -> list[Any]:
+        """
+        Current values of several parameters.
 
-        param_dict = self.ami_param_defs
-        tname_parts: list[str] = []  # Fully hierarchical trait name, minus the root key.
-        root_key: Optional[str] = None
-        while branch_names:
-            branch_name = branch_names.pop(0)
-            if root_key is None:
-                root_key = branch_name  # "Reserved_Parameters" or "Model_Specific"; not part of the trait name.
-            else:
-                tname_parts.append(branch_name)
-            if branch_name in param_dict:
-                param_dict = param_dict[branch_name]  # type: ignore
-            else:
-                raise ValueError(
-                    f"Failed parameter tree search looking for: {branch_name}; available keys: {param_dict.keys()}"
-                )
-        if isinstance(param_dict, AMIParameter):
-            # Coerce to the parameter's declared type. Notably: a `Bool` trait rejects a
-            # float outright, and a vendor's AMI_Init() parser may choke on "1.0" where an
-            # Integer-typed value (e.g. a List-format mode selector) is expected.
-            if param_dict.ptype == "Boolean":
-                if not isinstance(new_val, bool):
-                    if isinstance(new_val, str):
-                        match new_val:
-                            case "FALSE" | "False" | "false":
-                                new_val = False
-                            case _:
-                                new_val = bool(new_val)
-                    else:
-                        new_val = bool(new_val)
-            elif param_dict.ptype in ("Integer", "Tap"):
-                new_val = int(new_val)
-            # `pvalue`, for 'List' format, holds the list of *legal* values, not the
-            # current one (that lives on the Trait) -- leave it alone, to avoid corrupting it.
-            if param_dict.pformat != "List":
-                param_dict.pvalue = new_val
-            tname = "_".join(tname_parts)
-            if tname:
-                try:
-                    self.trait_set(**{f"{tname}_": new_val})
-                except Exception:  # pylint: disable=broad-exception-caught
-                    self.trait_set(**{tname: new_val})
-        else:
-            raise TypeError(f"{param_dict} is not of type: AMIParameter!")
+        Args:
+            paths: Parameter paths, as for ``fetch_param()``.
+
+        Returns:
+            One value per path: the value to be sent to the model, for *Model Specific* *In*/*InOut* parameters
+            (which, unlike ``fetch_param_val()``, is the selected value, for 'List' format parameters);
+            ``pvalue`` otherwise.
+
+        Raises:
+            ValueError: If there is no node at some path.
+            TypeError: If the node at some path is not a parameter.
+        """
+        values = []
+        for path in paths:
+            param, tname = self._lookup_param(path)
+            values.append(self._param_values[tname] if tname is not None else param.pvalue)
+        return values
+
+    def set_many(self, values: Mapping[ParamPath, Any] | Iterable[tuple[ParamPath | list[str], Any]]) -> None:
+        """
+        Set the values of several parameters.
+
+        Args:
+            values: New parameter values, keyed by parameter path, either as a mapping or as a sequence of pairs.
+                (Paths are as for ``fetch_param()``, and are not modified.)
+
+        Raises:
+            ValueError: If there is no node at some path.
+            TypeError: If the node at some path is not a parameter.
+
+        Notes:
+            1. Values are coerced to their parameters' declared types (see ``set_param_val()``).
+        """
+        items = values.items() if isinstance(values, Mapping) else values
+        for path, new_val in items:
+            self.set_param_val(path, new_val)  # type: ignore
+
+    def param_vector_map(self, paths: Iterable[ParamPath | list[str]]) -> ParamVectorMap:
+        """
+        Compile a mapping between parameter vectors (e.g. - an optimizer's) and ``AMIModelInitializer`` parameters.
+
+        Args:
+            paths: Paths to the *Model Specific* *In*/*InOut* parameters making up the vector, in order.
+
+        Returns:
+            The compiled mapping, whose fixed (i.e. - not in the vector) parameter values are the current ones.
+        """
+        return ParamVectorMap(self, paths)
 
     @property
     def tunable_params(self) -> list[tuple[list[str], AMIParameter]]:
@@ -288,12 +382,8 @@ class AMIParamConfigurator(HasTraits):
             else:  # List-format Integer "mode selector" (contiguous legal values).
                 vals = [float(v) for v in param.pvalue]
                 pmin, pmax, step, is_int = min(vals), max(vals), 1.0, True
-                # `pvalue`, for 'List' format, is the list of *legal* values, not the
-                # current one -- that lives on the Trait `make_gui_items()` registered.
-                try:
-                    value = float(self.trait_get(tname + "_")[tname + "_"])
-                except Exception:  # pylint: disable=broad-exception-caught
-                    value = float(self.trait_get(tname)[tname])
+                # `pvalue`, for 'List' format, is the list of *legal* values, not the current one.
+                value = float(self._param_values[tname])
             tuners.append(AmiParamTuner(
                 name=tname,
                 branch_names=branch_names,
@@ -369,14 +459,8 @@ class AMIParamConfigurator(HasTraits):
         tname = prefix + pname     # This is the fully hierarchical trait name, used by the Traits/UI machinery.
         param = params[pname]
         if isinstance(param, AMIParameter):
-            if tname in self._param_trait_names:  # If model specific and of type In or InOut...
-                # See the docs on the *HasTraits* class, if this is confusing.
-                # Querry for a mapped trait, first, by trying to get '<trait_name>_'. (Note the underscore.)
-                try:
-                    res[pname] = self.trait_get(tname + "_")[tname + "_"]
-                # If we get an exception, we have an ordinary (i.e. - not mapped) trait.
-                except Exception:  # pylint: disable=broad-exception-caught
-                    res[pname] = self.trait_get(tname)[tname]
+            if tname in self._param_values:  # If model specific and of type In or InOut...
+                res[pname] = self._param_values[tname]
         elif isinstance(param, dict):  # We received a dictionary of subparameters, in 'param'.
             subs: ParamValues = {}
             for sname in param:
@@ -426,6 +510,142 @@ class AMIParamConfigurator(HasTraits):
         return initializer
 
 
+class ParamVectorMap:
+    """
+    Compiled mapping between a vector of parameter values and the (nested) ``ami_params`` dictionary,
+    expected by the ``AMIModelInitializer`` constructor.
+
+    Intended for optimizers, which work with flat *NumPy* vectors and need a fresh ``ami_params`` dictionary
+    per cost function evaluation; the parameter tree is walked once, here, rather than on every evaluation.
+
+    Example::
+
+        vmap = pcfg.param_vector_map([("Model_Specific", "tx_tap_np1"), ("Model_Specific", "tx_tap_nm1")])
+        x0 = vmap.to_vector()
+        initializer = AMIModelInitializer(vmap.to_ami_params(x0), ...)
+    """
+
+    def __init__(self, pcfg: AMIParamConfigurator, paths: Iterable[ParamPath | list[str]]):
+        """
+        Args:
+            pcfg: The configurator, from which the parameter definitions and the fixed parameter values are taken.
+            paths: Paths to the *Model Specific* *In*/*InOut* parameters making up the vector, in order.
+
+        Raises:
+            ValueError: If some path is not that of a *Model Specific* *In*/*InOut* parameter.
+        """
+        self.paths: list[ParamPath] = [tuple(path) for path in paths]
+        self._template: ParamValues = pcfg.input_ami_params
+        # Branches of the template, in pre-order, as (parent branch index, key) pairs; branch 0 is the root.
+        self._branches: list[tuple[int, str]] = []
+        branch_ixs: dict[ParamPath, int] = {(): 0}
+
+        def walk(values: ParamValues, path: ParamPath) -> None:
+            for key, value in values.items():
+                if isinstance(value, dict):
+                    self._branches.append((branch_ixs[path], key))
+                    branch_ixs[path + (key,)] = len(self._branches)
+                    walk(value, path + (key,))
+
+        walk(self._template, ())
+        # One (branch index, key, parameter) slot per vector element.
+        self._slots: list[tuple[int, str, AMIParameter]] = []
+        for path in self.paths:
+            param, tname = pcfg._lookup_param(path)  # pylint: disable=protected-access
+            if path[0] != "Model_Specific" or tname is None:
+                raise ValueError(f"{path} is not a Model_Specific parameter of usage In or InOut!")
+            self._slots.append((branch_ixs[path[1:-1]], path[-1], param))
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def to_ami_params(self, vector: Iterable[float]) -> ParamValues:
+        """
+        Build an ``ami_params`` dictionary from a parameter vector.
+
+        Args:
+            vector: Parameter values, in the order of ``paths``.
+                (Values are coerced to their parameters' declared types, as by ``set_param_val()``.)
+
+        Returns:
+            A new dictionary, sharing nothing mutable with those returned previously.
+        """
+        branches: list[dict] = [dict(self._template)]
+        for parent, key in self._branches:
+            child = dict(branches[parent][key])
+            branches[parent][key] = child
+            branches.append(child)
+        for (branch, key, param), value in zip(self._slots, vector, strict=True):
+            branches[branch][key] = coerce_param_val(param, value)
+        return branches[0]
+
+    def to_vector(self, ami_params: Optional[ParamValues] = None) -> NDArray[np.float64]:
+        """
+        Extract a parameter vector from an ``ami_params`` dictionary.
+
+        Keyword Args:
+            ami_params: The dictionary.
+                Default: None (Means "Use the parameter values in effect when this mapping was compiled.")
+        """
+        if ami_params is None:
+            ami_params = self._template
+        vector = np.empty(len(self._slots))
+        for n, path in enumerate(self.paths):
+            values: Any = ami_params
+            for name in path[1:]:
+                values = values[name]
+            vector[n] = float(values)
+        return vector
+
+
+def coerce_param_val(param: AMIParameter, new_val: Any) -> Any:
+    """
+    Coerce a new parameter value to the parameter's declared type.
+
+    Notably: a `Bool` trait rejects a float outright, and a vendor's AMI_Init() parser may choke on "1.0"
+    where an Integer-typed value (e.g. a List-format mode selector) is expected.
+    """
+    if param.ptype == "Boolean":
+        if isinstance(new_val, bool):
+            return new_val
+        if isinstance(new_val, str):
+            match new_val:
+                case "FALSE" | "False" | "false":
+                    return False
+        return bool(new_val)
+    if param.ptype in ("Integer", "Tap"):
+        return int(new_val)
+    return new_val
+
+
+def _index_params(
+    params: Mapping[Any, Any], path: ParamPath, tnames: Optional[Mapping[str, Any]] = None
+) -> dict[ParamPath, tuple[AMIParameter, Optional[str]]]:
+    """
+    Flatten a parameter (sub)tree.
+
+    Args:
+        params: The (sub)dictionary of AMI parameters (i.e. - a ``Parameters`` or ``ReservedParamDict``).
+        path: The path to ``params``.
+
+    Keyword Args:
+        tnames: The trait names in use (see ``param_values()``).
+            Default: None (Means "No parameter in this tree has a trait.")
+
+    Returns:
+        Dictionary, keyed by full parameter path, of (parameter, trait name) pairs.
+        (The trait name is None for parameters without traits.)
+    """
+    index: dict[ParamPath, tuple[AMIParameter, Optional[str]]] = {}
+    for pname, param in params.items():
+        if isinstance(param, AMIParameter):
+            tname = "_".join(path[1:] + (pname,))
+            index[path + (pname,)] = (param, tname if tnames is not None and tname in tnames else None)
+        elif isinstance(param, dict):  # Subparameter branch.
+            index.update(_index_params(param, path + (pname,), tnames))
+    return index
+
+
 def _is_sweepable(param: AMIParameter) -> bool:
     "See `AMIParamConfigurator.tunable_params` for the exact criteria."
     if param.pusage not in ("In", "InOut"):
@@ -535,7 +755,82 @@ def root():
 
 expr = atom | node
 ami = ignore >> root
-ami_parse: AmiParser = ami.parse
+ami_parse_parsec: AmiParser = ami.parse
+
+# Hand-written, single pass, equivalent of the `parsec` grammar above.
+# Each token regex below is the concatenation of the corresponding `parsec` regex(es),
+# in the same order of preference, and the trailing `ignore` consumed by `lexeme()`.
+# (`true`/`false` are omitted, because `symbol` always matches "True"/"False" first.)
+_IGNORE_RE = r"(?:\s+|\|.*)*"
+_fast_ignore = re.compile(_IGNORE_RE)
+_fast_lparen = re.compile(r"\(" + _IGNORE_RE)
+_fast_rparen = re.compile(r"\)" + _IGNORE_RE)
+_fast_node_name = re.compile(rf"([-+]?[0-9]+){_IGNORE_RE}|([0-9a-zA-Z_][^\s()]*){_IGNORE_RE}")
+_fast_atom = re.compile(
+    rf'([-+]?[0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?|[0-9a-zA-Z_][^\s()]*|"[^"]*"){_IGNORE_RE}'
+)
+
+
+def ami_parse_fast(text: str) -> tuple[AmiName, list[AmiNode]]:
+    """
+    Parse an AMI S-expression (i.e. - the contents of a ``*.ami`` file, or an ``AMI_GetWave()`` output string).
+
+    Produces exactly the same result as ``ami_parse_parsec()``, in a single pass over the text,
+    using an explicit stack instead of parser combinators.
+
+    Args:
+        text: The S-expression to parse.
+
+    Returns:
+        A pair containing the root name and the list of its child nodes,
+        each of which is, recursively, a (name, values) pair.
+
+    Raises:
+        ParseError: If ``text`` is not a valid AMI S-expression.
+    """
+
+    def open_node(pos: int) -> tuple[str, int]:
+        "Consume an opening parenthesis and the node name following it."
+        lparen = _fast_lparen.match(text, pos)
+        if lparen is None:
+            raise ParseError("(", text, pos)
+        name = _fast_node_name.match(text, lparen.end())
+        if name is None:
+            raise ParseError("AMI node name", text, lparen.end())
+        tap, label = name.groups()
+        return (int2tap(tap) if tap is not None else label), name.end()
+
+    leading = _fast_ignore.match(text)  # Always matches, if only the empty string.
+    label, pos = open_node(leading.end() if leading is not None else 0)
+    values: list = []
+    stack: list[tuple[str, list]] = []
+    while True:
+        char = text[pos: pos + 1]
+        if char == ")":
+            rparen = _fast_rparen.match(text, pos)  # Can't fail, given `char`.
+            pos = rparen.end() if rparen is not None else pos + 1
+            if not stack:
+                return (AmiName(label), values)
+            child = (label, values)
+            label, values = stack.pop()
+            values.append(child)
+        elif char == "(":
+            stack.append((label, values))
+            label, pos = open_node(pos)
+            values = []
+        elif not stack:  # Atoms may not exist at the root level.
+            raise ParseError("AMI node or ')'", text, pos)
+        else:
+            tok = _fast_atom.match(text, pos)
+            if tok is None:
+                raise ParseError("AMI atom, node, or ')'", text, pos)
+            values.append(tok.group(1))
+            pos = tok.end()
+
+
+# Set `PYIBISAMI_AMI_PARSER=parsec` to fall back to the original, combinator based, parser.
+AMI_PARSER_ENV = "PYIBISAMI_AMI_PARSER"
+ami_parse: AmiParser = ami_parse_parsec if os.environ.get(AMI_PARSER_ENV) == "parsec" else ami_parse_fast
 
 
 def proc_branch(branch) -> tuple[str, dict[str, Any]]:
@@ -613,8 +908,9 @@ def proc_branch(branch) -> tuple[str, dict[str, Any]]:
     return results
 
 
-def parse_ami_file_contents(  # pylint: disable=too-many-locals,too-many-branches
-    file_contents: str
+def parse_ami_file_contents(
+    file_contents: str,
+    cache: Optional[bool | DiskCache] = None,
 ) -> tuple[list[str], list[str], AmiRootName, str, ReservedParamDict, ModelSpecificDict]:
     """
     Parse the contents of an IBIS-AMI *parameter definition* (i.e. - `*.ami`) file.
@@ -622,6 +918,10 @@ def parse_ami_file_contents(  # pylint: disable=too-many-locals,too-many-branche
     Args:
         file_contents: The contents of the file, as a single string.
 
+    Keyword Args:
+        cache: Cache of parse results, keyed by file contents and package version (see ``util.cache.parse_cache()``).
+            Default: None (Means "Use the default cache, if the ``PYIBISAMI_PARSE_CACHE`` env. variable is set.")
+
     Example:
         ::
 
@@ -665,6 +965,22 @@ def parse_ami_file_contents(  # pylint: disable=too-many-locals,too-many-branche
         RuntimeError: If ``ami_parse()`` function fails or returns a malformed S-expression.
     """
 
+    parse_results = parse_cache(cache)
+    if parse_results is None:
+        return _parse_ami_file_contents(file_contents)
+    cache_key = make_key("AMI", __version__, file_contents)
+    rslt = parse_results.get_object(cache_key)
+    if rslt is None:
+        rslt = _parse_ami_file_contents(file_contents)
+        parse_results.put_object(cache_key, rslt)
+    return rslt
+
+
+def _parse_ami_file_contents(  # pylint: disable=too-many-locals,too-many-branches
+    file_contents: str
+) -> tuple[list[str], list[str], AmiRootName, str, ReservedParamDict, ModelSpecificDict]:
+    "Uncached implementation of ``parse_ami_file_contents()``."
+
     try:
         res = ami_parse(file_contents)
     except ParseError as pe:
@@ -776,6 +1092,7 @@ def make_gui(params: ModelSpecificDict) -> tuple[Group, list[tuple[str, TraitTyp
         via some parameter naming scheme. This function makes a primitive attempt
         to decode one particular example of this: ``<grp>_<param>``.
     """
+    from traitsui.api import HGroup, VGroup  # pylint: disable=import-outside-toplevel
 
     gui_items: list[Item | Group] = []
     new_traits: list[tuple[str, TraitType]] = []
@@ -821,6 +1138,74 @@ def make_gui(params: ModelSpecificDict) -> tuple[Group, list[tuple[str, TraitTyp
     return (rslt_grp, new_traits)
 
 
+def _list_tips(param: AMIParameter) -> tuple[str, dict[str, Any]]:
+    "The default list tip, and the mapping from list tips to values, of a 'List' format parameter with tips."
+    tips: dict[str, Any] = {}
+    tips.update(list(zip(param.plist_tip, param.pvalue)))
+    tip = next(iter(tips.keys()))
+    default = param.pdefault
+    if default:
+        for tip_val in tips.items():
+            if tip_val[1] == default:
+                tip = tip_val[0]
+                break
+    return tip, tips
+
+
+def param_value(param: AMIParameter) -> Any:
+    """
+    Initial value of an *In*/*InOut* AMI parameter.
+
+    This is the value which the trait built for the parameter by ``make_gui_items()`` starts out with
+    (or, for 'List' format parameters with tips, the value mapped to its initial tip).
+
+    Raises:
+        ValueError: If the parameter's format is not recognized.
+    """
+    if param.ptype == "Boolean":
+        return param.pvalue
+    pformat = param.pformat
+    match pformat:
+        case "Value" | "Range":
+            return param.pvalue
+        case "List":
+            if param.plist_tip:
+                tip, tips = _list_tips(param)
+                return tips[tip]
+            return param.pdefault if param.pdefault else param.pvalue[0]
+        case "Corner":
+            return param.pvalue[0]  # Using `Typ` value, for now.
+        case _:
+            raise ValueError(
+                f"Unrecognized AMI parameter format: {pformat}, for parameter `{param.pname}` "
+                f"of type `{param.ptype}` and usage `{param.pusage}`!"
+            )
+
+
+def param_values(params: Parameters, prefix: str = "") -> dict[str, Any]:
+    """
+    Initial values of all *In*/*InOut* parameters in an AMI parameter (sub)tree.
+
+    Args:
+        params: The (sub)dictionary of AMI parameters.
+
+    Keyword Args:
+        prefix: The current working parameter name prefix.
+
+    Returns:
+        Dictionary of initial parameter values, keyed by fully hierarchical trait name
+        (i.e. - the names given to the traits built by ``make_gui()``).
+    """
+    values: dict[str, Any] = {}
+    for pname, param in params.items():
+        if isinstance(param, AMIParameter):
+            if param.pusage in ("In", "InOut"):
+                values[prefix + pname] = param_value(param)
+        elif pname != "description":  # Subparameter branch.
+            values.update(param_values(param, prefix=prefix + pname + "_"))  # type: ignore
+    return values
+
+
 def make_gui_items(  # pylint: disable=too-many-locals,too-many-branches
     pname: str,
     param: AMIParameter | Parameters
@@ -842,6 +1227,7 @@ def make_gui_items(  # pylint: disable=too-many-locals,too-many-branches
         1. A dictionary passed through ``param`` may have sub-dictionaries.
         These will be converted into sub- ``Group`` s in the returned list of GUI items.
     """
+    from traitsui.api import Item, VGroup  # pylint: disable=import-outside-toplevel
 
     if isinstance(param, AMIParameter):  # pylint: disable=no-else-return
         pusage = param.pusage
@@ -858,21 +1244,11 @@ def make_gui_items(  # pylint: disable=too-many-locals,too-many-branches
             case "Range":
                 the_trait = Range(param.pmin, param.pmax, param.pvalue)
             case "List":
-                list_tips = param.plist_tip
-                default = param.pdefault
-                if list_tips:
-                    tmp_dict: dict[str, Any] = {}
-                    tmp_dict.update(list(zip(list_tips, param.pvalue)))
-                    val = next(iter(tmp_dict.keys()))
-                    if default:
-                        for tip in tmp_dict.items():
-                            if tip[1] == default:
-                                val = tip[0]
-                                break
-                    the_trait = Trait(val, tmp_dict)
+                if param.plist_tip:
+                    tip, tips = _list_tips(param)
+                    the_trait = Trait(tip, tips)
                 else:
-                    val = default if default else param.pvalue[0]
-                    the_trait = Enum([val] + param.pvalue)
+                    the_trait = Enum([param_value(param)] + param.pvalue)
             case "Corner":
                 the_trait = Trait(param.pvalue[0])  # Using `Typ` value, for now.
             case _:
@@ -0,0 +1,192 @@
+"""
+Process pool execution backend for IBIS-AMI models.
+
+Vendor AMI models frequently keep global state, so a single ``AMIModel``
+(i.e. - one ``CDLL`` loaded into one process) can only run one configuration at a time.
+``AMIModelPool`` loads the same model into several worker processes,
+and dispatches independent ``initialize()`` / ``get_responses()`` / ``getWave()`` jobs to them,
+so that parameter sweeps scale across all available cores.
+
+Each job carries its own ``AMIModelInitializer`` and is run, start to finish,
+in a single worker, which keeps jobs independent of one another,
+regardless of which worker they land in.
+Waveforms are passed to/from the workers through shared memory,
+rather than being pickled.
+"""
+
+from collections.abc import Iterable
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Optional
+
+import numpy as np
+
+from pyibisami.ami.model import AMIModel, AMIModelInitializer, AmiModelResponses
+from pyibisami.common import Rvec
+
+# The model instance belonging to this (worker) process.
+_model: Optional[AMIModel] = None
+
+
+def _load_model(filename: str) -> None:
+    "Worker process initializer: load the model, once per worker."
+    global _model  # pylint: disable=global-statement
+    _model = AMIModel(filename)
+
+
+def _initialize(initializer: AMIModelInitializer) -> dict[str, Any]:
+    assert _model is not None
+    _model.initialize(initializer)
+    return {
+        "initOut": np.array(_model.initOut_array),
+        "ami_params_out": _model.ami_params_out,
+        "msg": _model.msg,
+    }
+
+
+def _get_responses(initializer: AMIModelInitializer, kwargs: dict[str, Any]) -> AmiModelResponses:
+    assert _model is not None
+    _model.initialize(initializer)
+    return _model.get_responses(**kwargs)
+
+
+def _get_wave(
+    initializer: AMIModelInitializer, shm_name: str, nsamps: int, bits_per_call: int
+) -> tuple[Rvec, list[str]]:
+    assert _model is not None
+    _model.initialize(initializer)
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        wave = np.ndarray((nsamps,), dtype=np.float64, buffer=shm.buf)
+        _, clock_times, params_out = _model.getWave(wave, bits_per_call=bits_per_call, out=wave)
+        clock_times = clock_times.copy()
+        del wave  # Release our export of `shm.buf`, before closing.
+    finally:
+        shm.close()
+    return clock_times, params_out
+
+
+class AMIModelPool:
+    """
+    A pool of worker processes, each holding its own instance of the same IBIS-AMI model.
+
+    Example::
+
+        with AMIModelPool("my_model.so") as pool:
+            results = pool.map_get_responses(initializers)
+    """
+
+    def __init__(self, filename: str, max_workers: Optional[int] = None, mp_context=None):
+        """
+        Args:
+            filename: The DLL/SO file name.
+
+        Keyword Args:
+            max_workers: Number of worker processes.
+                Default: None (Means "Use the number of CPUs.")
+            mp_context: The ``multiprocessing`` context used to start the workers.
+                Default: None (Means "Use the platform default.")
+        """
+
+        self._filename = filename
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=mp_context, initializer=_load_model, initargs=(filename,)
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+    def shutdown(self, wait: bool = True) -> None:
+        "Shut down the worker processes."
+        self._executor.shutdown(wait=wait)
+
+    def submit_initialize(self, initializer: AMIModelInitializer) -> Future:
+        """
+        Run ``AMI_Init()`` in a worker.
+
+        Args:
+            initializer: The model initialization data.
+
+        Returns:
+            A future resolving to a dictionary containing the model's
+            ``initOut``, ``ami_params_out``, and ``msg``.
+        """
+        return self._executor.submit(_initialize, initializer)
+
+    def submit_get_responses(self, initializer: AMIModelInitializer, **kwargs) -> Future:
+        """
+        Initialize the model in a worker and get its responses.
+
+        Args:
+            initializer: The model initialization data.
+
+        Keyword Args:
+            Any keyword arguments accepted by ``AMIModel.get_responses()``.
+
+        Returns:
+            A future resolving to the dictionary returned by ``AMIModel.get_responses()``.
+        """
+        return self._executor.submit(_get_responses, initializer, kwargs)
+
+    def submit_getwave(self, initializer: AMIModelInitializer, wave: Rvec, bits_per_call: int = 0) -> Future:
+        """
+        Initialize the model in a worker and run a waveform through it.
+
+        Args:
+            initializer: The model initialization data.
+            wave: Waveform to be processed.
+
+        Keyword Args:
+            bits_per_call: Number of bits to use, per call to ``AMI_GetWave()``.
+                Default: 0 (Means "Use the model's default value.")
+
+        Returns:
+            A future resolving to the same tuple returned by ``AMIModel.getWave()``.
+
+        Notes:
+            1. The waveform is handed to the worker via shared memory,
+            which the worker processes in place.
+        """
+
+        wave = np.asarray(wave, dtype=np.float64)
+        nsamps = len(wave)
+        shm = shared_memory.SharedMemory(create=True, size=max(1, wave.nbytes))
+        np.ndarray((nsamps,), dtype=np.float64, buffer=shm.buf)[:] = wave
+        result: Future = Future()
+
+        def done(job: Future) -> None:
+            try:
+                clock_times, params_out = job.result()
+                wave_out = np.ndarray((nsamps,), dtype=np.float64, buffer=shm.buf).copy()
+            except BaseException as err:  # pylint: disable=broad-exception-caught
+                result.set_exception(err)
+            else:
+                result.set_result((wave_out, clock_times, params_out))
+            finally:
+                shm.close()
+                shm.unlink()
+
+        try:
+            self._executor.submit(_get_wave, initializer, shm.name, nsamps, bits_per_call).add_done_callback(done)
+        except Exception:
+            shm.close()
+            shm.unlink()
+            raise
+        return result
+
+    def map_initialize(self, initializers: Iterable[AMIModelInitializer]) -> list[dict[str, Any]]:
+        "Run ``submit_initialize()`` for each initializer and collect the results, in order."
+        return [job.result() for job in [self.submit_initialize(init) for init in initializers]]
+
+    def map_get_responses(self, initializers: Iterable[AMIModelInitializer], **kwargs) -> list[AmiModelResponses]:
+        "Run ``submit_get_responses()`` for each initializer and collect the results, in order."
+        return [job.result() for job in [self.submit_get_responses(init, **kwargs) for init in initializers]]
+
+    def map_getwave(
+        self, initializers: Iterable[AMIModelInitializer], wave: Rvec, bits_per_call: int = 0
+    ) -> list[tuple[Rvec, Rvec, list[str]]]:
+        "Run ``submit_getwave()`` for each initializer, on the same input waveform, and collect the results, in order."
+        return [job.result() for job in [self.submit_getwave(init, wave, bits_per_call) for init in initializers]]
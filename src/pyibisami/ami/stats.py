@@ -0,0 +1,137 @@
+"""
+Timing and throughput instrumentation for ``AMIModel``.
+
+Instrumentation is off by default.
+It is enabled per model, via the ``instrument`` argument to the ``AMIModel`` constructor,
+or globally, by setting the ``PYIBISAMI_INSTRUMENT`` environment variable to a non-empty value other than "0".
+"""
+
+import json
+import math
+import os
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+INSTRUMENT_ENV = "PYIBISAMI_INSTRUMENT"
+
+# Latency histogram bucket upper bounds, in seconds: 1 us, 2 us, 4 us, ... ~275 s.
+HIST_BUCKETS: list[float] = [1e-6 * 2**n for n in range(29)]
+
+
+def instrument_default() -> bool:
+    "Is instrumentation requested, via the environment?"
+    return os.environ.get(INSTRUMENT_ENV, "0") not in ("", "0")
+
+
+@dataclass
+class EntryPointStats:  # pylint: disable=too-many-instance-attributes
+    "Accumulated statistics for one instrumented entry point."
+
+    calls: int = 0
+    total_time: float = 0.0
+    min_time: float = math.inf
+    max_time: float = 0.0
+    samples: int = 0
+    nbytes: int = 0
+    chunks: int = 0
+    histogram: list[int] = field(default_factory=lambda: [0] * (len(HIST_BUCKETS) + 1))
+
+    def record(self, elapsed: float, samples: int = 0, nbytes: int = 0, chunks: int = 0) -> None:
+        "Account for one call, which took ``elapsed`` seconds."
+        self.calls += 1
+        self.total_time += elapsed
+        self.min_time = min(self.min_time, elapsed)
+        self.max_time = max(self.max_time, elapsed)
+        self.samples += samples
+        self.nbytes += nbytes
+        self.chunks += chunks
+        self.histogram[bisect_left(HIST_BUCKETS, elapsed)] += 1
+
+    @property
+    def samples_per_second(self) -> Optional[float]:
+        "Throughput, or None if no samples were processed."
+        if not self.samples or not self.total_time:
+            return None
+        return self.samples / self.total_time
+
+    def to_dict(self) -> dict[str, Any]:
+        "JSON friendly representation; the histogram is keyed by bucket upper bound, and omits empty buckets."
+        return {
+            "calls": self.calls,
+            "total_time": self.total_time,
+            "mean_time": self.total_time / self.calls if self.calls else None,
+            "min_time": self.min_time if self.calls else None,
+            "max_time": self.max_time,
+            "samples": self.samples,
+            "samples_per_second": self.samples_per_second,
+            "bytes": self.nbytes,
+            "chunks": self.chunks,
+            "histogram": {
+                (f"<={HIST_BUCKETS[n]:.3g}" if n < len(HIST_BUCKETS) else f">{HIST_BUCKETS[-1]:.3g}"): count
+                for n, count in enumerate(self.histogram) if count
+            },
+        }
+
+
+class AMIModelStats:
+    """
+    Per entry point call statistics for one ``AMIModel``.
+
+    Entry points recorded:
+
+        - ``AMI_Init``: each call into the model's ``AMI_Init()``.
+        - ``AMI_GetWave``: each call into the model's ``AMI_GetWave()`` (i.e. - one chunk).
+        - ``getWave``: each call to ``AMIModel.getWave()``, including marshalling.
+        - ``get_responses``: each call to ``AMIModel.get_responses()``, including post-processing.
+    """
+
+    def __init__(self):
+        self.entries: dict[str, EntryPointStats] = {}
+
+    def record(self, name: str, elapsed: float, samples: int = 0, nbytes: int = 0, chunks: int = 0) -> None:
+        "Account for one call to the named entry point."
+        if name not in self.entries:
+            self.entries[name] = EntryPointStats()
+        self.entries[name].record(elapsed, samples=samples, nbytes=nbytes, chunks=chunks)
+
+    def reset(self) -> None:
+        "Discard all accumulated statistics."
+        self.entries.clear()
+
+    def to_dict(self) -> dict[str, dict[str, Any]]:
+        "JSON friendly representation."
+        return {name: entry.to_dict() for name, entry in self.entries.items()}
+
+    def to_json(self, filename: Optional[str | Path] = None) -> str:
+        """
+        Render the statistics as JSON.
+
+        Keyword Args:
+            filename: If given, the JSON is also written to this file.
+                Default: None
+
+        Returns:
+            The JSON text.
+        """
+        text = json.dumps(self.to_dict(), indent=2)
+        if filename is not None:
+            Path(filename).write_text(text, encoding="utf-8")
+        return text
+
+    def summary(self) -> str:
+        "Plain text table of the key statistics, one row per entry point."
+        header = (
+            f"{'Entry point':<14} {'Calls':>7} {'Total (s)':>10} {'Mean (s)':>10} {'Max (s)':>10} "
+            f"{'Chunks':>7} {'Samples/s':>10} {'MBytes':>8}"
+        )
+        lines = [header]
+        for name, entry in self.entries.items():
+            sps = entry.samples_per_second
+            lines.append(
+                f"{name:<14} {entry.calls:>7} {entry.total_time:>10.4g} {entry.total_time / entry.calls:>10.4g} "
+                f"{entry.max_time:>10.4g} {entry.chunks:>7} {(f'{sps:.4g}' if sps else '-'):>10} "
+                f"{entry.nbytes / 1e6:>8.3g}"
+            )
+        return "\n".join(lines)
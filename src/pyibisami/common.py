@@ -13,7 +13,8 @@ from typing             import Any, TypeAlias, TypeVar
 import numpy        as np
 import numpy.typing as npt  # type: ignore
 
-from scipy.linalg       import convolution_matrix, lstsq
+# Note: SciPy is imported by the functions below which use it, rather than here,
+#       because importing `scipy.signal` takes longer than importing the rest of the package.
 
 Real = TypeVar("Real", float, float)
 Comp = TypeVar("Comp", complex, complex)
@@ -31,7 +32,10 @@ TestConfig = tuple[str, tuple[dict[str, Any], dict[str, Any]]]
 TestSweep = tuple[str, str, list[TestConfig]]
 
 
-def deconv_same(y: Rvec, x: Rvec) -> Rvec:
+DECONV_LSTSQ_MAX_LEN: int = 512  # Largest problem size solved by dense least squares, when ``method="auto"``.
+
+
+def deconv_same(y: Rvec, x: Rvec, method: str = "auto", reg: float = 1e-12) -> Rvec:
     """
     Deconvolve input from output, to recover filter response, for same length I/O.
 
@@ -39,12 +43,90 @@ def deconv_same(y: Rvec, x: Rvec) -> Rvec:
         y: output signal
         x: input signal
 
+    Keyword Args:
+        method: Deconvolution engine to use; one of:
+
+            - "lstsq": Dense least squares solution, via ``convolution_matrix()``.
+              Requires O(n^2) memory and O(n^3) time.
+            - "fft": Regularized (i.e. - Wiener) deconvolution, in the frequency domain.
+              Requires O(n) memory and O(n log(n)) time.
+            - "auto": "lstsq" for ``len(y) <= DECONV_LSTSQ_MAX_LEN``, "fft" otherwise.
+
+            Default: "auto"
+        reg: Regularization constant for the "fft" method, relative to the peak input power spectral density.
+            Default: 1e-12
+
     Returns:
         h: filter impulse response.
+
+    Raises:
+        ValueError: If ``method`` is not recognized.
+
+    Notes:
+        1. The "fft" method assumes that the full convolution of ``x`` and ``h`` is zero,
+        outside of the window captured by ``y``.
+        The two methods agree closely for well behaved (i.e. - settled) responses,
+        but may differ in their treatment of truncation effects.
+    """
+    if method == "auto":
+        method = "lstsq" if len(y) <= DECONV_LSTSQ_MAX_LEN else "fft"
+    if method == "lstsq":
+        from scipy.linalg import convolution_matrix, lstsq  # pylint: disable=import-outside-toplevel
+        A = convolution_matrix(x, len(y), "same")
+        h, _, _, _ = lstsq(A, y)
+        return h
+    if method == "fft":
+        from scipy.fft import irfft, next_fast_len, rfft  # pylint: disable=import-outside-toplevel
+        n = len(y)
+        ofst = (n - 1) // 2  # Offset of the "same" window into the full convolution.
+        nfft = next_fast_len(ofst + 2 * n, real=True)
+        Y = rfft(np.pad(y, (ofst, 0)), nfft)
+        X = rfft(x, nfft)
+        X_pwr = np.abs(X) ** 2
+        return irfft(Y * np.conj(X) / (X_pwr + reg * X_pwr.max()), nfft)[:n]
+    raise ValueError(f"Unrecognized deconvolution method: '{method}'!")
+
+
+CONV_OA_MIN_RATIO: int = 8  # Min. ratio of signal lengths, above which overlap-add is preferred.
+
+
+def convolve(x: Rvec, h: Rvec, mode: str = "full") -> Rvec:
+    """
+    Convolve two signals, choosing the fastest evaluation method by size.
+
+    Args:
+        x: First signal, or batch of signals (one per row).
+        h: Second signal, or batch of signals (one per row).
+
+    Keyword Args:
+        mode: One of "full", "same", or "valid", as per ``scipy.signal.convolve()``.
+            Default: "full"
+
+    Returns:
+        The convolution of ``x`` and ``h``, along their last axes.
+        Leading (i.e. - batch) dimensions are broadcast against each other.
+
+    Notes:
+        1. For a single pair of signals, direct evaluation is used when it's estimated to be faster.
+        Otherwise, overlap-add is used when the signal lengths differ greatly (e.g. - a long bit stream
+        convolved with a short channel impulse response) and FFT convolution when they don't.
+        Batches always use one of the FFT based methods.
     """
-    A = convolution_matrix(x, len(y), "same")
-    h, _, _, _ = lstsq(A, y)
-    return h
+    # pylint: disable=import-outside-toplevel
+    from scipy.signal import choose_conv_method, fftconvolve, oaconvolve
+    from scipy.signal import convolve as direct_convolve
+
+    x = np.asarray(x)
+    h = np.asarray(h)
+    if x.ndim == 1 and h.ndim == 1 and choose_conv_method(x, h, mode=mode) == "direct":
+        return direct_convolve(x, h, mode=mode, method="direct")
+    ndim = max(x.ndim, h.ndim)
+    x = x.reshape((1,) * (ndim - x.ndim) + x.shape)
+    h = h.reshape((1,) * (ndim - h.ndim) + h.shape)
+    len_x, len_h = x.shape[-1], h.shape[-1]
+    if max(len_x, len_h) >= CONV_OA_MIN_RATIO * min(len_x, len_h):
+        return oaconvolve(x, h, mode=mode, axes=-1)
+    return fftconvolve(x, h, mode=mode, axes=-1)
 
 
 def raised_cosine(x):
@@ -15,6 +15,7 @@ Copyright (c) 2019 by David Banas; All rights reserved World wide.
 """
 
 import platform
+from collections.abc import Iterable, Mapping
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
@@ -27,14 +28,12 @@ from traits.api import (
     List,
     Property,
     String,
-    Trait,
     cached_property,
 )
-from traitsui.api import HGroup, Item, ModalButtons, VGroup, View, spring
-from traitsui.message import message
 
 from .model import Component, Model
 from .parser import parse_ibis_file
+from ..util.cache import DiskCache
 
 # ToDo: The ``is_tx`` flag, as well as the AMI files should have _model_, not _file_, scope.
 
@@ -70,6 +69,7 @@ class IBISModel(HasTraits):  # pylint: disable=too-many-instance-attributes
     via the ``model_dict`` property.
     """
 
+    comp_ = Property(Any, depends_on=["comp"])
     pin_ = Property(Any, depends_on=["pin"])
     pin_rlcs = Property(Dict, depends_on=["pin"])
     model = Property(Any, depends_on=["mod"])
@@ -107,20 +107,15 @@ class IBISModel(HasTraits):  # pylint: disable=too-many-instance-attributes
             2. An empty list is returned if the given name is unrecognized.
         """
 
-        if mname in self._model_selectors:
-            return [pr[0] for pr in self._model_selectors[mname]]
-        else:
-            if mname in self._models:
-                return [mname]
-            else:
-                return []
+        return list(self._model_names.get(mname, []))
 
     def get_models(self, mname: str) -> list[str]:
         """Deprecated synonym of ``get_model_names``"""
         return self.get_model_names(mname)
 
     def get_pins(self):
-        return list(self.comp_.pins)
+        "The pins of the selected component, which use one of the available models."
+        return [pname for pname, (mname, _) in self.comp_.pins.items() if self._model_names.get(mname)]
 
     def get_pins_qualified(self, is_tx: bool, comp_name: Optional[str] = None) -> list[Any]:
         """
@@ -133,26 +128,29 @@ class IBISModel(HasTraits):  # pylint: disable=too-many-instance-attributes
             comp_name: Fetch the pins for the named component when given;
                 otherwise, use the currently selected component.
                 Default: ``None``
-        """
-        pins = self.comp_.pins  # type: ignore
 
-        def pin_ok(pname):
-            (mname, _) = pins[pname]
-            mods = self.get_models(mname)
-            mod = self._models[mods[0]]
-            mod_type = mod.mtype.lower()
-            tx_ok = mod_type in ("output", "i/o")
-            if self._is_tx:
-                return tx_ok
-            return not tx_ok
-
-        return list(filter(pin_ok, list(pins)))
+        Notes:
+            1. A pin is Tx capable when its (first, in the case of a model selector) model
+            is of type "Output" or "I/O".
+            2. Only pins using available models are returned.
+        """
+        comp = self._components[comp_name] if comp_name is not None else self.comp_
+        qualified = set()
+        for mname in comp.pins.model_pins:  # Typically, far fewer models than pins.
+            mods = self._model_names.get(mname)
+            if mods and (self._models[mods[0]].mtype.lower() in ("output", "i/o")) == is_tx:
+                qualified.add(mname)
+        return [pname for pname, (mname, _) in comp.pins.items() if mname in qualified]
 
     def __init__(
         self: "IBISModel",
         ibis_file_name: str,
         debug: bool = False,
-        gui: bool = True
+        gui: bool = True,
+        cache: Optional[bool | DiskCache] = None,
+        lazy: bool = False,
+        models: Optional[Iterable[str]] = None,
+        components: Optional[Iterable[str]] = None,
     ) -> None:
         """
         Args:
@@ -163,6 +161,15 @@ class IBISModel(HasTraits):  # pylint: disable=too-many-instance-attributes
                 Default = False
             gui (bool): Set to `False` for command line and/or script usage.
                 Default = True.
+            cache: Cache of IBIS file parse results (see ``parse_ibis_file()``).
+                Default = None (Means "Use the default cache, if the ``PYIBISAMI_PARSE_CACHE`` env. variable is set.")
+            lazy: Only parse [Model] and [Component] sections as they are needed (see ``parse_ibis_file()``).
+                Default = False
+            models: Only parse the named models/model selectors (see ``parse_ibis_file()``).
+                (Only those pins using these models are then available for selection.)
+                Default = None (Means "Parse all models.")
+            components: Only parse the named components (see ``parse_ibis_file()``).
+                Default = None (Means "Parse all components.")
         """
 
         # Super-class initialization is ABSOLUTELY NECESSARY, in order
@@ -180,7 +187,9 @@ class IBISModel(HasTraits):  # pylint: disable=too-many-instance-attributes
         # Parse the IBIS file contents, storing any errors or warnings, and validate it.
         with open(ibis_file_name, "r", encoding="utf-8") as file:
             ibis_file_contents_str = file.read()
-        err_str, model_dict = parse_ibis_file(ibis_file_contents_str, debug=debug)
+        err_str, model_dict = parse_ibis_file(
+            ibis_file_contents_str, debug=debug, cache=cache, lazy=lazy, models=models, components=components
+        )
         self._file_name: str = model_dict.get("file_name", "(n/a)")
         self._ibis_ver: float = model_dict.get("ibis_ver", "(n/a)")
         self._file_rev: str = model_dict.get("file_rev", "(n/a)")
@@ -190,22 +199,33 @@ class IBISModel(HasTraits):  # pylint: disable=too-many-instance-attributes
             if debug:
                 print(f":\n{model_dict}", flush=True)
             raise ValueError("This IBIS model has no components!")
-        components = model_dict["components"]
+        comps: Mapping[str, Component] = model_dict["components"]
         if "models" not in model_dict or not model_dict["models"]:
             if debug:
                 print(f":\n{model_dict}", flush=True)
             raise ValueError("This IBIS model has no models!")
 
         self._model_dict: dict[str, Any] = model_dict
-        self._models: dict[str, Model] = model_dict["models"]
-        self._components: dict[str, Component] = components
+        self._models: Mapping[str, Model] = model_dict["models"]
+        self._components: Mapping[str, Component] = comps
         self._model_selectors: dict[str, list[str]] = {}
         if "model_selectors" in model_dict:
             self._model_selectors.update(model_dict["model_selectors"])
+        # The available models, by model or model selector name. (Model selectors take precedence.)
+        self._model_names: dict[str, list[str]] = {mname: [mname] for mname in self._models}
+        for sname, members in self._model_selectors.items():
+            self._model_names[sname] = [pr[0] for pr in members if pr[0] in self._models]
+
+        # Start with the first component having pins which use the available models.
+        # (When only some models are parsed, that needn't be the first component.)
+        comp_name = next(
+            (cname for cname, comp in comps.items() if any(map(self._model_names.get, comp.pins.model_pins))),
+            next(iter(comps)),
+        )
 
         # Add Traits for various attributes found in the IBIS file.
         # Doesn't need a custom mapper because the thing above it (file) can't change:
-        self.add_trait("comp", Trait(next(iter(components)), components))
+        self.add_trait("comp", Enum(comp_name, list(comps)))
         self.pins = self.get_pins()  # type: ignore
         try:
             self.add_trait("pin", Enum(self.pins[0], values="pins"))  # type: ignore
@@ -226,7 +246,7 @@ class IBISModel(HasTraits):  # pylint: disable=too-many-instance-attributes
         self._os_type = platform.system()  # These 2 are used, to choose
         self._os_bits = platform.architecture()[0]  # the correct AMI executable.
 
-        self._comp_changed(next(iter(components)))  # Wasn't being called automatically.
+        self._comp_changed(comp_name)  # Wasn't being called automatically.
         # Wasn't being called automatically:
         self._pin_changed(self.pins[0])  # type: ignore
 
@@ -271,10 +291,14 @@ class IBISModel(HasTraits):  # pylint: disable=too-many-instance-attributes
         if self.debug:
             print(txt, flush=True)
         if alert and self.GUI:
+            from traitsui.message import message  # pylint: disable=import-outside-toplevel
             message(_msg, "PyAMI Alert")
 
     def default_traits_view(self):
         "Default Traits/UI view definition."
+        # pylint: disable=import-outside-toplevel
+        from traitsui.api import HGroup, Item, ModalButtons, VGroup, View, spring
+
         view = View(
             VGroup(
                 HGroup(
@@ -300,6 +324,10 @@ class IBISModel(HasTraits):  # pylint: disable=too-many-instance-attributes
         )
         return view
 
+    @cached_property
+    def _get_comp_(self):
+        return self._components[self.comp]
+
     @cached_property
     def _get_pin_(self):
         return self.comp_.pins[self.pin]
@@ -0,0 +1,542 @@
+"""
+Searchable index of a library of IBIS files.
+
+A directory tree of ``*.ibs`` files is parsed (in parallel) and its
+components, pins, models, executables, reserved AMI parameters, and [AMI Test Configuration] names
+are recorded in a local *SQLite* database, which may then be queried without re-opening any of the files.
+
+Re-indexing is incremental: files whose size and modification time (and those of their referenced ``*.ami`` files)
+are unchanged are skipped, as are files whose contents hash the same as when last indexed.
+
+Example:
+    ::
+
+        ibis-library index ~/vendor_models
+        ibis-library components "DDR5*"
+        ibis-library models --platform linux --bits 64 --param GetWave_Exists=True
+"""
+
+import hashlib
+import os
+import sqlite3
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from collections.abc import Iterable
+from typing import Any, Optional
+
+import click
+
+from ..ami.parser import parse_ami_file_contents
+from ..util.cache import default_cache_dir, file_digest
+from .parser import parse_ibis_file
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE files (
+    id INTEGER PRIMARY KEY, path TEXT UNIQUE NOT NULL, mtime_ns INTEGER, size INTEGER, sha256 TEXT,
+    ibis_ver TEXT, error TEXT
+);
+CREATE TABLE dependencies (
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE, path TEXT, mtime_ns INTEGER, size INTEGER
+);
+CREATE TABLE components (
+    id INTEGER PRIMARY KEY, file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    name TEXT COLLATE NOCASE, manufacturer TEXT
+);
+CREATE TABLE pins (
+    component_id INTEGER NOT NULL REFERENCES components(id) ON DELETE CASCADE,
+    pin TEXT COLLATE NOCASE, signal TEXT COLLATE NOCASE, model TEXT COLLATE NOCASE
+);
+CREATE TABLE models (
+    id INTEGER PRIMARY KEY, file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    name TEXT COLLATE NOCASE, model_type TEXT COLLATE NOCASE, is_ami INTEGER
+);
+CREATE TABLE executables (
+    model_id INTEGER NOT NULL REFERENCES models(id) ON DELETE CASCADE,
+    platform TEXT, bits INTEGER, executable TEXT, ami_file TEXT
+);
+CREATE TABLE ami_params (
+    model_id INTEGER NOT NULL REFERENCES models(id) ON DELETE CASCADE,
+    ami_file TEXT, name TEXT COLLATE NOCASE, value TEXT
+);
+CREATE TABLE test_configs (
+    model_id INTEGER NOT NULL REFERENCES models(id) ON DELETE CASCADE,
+    name TEXT COLLATE NOCASE, type TEXT, direction TEXT
+);
+CREATE INDEX idx_dependencies_file ON dependencies(file_id);
+CREATE INDEX idx_components_file ON components(file_id);
+CREATE INDEX idx_components_name ON components(name);
+CREATE INDEX idx_pins_component ON pins(component_id);
+CREATE INDEX idx_models_file ON models(file_id);
+CREATE INDEX idx_models_name ON models(name);
+CREATE INDEX idx_executables_model ON executables(model_id);
+CREATE INDEX idx_ami_params_model ON ami_params(model_id);
+CREATE INDEX idx_ami_params_name ON ami_params(name);
+CREATE INDEX idx_test_configs_model ON test_configs(model_id);
+"""
+
+_TABLES = ["test_configs", "ami_params", "executables", "models", "pins", "components", "dependencies", "files"]
+
+
+def default_db_path() -> Path:
+    "Default location of the library index; within the *PyIBIS-AMI* cache directory."
+    return default_cache_dir() / "ibis_library.sqlite"
+
+
+def _stat_key(path: str | Path) -> tuple[int, int]:
+    "(modification time, size) of a file, or (-1, -1) if it doesn't exist."
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return -1, -1
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _like(pattern: str) -> str:
+    "Convert a shell style wildcard pattern (i.e. - using '*' and '?') into a SQL ``LIKE`` pattern."
+    escaped = pattern.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return escaped.replace("*", "%").replace("?", "_")
+
+
+def _ami_params(ami_path: Path) -> list[tuple[str, Optional[str]]]:
+    "The (name, value) pairs of the reserved parameters in an ``*.ami`` file; empty if it's missing or malformed."
+    try:
+        text = ami_path.read_text(encoding="utf-8", errors="replace")
+        errors, _, _, _, reserved, _ = parse_ami_file_contents(text)
+    except Exception:  # pylint: disable=broad-exception-caught
+        return []
+    if errors:
+        return []
+    rslt: list[tuple[str, Optional[str]]] = []
+    for pname, param in reserved.items():
+        value = param.pvalue if param.pvalue is not None else param.pdefault
+        rslt.append((str(pname), None if value is None else str(value)))
+    return rslt
+
+
+def _index_file(path: str) -> dict[str, Any]:
+    """
+    Parse an IBIS file, along with the ``*.ami`` files it references, and extract its index records.
+
+    Notes:
+        1. This runs in the worker processes of ``IbisLibrary.index()``;
+        so, it returns only plain (picklable) data, leaving the database updates to the caller.
+    """
+    mtime_ns, size = _stat_key(path)
+    rec: dict[str, Any] = {
+        "path": path,
+        "mtime_ns": mtime_ns,
+        "size": size,
+        "sha256": None,
+        "ibis_ver": None,
+        "error": None,
+        "components": [],
+        "models": [],
+        "dependencies": [],
+    }
+    try:
+        data = Path(path).read_bytes()
+    except OSError as err:  # e.g. - unreadable, or removed since the directory scan; don't abort the whole run.
+        rec["error"] = str(err)
+        return rec
+    rec["sha256"] = hashlib.sha256(data).hexdigest()
+    try:
+        err_str, model_dict = parse_ibis_file(data.decode("utf-8", errors="replace"))
+    except Exception as err:  # pylint: disable=broad-exception-caught
+        err_str, model_dict = str(err) or type(err).__name__, {}
+    if not model_dict:
+        rec["error"] = err_str
+        return rec
+    rec["ibis_ver"] = str(model_dict.get("ibis_ver"))
+
+    for cname, comp in model_dict["components"].items():
+        pins = [
+            (pname[: -len(sig) - 2], sig, comp.pin_model(pname)) for pname, sig in comp.pins.pin_signals.items()
+        ]
+        rec["components"].append((cname, comp.mfr, pins))
+
+    ami_dir = Path(path).parent
+    ami_files: dict[str, list[tuple[str, Optional[str]]]] = {}
+    for mname, model in model_dict["models"].items():
+        execs = []
+        for (platform, bits), (executable, ami_file) in model.executables:
+            execs.append((platform, int(bits), executable, ami_file))
+            if ami_file not in ami_files:
+                ami_files[ami_file] = _ami_params(ami_dir / ami_file)
+        params = [(ami_file, pname, value) for ami_file in dict.fromkeys(ex[3] for ex in execs)
+                  for pname, value in ami_files[ami_file]]
+        configs = [(cfg_name, cfg.get("type"), cfg.get("direction")) for cfg_name, cfg in model.test_configs.items()]
+        rec["models"].append((mname, model.mtype, model.is_ami, execs, params, configs))
+    rec["dependencies"] = [(str(ami_dir / ami_file), *_stat_key(ami_dir / ami_file)) for ami_file in ami_files]
+    return rec
+
+
+@dataclass
+class IndexSummary:
+    "Outcome of an ``IbisLibrary.index()`` run."
+
+    indexed: list[str] = field(default_factory=list)  #: Files (re)parsed.
+    unchanged: int = 0  #: Number of files skipped, as unchanged since last indexed.
+    removed: list[str] = field(default_factory=list)  #: Files dropped from the index, as no longer present.
+    failed: list[tuple[str, str]] = field(default_factory=list)  #: (file, error message) of files failing to parse.
+
+    def __str__(self) -> str:
+        return (
+            f"{len(self.indexed)} indexed ({len(self.failed)} with errors), "
+            f"{self.unchanged} unchanged, {len(self.removed)} removed."
+        )
+
+
+class IbisLibrary:
+    """
+    *SQLite* index of a library of IBIS files.
+
+    Queries take shell style wildcard patterns (i.e. - using '*' and '?'), matched without regard to case,
+    and return lists of tuples, each ending with the path of the IBIS file concerned.
+    """
+
+    def __init__(self, db_path: Optional[str | Path] = None):
+        """
+        Keyword Args:
+            db_path: The index database file; created as needed.
+                Default: None (Means "Use ``default_db_path()``.")
+        """
+        self.db_path = Path(db_path) if db_path is not None else default_db_path()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path)
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:  # New, or written by an incompatible version; it's only an index, so rebuild.
+            with self._conn:
+                for table in _TABLES:
+                    self._conn.execute(f"DROP TABLE IF EXISTS {table}")
+                self._conn.executescript(_SCHEMA)
+                self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def __repr__(self):
+        return f"IbisLibrary({str(self.db_path)!r})"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self) -> None:
+        "Close the database connection."
+        self._conn.close()
+
+    def _is_current(self, file_id: int, path: Path, mtime_ns: int, size: int, sha256: Optional[str]) -> bool:
+        "Is the indexed record of a file (and of the ``*.ami`` files it references) still current?"
+        if sha256 is None:  # Couldn't be read, last time; try again.
+            return False
+        for dep_path, dep_mtime, dep_size in self._conn.execute(
+            "SELECT path, mtime_ns, size FROM dependencies WHERE file_id = ?", (file_id,)
+        ):
+            if _stat_key(dep_path) != (dep_mtime, dep_size):
+                return False
+        new_mtime, new_size = _stat_key(path)
+        if (new_mtime, new_size) == (mtime_ns, size):
+            return True
+        if new_size != size:
+            return False
+        try:
+            if file_digest(path) != sha256:
+                return False
+        except OSError:
+            return False
+        with self._conn:  # Touched, but not changed; remember the new time, so as not to hash it again.
+            self._conn.execute("UPDATE files SET mtime_ns = ? WHERE id = ?", (new_mtime, file_id))
+        return True
+
+    def _store(self, rec: dict[str, Any]) -> None:
+        "Replace the index records of a file."
+        conn = self._conn
+        with conn:
+            conn.execute("DELETE FROM files WHERE path = ?", (rec["path"],))
+            file_id = conn.execute(
+                "INSERT INTO files (path, mtime_ns, size, sha256, ibis_ver, error) VALUES (?, ?, ?, ?, ?, ?)",
+                (rec["path"], rec["mtime_ns"], rec["size"], rec["sha256"], rec["ibis_ver"], rec["error"]),
+            ).lastrowid
+            conn.executemany(
+                "INSERT INTO dependencies (file_id, path, mtime_ns, size) VALUES (?, ?, ?, ?)",
+                [(file_id, *dep) for dep in rec["dependencies"]],
+            )
+            for cname, mfr, pins in rec["components"]:
+                comp_id = conn.execute(
+                    "INSERT INTO components (file_id, name, manufacturer) VALUES (?, ?, ?)", (file_id, cname, mfr)
+                ).lastrowid
+                conn.executemany(
+                    "INSERT INTO pins (component_id, pin, signal, model) VALUES (?, ?, ?, ?)",
+                    [(comp_id, *pin) for pin in pins],
+                )
+            for mname, mtype, is_ami, execs, params, configs in rec["models"]:
+                model_id = conn.execute(
+                    "INSERT INTO models (file_id, name, model_type, is_ami) VALUES (?, ?, ?, ?)",
+                    (file_id, mname, mtype, int(is_ami)),
+                ).lastrowid
+                conn.executemany(
+                    "INSERT INTO executables (model_id, platform, bits, executable, ami_file) VALUES (?, ?, ?, ?, ?)",
+                    [(model_id, *ex) for ex in execs],
+                )
+                conn.executemany(
+                    "INSERT INTO ami_params (model_id, ami_file, name, value) VALUES (?, ?, ?, ?)",
+                    [(model_id, *param) for param in params],
+                )
+                conn.executemany(
+                    "INSERT INTO test_configs (model_id, name, type, direction) VALUES (?, ?, ?, ?)",
+                    [(model_id, *cfg) for cfg in configs],
+                )
+
+    def index(self, root: str | Path, jobs: Optional[int] = None, force: bool = False) -> IndexSummary:
+        """
+        Bring the index of the IBIS files (i.e. - ``*.ibs``) in a directory tree up to date.
+
+        Args:
+            root: The top of the directory tree.
+
+        Keyword Args:
+            jobs: Number of worker processes among which to divide the parsing of the files.
+                Default: None (Means "One per CPU.")
+            force: Re-parse all files, even those unchanged since last indexed.
+                Default: False
+
+        Returns:
+            A summary of the changes made to the index.
+        """
+        root = Path(root).resolve()
+        found = sorted(
+            str(path) for path in root.rglob("*") if path.suffix.lower() == ".ibs" and path.is_file()
+        )
+        known = {
+            path: row
+            for path, *row in self._conn.execute("SELECT path, id, mtime_ns, size, sha256 FROM files")
+            if Path(path).is_relative_to(root)
+        }
+
+        summary = IndexSummary()
+        todo = []
+        for path in found:
+            if not force and path in known and self._is_current(known[path][0], Path(path), *known[path][1:]):
+                summary.unchanged += 1
+            else:
+                todo.append(path)
+        summary.removed = sorted(set(known) - set(found))
+        with self._conn:
+            self._conn.executemany("DELETE FROM files WHERE path = ?", [(path,) for path in summary.removed])
+
+        jobs = jobs or os.cpu_count() or 1
+        if jobs > 1 and len(todo) > 1:
+            with ProcessPoolExecutor(max_workers=min(jobs, len(todo))) as pool:
+                recs: Iterable[dict[str, Any]] = pool.map(_index_file, todo, chunksize=4)
+                self._store_all(recs, summary)
+        else:
+            self._store_all(map(_index_file, todo), summary)
+        return summary
+
+    def _store_all(self, recs: Iterable[dict[str, Any]], summary: IndexSummary) -> None:
+        "Store each record as it arrives, so that an interrupted indexing run isn't entirely lost."
+        for rec in recs:
+            self._store(rec)
+            summary.indexed.append(rec["path"])
+            if rec["error"] is not None:
+                summary.failed.append((rec["path"], rec["error"]))
+
+    def files(self, errors: bool = False) -> list[tuple[str, Optional[str], Optional[str]]]:
+        """
+        The indexed files, as (path, IBIS version, error message) triples.
+
+        Keyword Args:
+            errors: List only the files which failed to parse.
+                Default: False
+        """
+        query = "SELECT path, ibis_ver, error FROM files"
+        if errors:
+            query += " WHERE error IS NOT NULL"
+        return self._conn.execute(query + " ORDER BY path").fetchall()
+
+    def components(self, pattern: str = "*") -> list[tuple[str, str, str]]:
+        "The matching [Component]s, as (component, manufacturer, path) triples."
+        return self._conn.execute(
+            """SELECT c.name, c.manufacturer, f.path FROM components c JOIN files f ON c.file_id = f.id
+               WHERE c.name LIKE ? ESCAPE '\\' ORDER BY f.path, c.name""",
+            (_like(pattern),),
+        ).fetchall()
+
+    def pins(
+        self, component: str = "*", signal: str = "*", model: str = "*"
+    ) -> list[tuple[str, str, str, str, str]]:
+        "The matching [Pin]s, as (component, pin, signal, model, path) tuples."
+        return self._conn.execute(
+            """SELECT c.name, p.pin, p.signal, p.model, f.path
+               FROM pins p JOIN components c ON p.component_id = c.id JOIN files f ON c.file_id = f.id
+               WHERE c.name LIKE ? ESCAPE '\\' AND p.signal LIKE ? ESCAPE '\\' AND p.model LIKE ? ESCAPE '\\'
+               ORDER BY f.path, c.name, p.rowid""",
+            (_like(component), _like(signal), _like(model)),
+        ).fetchall()
+
+    def models(  # pylint: disable=too-many-arguments
+        self,
+        pattern: str = "*",
+        model_type: Optional[str] = None,
+        ami: Optional[bool] = None,
+        platform: Optional[str] = None,
+        bits: Optional[int] = None,
+        params: Optional[dict[str, str]] = None,
+    ) -> list[tuple[str, str, str]]:
+        """
+        The matching [Model]s, as (model, model type, path) triples.
+
+        Keyword Args:
+            pattern: Model name pattern.
+            model_type: Model type (e.g. - "I/O") pattern.
+            ami: Select only AMI (True), or only non-AMI (False), models.
+            platform: Select only models having an executable for this platform (i.e. - "linux" or "windows").
+            bits: Select only models having an executable of this width (i.e. - 32 or 64).
+                (Given both ``platform`` and ``bits``, the same executable must satisfy both.)
+            params: Select only models whose ``*.ami`` file has these reserved parameter values
+                (e.g. - ``{"GetWave_Exists": "True"}``), compared without regard to case.
+        """
+        query = """SELECT m.name, m.model_type, f.path FROM models m JOIN files f ON m.file_id = f.id
+                   WHERE m.name LIKE ? ESCAPE '\\'"""
+        args: list[Any] = [_like(pattern)]
+        if model_type is not None:
+            query += " AND m.model_type LIKE ? ESCAPE '\\'"
+            args.append(_like(model_type))
+        if ami is not None:
+            query += " AND m.is_ami = ?"
+            args.append(int(ami))
+        if platform is not None or bits is not None:
+            query += " AND EXISTS (SELECT 1 FROM executables e WHERE e.model_id = m.id"
+            if platform is not None:
+                query += " AND e.platform = ?"
+                args.append(platform.lower())
+            if bits is not None:
+                query += " AND e.bits = ?"
+                args.append(bits)
+            query += ")"
+        for pname, value in (params or {}).items():
+            query += """ AND EXISTS (SELECT 1 FROM ami_params a
+                                     WHERE a.model_id = m.id AND a.name = ? AND a.value = ? COLLATE NOCASE)"""
+            args.extend([pname, value])
+        return self._conn.execute(query + " ORDER BY f.path, m.name", args).fetchall()
+
+    def test_configs(self, pattern: str = "*") -> list[tuple[str, Optional[str], str, str]]:
+        "The matching [AMI Test Configuration]s, as (configuration, type, model, path) tuples."
+        return self._conn.execute(
+            """SELECT t.name, t.type, m.name, f.path
+               FROM test_configs t JOIN models m ON t.model_id = m.id JOIN files f ON m.file_id = f.id
+               WHERE t.name LIKE ? ESCAPE '\\' ORDER BY f.path, m.name, t.rowid""",
+            (_like(pattern),),
+        ).fetchall()
+
+
+def _echo_rows(rows: list[tuple]) -> None:
+    "Print query results, one tab separated row per line."
+    for row in rows:
+        click.echo("\t".join("" if col is None else str(col) for col in row))
+
+
+@click.group(context_settings={"help_option_names": ["-h", "--help"]})
+@click.option(
+    "--db", type=click.Path(dir_okay=False, path_type=Path), default=None,
+    help="Index database file.  [default: ibis_library.sqlite, in the PyIBIS-AMI cache directory]",
+)
+@click.pass_context
+def main(ctx, db):
+    """
+    Index a library of IBIS files, and query the index.
+
+    Name patterns may use the shell style wildcards '*' and '?', and are matched without regard to case.
+    """
+    ctx.obj = db
+
+
+@main.command("index")
+@click.argument("roots", nargs=-1, required=True, type=click.Path(exists=True, file_okay=False, path_type=Path))
+@click.option("--jobs", "-j", type=int, default=None, help="Number of worker processes.  [default: one per CPU]")
+@click.option("--force", is_flag=True, help="Re-parse all files, even those unchanged since last indexed.")
+@click.pass_obj
+def index_cmd(db, roots, jobs, force):
+    "Index the IBIS files in the given directory trees."
+    with IbisLibrary(db) as library:
+        for root in roots:
+            summary = library.index(root, jobs=jobs, force=force)
+            click.echo(f"{root}: {summary}")
+            for path, err in summary.failed:
+                click.echo(f"{path}: {err.strip().splitlines()[0] if err.strip() else 'Parse failure.'}", err=True)
+
+
+@main.command("files")
+@click.option("--errors", is_flag=True, help="List only the files which failed to parse.")
+@click.pass_obj
+def files_cmd(db, errors):
+    "List the indexed files, with their IBIS versions (or, with --errors, their parse errors)."
+    with IbisLibrary(db) as library:
+        _echo_rows([(path, err.strip().splitlines()[0] if errors and err else ver)
+                    for path, ver, err in library.files(errors)])
+
+
+@main.command("components")
+@click.argument("pattern", default="*")
+@click.pass_obj
+def components_cmd(db, pattern):
+    "List the matching components: name, manufacturer, file."
+    with IbisLibrary(db) as library:
+        _echo_rows(library.components(pattern))
+
+
+@main.command("pins")
+@click.argument("component", default="*")
+@click.option("--signal", "-s", default="*", help="Signal name pattern.")
+@click.option("--model", "-m", default="*", help="Model name pattern.")
+@click.pass_obj
+def pins_cmd(db, component, signal, model):
+    "List the matching pins: component, pin, signal, model, file."
+    with IbisLibrary(db) as library:
+        _echo_rows(library.pins(component, signal, model))
+
+
+@main.command("models")
+@click.argument("pattern", default="*")
+@click.option("--type", "model_type", default=None, help="Model type pattern (e.g. - 'I/O').")
+@click.option("--ami/--no-ami", default=None, help="Only AMI, or only non-AMI, models.")
+@click.option("--platform", type=click.Choice(["linux", "windows"], case_sensitive=False), default=None,
+              help="Only models having an executable for this platform.")
+@click.option("--bits", type=click.Choice(["32", "64"]), default=None,
+              help="Only models having an executable of this width.")
+@click.option("--param", "-p", "params", multiple=True, metavar="NAME=VALUE",
+              help="Only models with this reserved AMI parameter value (e.g. - GetWave_Exists=True); repeatable.")
+@click.pass_obj
+def models_cmd(db, pattern, model_type, ami, platform, bits, params):  # pylint: disable=too-many-arguments
+    "List the matching models: name, type, file."
+    param_dict = {}
+    for param in params:
+        pname, sep, value = param.partition("=")
+        if not sep:
+            click.echo(f"Expected NAME=VALUE, but got '{param}'.", err=True)
+            sys.exit(1)
+        param_dict[pname.strip()] = value.strip()
+    with IbisLibrary(db) as library:
+        _echo_rows(
+            library.models(
+                pattern, model_type=model_type, ami=ami, platform=platform,
+                bits=int(bits) if bits else None, params=param_dict,
+            )
+        )
+
+
+@main.command("test-configs")
+@click.argument("pattern", default="*")
+@click.pass_obj
+def test_configs_cmd(db, pattern):
+    "List the matching [AMI Test Configuration]s: name, type, model, file."
+    with IbisLibrary(db) as library:
+        _echo_rows(library.test_configs(pattern))
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -10,11 +10,45 @@ https://ibis.org/
 Copyright (c) 2019 by David Banas; All rights reserved World wide.
 """
 
+from collections.abc import Iterable
+from typing import Optional
+
 import numpy as np
-from chaco.api import ArrayPlotData, Plot
-from enable.component_editor import ComponentEditor
-from traits.api import HasTraits, String, Trait
-from traitsui.api import Group, Item, ModalButtons, View
+from traits.api import Any, HasTraits, Property, String, Trait
+
+# Note: The GUI/plotting packages (i.e. - `chaco`, `enable`, and `traitsui`) are imported
+#       only where they're used, because they dominate the import time of this module.
+
+
+class PinTable(dict):
+    """
+    The [Pin] table of a [Component].
+
+    A dictionary, mapping each pin's "<pin>(<signal>)" name to its (model name, R/L/C values) pair,
+    in file order, along with prebuilt indexes for fast lookup by signal and model.
+
+    Notes:
+        1. The indexes are built once, upon construction, and are not updated by subsequent modifications.
+    """
+
+    def __init__(self, rows: Iterable[tuple[str, str, str, dict[str, float]]] = ()):
+        """
+        Args:
+            rows: The (pin, signal, model, R/L/C values) of each pin.
+        """
+        super().__init__()
+        pin_signals: dict[str, str] = {}
+        for nm, sig, mod, rlcs in rows:
+            pname = f"{nm}({sig})"
+            self[pname] = (mod, rlcs)
+            pin_signals[pname] = sig
+        self.pin_signals = pin_signals  #: Signal name, by pin.
+        self.signal_pins: dict[str, list[str]] = {}  #: Pins, by signal name.
+        for pname, sig in pin_signals.items():
+            self.signal_pins.setdefault(sig, []).append(pname)
+        self.model_pins: dict[str, list[str]] = {}  #: Pins, by model (or model selector) name.
+        for pname, (mod, _) in self.items():
+            self.model_pins.setdefault(mod, []).append(pname)
 
 
 class Component(HasTraits):
@@ -39,20 +73,16 @@ class Component(HasTraits):
         self._pkg = subDict["package"]
         self._pins = subDict["pin"]
         self._diffs = subDict.get("diff_pin")  # Won't flag error; returns `None`.
+        self._gui_traits_added = False
 
-        # Set up the GUI.
+    def _add_gui_traits(self):
+        "Add the traits displayed by the GUI; deferred until needed, since most uses are headless."
+        if self._gui_traits_added:
+            return
+        self._gui_traits_added = True
         self.add_trait("manufacturer", String(self._mfr))
         self.add_trait("package", String(self._pkg))
-        self.add_trait("_pin", Trait(next(iter(self._pins)), self._pins))
-        self._content = [
-            Group(
-                Item("manufacturer", label="Manufacturer", style="readonly"),
-                Item("package", label="Package", style="readonly"),
-                Item("_pin", label="Pin"),
-                label="Component",
-                show_border=True,
-            ),
-        ]
+        self.add_trait("_pin", Trait(next(iter(self._pins)), dict(self._pins)))
 
     def __str__(self):
         res = "Manufacturer:\t" + self._mfr + "\n"
@@ -67,13 +97,24 @@ class Component(HasTraits):
 
     def default_traits_view(self):
         "Default Traits/UI view definition."
+        from traitsui.api import Group, Item, ModalButtons, View  # pylint: disable=import-outside-toplevel
+
+        self._add_gui_traits()
         view = View(
             resizable=False,
             buttons=ModalButtons,
             title="PyBERT IBIS Component Viewer",
             id="pyibisami.ibis_parser.Component",
         )
-        view.set_content(self._content)
+        view.set_content([
+            Group(
+                Item("manufacturer", label="Manufacturer", style="readonly"),
+                Item("package", label="Package", style="readonly"),
+                Item("_pin", label="Pin"),
+                label="Component",
+                show_border=True,
+            ),
+        ])
         return view
 
     @property
@@ -83,17 +124,38 @@ class Component(HasTraits):
         Returns the first pin in the list, if the user hasn't made a
         selection yet.
         """
-        return self._pin_
+        if not self._gui_traits_added:
+            return next(iter(self._pins.values()))
+        return self._pins[self._pin]
+
+    @property
+    def mfr(self) -> str:
+        "The component manufacturer."
+        return self._mfr
 
     @property
     def pins(self):
         "The list of component pins."
         return self._pins
 
+    def pin_model(self, pname: str) -> str:
+        "The name of the model (or model selector) used by the given pin."
+        return self._pins[pname][0]
+
+    def model_pins(self, mname: str) -> list[str]:
+        "The pins using the given model (or model selector); empty if none do."
+        return self._pins.model_pins.get(mname, [])
+
+    def signal_pins(self, signal: str) -> list[str]:
+        "The pins carrying the given signal; empty if none do."
+        return self._pins.signal_pins.get(signal, [])
+
 
 class Model(HasTraits):  # pylint: disable=too-many-instance-attributes
     """Encapsulation of a particular I/O model from an IBIS model file."""
 
+    plot_iv = Property(Any)  # Built upon first use (e.g. - by the GUI), since most uses are headless.
+
     def __init__(self, subDict):  # pylint: disable=too-many-locals,too-many-statements,too-many-branches
         """
         Args:
@@ -120,6 +182,10 @@ class Model(HasTraits):  # pylint: disable=too-many-instance-attributes
         self._trange = maybe("temperature_range")
         self._vrange = maybe("voltage_range")
         self._ramp = maybe("ramp")
+        self._iv_curves: dict[str, np.ndarray] = {}  # The data plotted by ``plot_iv``.
+        self._iv_titles: Optional[tuple[str, str, str]] = None  # Plot, x-axis, and y-axis titles of ``plot_iv``.
+        self._plot_iv = None
+        self._gui_traits_added = False
 
         # Check for the required keywords.
         if not self._mtype:
@@ -128,28 +194,24 @@ class Model(HasTraits):  # pylint: disable=too-many-instance-attributes
             raise LookupError("Missing [Voltage Range]!")
 
         def proc_iv(xs):
-            """Process an I/V table."""
-            if len(xs) < 2:
+            """Process an I/V table (i.e. - an (N, 4) array of: V, I(typ), I(min), I(max))."""
+            xs = np.asarray(xs, dtype=float)
+            if xs.ndim != 2 or len(xs) < 2:
                 raise ValueError("Insufficient number of I-V data points!")
-            try:
-                vs, iss = zip(*(xs))  # Idiomatic Python for ``unzip``.
-            except Exception as exc:
-                raise ValueError(f"xs: {xs}") from exc
-            ityps, imins, imaxs = zip(*iss)
+            vs, ityps, imins, imaxs = xs.T
             vmeas = self._vmeas
+            if vmeas:
+                ix = np.where(vs >= vmeas)[0][0]
+            else:
+                ix = np.where(vs >= max(vs) / 2)[0][0]
 
-            def calcZ(x):
-                (vs, ivals) = x
-                if vmeas:
-                    ix = np.where(np.array(vs) >= vmeas)[0][0]
-                else:
-                    ix = np.where(np.array(vs) >= max(vs) / 2)[0][0]
-                try:
-                    return abs((vs[ix] - vs[ix - 1]) / (ivals[ix] - ivals[ix - 1]))
-                except ZeroDivisionError:
+            def calcZ(ivals):
+                di = ivals[ix] - ivals[ix - 1]
+                if di == 0:
                     return 1e7  # Use 10 MOhms in place of infinity.
+                return float(abs((vs[ix] - vs[ix - 1]) / di))
 
-            zs = map(calcZ, zip([vs, vs, vs], [ityps, imins, imaxs]))
+            zs = map(calcZ, [ityps, imins, imaxs])
             return vs, ityps, imins, imaxs, zs
 
         # Infer impedance and/or rise/fall time, as per model type.
@@ -157,7 +219,6 @@ class Model(HasTraits):  # pylint: disable=too-many-instance-attributes
         if mtype in ("output", "i/o"):
             if "pulldown" not in subDict or "pullup" not in subDict:
                 raise LookupError("Missing I-V curves!")
-            plotdata = ArrayPlotData()
             pd_vs, pd_ityps, pd_imins, pd_imaxs, pd_zs = proc_iv(subDict["pulldown"])
             pu_vs, pu_ityps, pu_imins, pu_imaxs, pu_zs = proc_iv(subDict["pullup"])
             pu_vs = self._vrange[0] - np.array(pu_vs)  # Correct for Vdd-relative pull-up voltages.
@@ -165,32 +226,11 @@ class Model(HasTraits):  # pylint: disable=too-many-instance-attributes
             pu_imins = -np.array(pu_imins)
             pu_imaxs = -np.array(pu_imaxs)
             self._zout = (next(iter(pd_zs)) + next(iter(pu_zs))) / 2
-            plotdata.set_data("pd_vs", pd_vs)
-            plotdata.set_data("pd_ityps", pd_ityps)
-            plotdata.set_data("pd_imins", pd_imins)
-            plotdata.set_data("pd_imaxs", pd_imaxs)
-            plotdata.set_data("pu_vs", pu_vs)
-            plotdata.set_data("pu_ityps", pu_ityps)
-            plotdata.set_data("pu_imins", pu_imins)
-            plotdata.set_data("pu_imaxs", pu_imaxs)
-            plot_iv = Plot(plotdata)  # , padding_left=75)
-            # The 'line_style' trait of a LinePlot instance must be 'dash' or 'dot dash' or 'dot' or 'long dash' or 'solid'.
-            plot_iv.plot(("pd_vs", "pd_ityps"), type="line", color="blue", line_style="solid", name="PD-Typ")
-            plot_iv.plot(("pd_vs", "pd_imins"), type="line", color="blue", line_style="dot", name="PD-Min")
-            plot_iv.plot(("pd_vs", "pd_imaxs"), type="line", color="blue", line_style="dash", name="PD-Max")
-            plot_iv.plot(("pu_vs", "pu_ityps"), type="line", color="red", line_style="solid", name="PU-Typ")
-            plot_iv.plot(("pu_vs", "pu_imins"), type="line", color="red", line_style="dot", name="PU-Min")
-            plot_iv.plot(("pu_vs", "pu_imaxs"), type="line", color="red", line_style="dash", name="PU-Max")
-            plot_iv.title = "Pull-Up/Down I-V Curves"
-            plot_iv.index_axis.title = "Vout (V)"
-            plot_iv.value_axis.title = "Iout (A)"
-            plot_iv.index_range.low_setting = 0
-            plot_iv.index_range.high_setting = self._vrange[0]
-            plot_iv.value_range.low_setting = 0
-            plot_iv.value_range.high_setting = 0.1
-            plot_iv.legend.visible = True
-            plot_iv.legend.align = "ul"
-            self.plot_iv = plot_iv
+            self._iv_curves.update({
+                "pd_vs": pd_vs, "pd_ityps": pd_ityps, "pd_imins": pd_imins, "pd_imaxs": pd_imaxs,
+                "pu_vs": pu_vs, "pu_ityps": pu_ityps, "pu_imins": pu_imins, "pu_imaxs": pu_imaxs,
+            })
+            self._iv_titles = ("Pull-Up/Down I-V Curves", "Vout (V)", "Iout (A)")
 
             if not self._ramp:
                 raise LookupError("Missing [Ramp]!")
@@ -200,15 +240,12 @@ class Model(HasTraits):  # pylint: disable=too-many-instance-attributes
             if "gnd_clamp" not in subDict and "power_clamp" not in subDict:
                 pass
 
-            plotdata = ArrayPlotData()
-
             if "gnd_clamp" in subDict:
                 gc_vs, gc_ityps, gc_imins, gc_imaxs, gc_zs = proc_iv(subDict["gnd_clamp"])
                 gc_z = next(iter(gc_zs))  # Use typical value for Zin calc.
-                plotdata.set_data("gc_vs", gc_vs)
-                plotdata.set_data("gc_ityps", gc_ityps)
-                plotdata.set_data("gc_imins", gc_imins)
-                plotdata.set_data("gc_imaxs", gc_imaxs)
+                self._iv_curves.update(
+                    {"gc_vs": gc_vs, "gc_ityps": gc_ityps, "gc_imins": gc_imins, "gc_imaxs": gc_imaxs}
+                )
             else:
                 gc_z = 2e6
 
@@ -219,33 +256,13 @@ class Model(HasTraits):  # pylint: disable=too-many-instance-attributes
                 pc_ityps = -np.array(pc_ityps)  # Correct for current sense, for nicer plot.
                 pc_imins = -np.array(pc_imins)
                 pc_imaxs = -np.array(pc_imaxs)
-                plotdata.set_data("pc_vs", pc_vs)
-                plotdata.set_data("pc_ityps", pc_ityps)
-                plotdata.set_data("pc_imins", pc_imins)
-                plotdata.set_data("pc_imaxs", pc_imaxs)
+                self._iv_curves.update(
+                    {"pc_vs": pc_vs, "pc_ityps": pc_ityps, "pc_imins": pc_imins, "pc_imaxs": pc_imaxs}
+                )
             else:
                 pc_z = 2e6
 
-            plot_iv = Plot(plotdata)  # , padding_left=75)
-            # The 'line_style' trait of a LinePlot instance must be 'dash' or 'dot dash' or 'dot' or 'long dash' or 'solid'.
-            if "gnd_clamp" in subDict:
-                plot_iv.plot(("gc_vs", "gc_ityps"), type="line", color="blue", line_style="solid", name="PD-Typ")
-                plot_iv.plot(("gc_vs", "gc_imins"), type="line", color="blue", line_style="dot", name="PD-Min")
-                plot_iv.plot(("gc_vs", "gc_imaxs"), type="line", color="blue", line_style="dash", name="PD-Max")
-            if "power_clamp" in subDict:
-                plot_iv.plot(("pc_vs", "pc_ityps"), type="line", color="red", line_style="solid", name="PU-Typ")
-                plot_iv.plot(("pc_vs", "pc_imins"), type="line", color="red", line_style="dot", name="PU-Min")
-                plot_iv.plot(("pc_vs", "pc_imaxs"), type="line", color="red", line_style="dash", name="PU-Max")
-            plot_iv.title = "Power/GND Clamp I-V Curves"
-            plot_iv.index_axis.title = "Vin (V)"
-            plot_iv.value_axis.title = "Iin (A)"
-            plot_iv.index_range.low_setting = 0
-            plot_iv.index_range.high_setting = self._vrange[0]
-            plot_iv.value_range.low_setting = 0
-            plot_iv.value_range.high_setting = 0.1
-            plot_iv.legend.visible = True
-            plot_iv.legend.align = "ul"
-            self.plot_iv = plot_iv
+            self._iv_titles = ("Power/GND Clamp I-V Curves", "Vin (V)", "Iin (A)")
 
             if "gnd_clamp" in subDict and "power_clamp" in subDict:
                 # Parallel combination, as both clamps are always active.
@@ -296,7 +313,11 @@ class Model(HasTraits):  # pylint: disable=too-many-instance-attributes
             self._exec32Wins, self._exec32Lins = splitExecs(exec32s)
             self._exec64Wins, self._exec64Lins = splitExecs(exec64s)
 
-        # Set up the GUI.
+    def _add_gui_traits(self):
+        "Add the traits displayed by the GUI; deferred until needed, since most uses are headless."
+        if self._gui_traits_added:
+            return
+        self._gui_traits_added = True
         self.add_trait("model_type", String(self._mtype))
         self.add_trait("c_comp", String(self._ccomp))
         self.add_trait("cref", String(self._cref))
@@ -305,35 +326,43 @@ class Model(HasTraits):  # pylint: disable=too-many-instance-attributes
         self.add_trait("rref", String(self._rref))
         self.add_trait("trange", String(self._trange))
         self.add_trait("vrange", String(self._vrange))
+        mtype = self._mtype.lower()
         if mtype in ("output", "i/o"):
             self.add_trait("zout", String(self._zout))
             self.add_trait("slew", String(self._slew))
         elif mtype == "input":
             self.add_trait("zin", String(self._zin))
-        self._content = [
-            Group(
-                Item("model_type", label="Model type", style="readonly"),
-                Item("c_comp", label="Ccomp", style="readonly"),
-                Item("trange", label="Temperature Range", style="readonly"),
-                Item("vrange", label="Voltage Range", style="readonly"),
-                Group(
-                    Item("cref", label="Cref", style="readonly"),
-                    Item("vref", label="Vref", style="readonly"),
-                    Item("vmeas", label="Vmeas", style="readonly"),
-                    Item("rref", label="Rref", style="readonly"),
-                    orientation="horizontal",
-                ),
-                label="Model",
-                show_border=True,
-            ),
-        ]
-        if mtype in ("output", "i/o"):
-            self._content.append(Item("zout", label="Impedance (Ohms)", style="readonly", format_str="%4.1f"))
-            self._content.append(Item("slew", label="Slew Rate (V/ns)", style="readonly", format_str="%4.1f"))
-            self._content.append(Item("plot_iv", editor=ComponentEditor(), show_label=False))
-        elif mtype == "input":
-            self._content.append(Item("zin", label="Impedance (Ohms)", style="readonly", format_str="%4.1f"))
-            self._content.append(Item("plot_iv", editor=ComponentEditor(), show_label=False))
+
+    def _get_plot_iv(self):
+        if self._plot_iv is None and self._iv_titles is not None:
+            self._plot_iv = self._make_plot_iv()
+        return self._plot_iv
+
+    def _make_plot_iv(self):
+        "Build the I-V curves plot."
+        from chaco.api import ArrayPlotData, Plot  # pylint: disable=import-outside-toplevel
+
+        plot_iv = Plot(ArrayPlotData(**self._iv_curves))  # , padding_left=75)
+        # The 'line_style' trait of a LinePlot instance must be:
+        # 'dash' or 'dot dash' or 'dot' or 'long dash' or 'solid'.
+        curves = [("pd", "blue", "PD"), ("pu", "red", "PU"), ("gc", "blue", "PD"), ("pc", "red", "PU")]
+        corners = [("ityps", "solid", "Typ"), ("imins", "dot", "Min"), ("imaxs", "dash", "Max")]
+        for curve, color, label in curves:
+            if f"{curve}_vs" not in self._iv_curves:
+                continue
+            for ivals, line_style, corner in corners:
+                plot_iv.plot(
+                    (f"{curve}_vs", f"{curve}_{ivals}"),
+                    type="line", color=color, line_style=line_style, name=f"{label}-{corner}",
+                )
+        plot_iv.title, plot_iv.index_axis.title, plot_iv.value_axis.title = self._iv_titles
+        plot_iv.index_range.low_setting = 0
+        plot_iv.index_range.high_setting = self._vrange[0]
+        plot_iv.value_range.low_setting = 0
+        plot_iv.value_range.high_setting = 0.1
+        plot_iv.legend.visible = True
+        plot_iv.legend.align = "ul"
+        return plot_iv
 
     def __str__(self):
         res = "Model Type:\t" + self._mtype + "\n"
@@ -362,13 +391,43 @@ class Model(HasTraits):  # pylint: disable=too-many-instance-attributes
 
     def default_traits_view(self):
         "Default Traits/UI view definition."
+        # pylint: disable=import-outside-toplevel
+        from enable.component_editor import ComponentEditor
+        from traitsui.api import Group, Item, ModalButtons, View
+
+        self._add_gui_traits()
+        content = [
+            Group(
+                Item("model_type", label="Model type", style="readonly"),
+                Item("c_comp", label="Ccomp", style="readonly"),
+                Item("trange", label="Temperature Range", style="readonly"),
+                Item("vrange", label="Voltage Range", style="readonly"),
+                Group(
+                    Item("cref", label="Cref", style="readonly"),
+                    Item("vref", label="Vref", style="readonly"),
+                    Item("vmeas", label="Vmeas", style="readonly"),
+                    Item("rref", label="Rref", style="readonly"),
+                    orientation="horizontal",
+                ),
+                label="Model",
+                show_border=True,
+            ),
+        ]
+        mtype = self._mtype.lower()
+        if mtype in ("output", "i/o"):
+            content.append(Item("zout", label="Impedance (Ohms)", style="readonly", format_str="%4.1f"))
+            content.append(Item("slew", label="Slew Rate (V/ns)", style="readonly", format_str="%4.1f"))
+            content.append(Item("plot_iv", editor=ComponentEditor(), show_label=False))
+        elif mtype == "input":
+            content.append(Item("zin", label="Impedance (Ohms)", style="readonly", format_str="%4.1f"))
+            content.append(Item("plot_iv", editor=ComponentEditor(), show_label=False))
         view = View(
             resizable=False,
             buttons=ModalButtons,
             title="PyBERT IBIS Model Viewer",
             id="pyibisami.ibis_parser.Model",
         )
-        view.set_content(self._content)
+        view.set_content(content)
         return view
 
     @property
@@ -408,6 +467,21 @@ class Model(HasTraits):  # pylint: disable=too-many-instance-attributes
             "64-bit": {"lin": self._exec64Lins, "win": self._exec64Wins}
         }
 
+    @property
+    def rising_waveforms(self) -> list:
+        "The [Rising Waveform] tables (see ``parser.WaveformTable``), each parsed upon first use."
+        return self._subDict.get("rising_waveform", [])
+
+    @property
+    def falling_waveforms(self) -> list:
+        "The [Falling Waveform] tables (see ``parser.WaveformTable``), each parsed upon first use."
+        return self._subDict.get("falling_waveform", [])
+
+    @property
+    def composite_currents(self) -> list:
+        "The [Composite Current] tables, each also available as the ``composite_current`` of the waveform it follows."
+        return self._subDict.get("composite_current", [])
+
     @property
     def test_configs(self) -> dict:
         "Named [AMI Test Configuration] blocks from the IBIS file."
@@ -12,13 +12,18 @@ Copyright (c) 2019 by David Banas; All rights reserved World wide.
 
 import re
 
-from functools import reduce
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import cached_property, reduce
 from typing import Any, Optional, TypeAlias, TypeVar
-from collections.abc import Generator, Iterable
+from collections.abc import Generator, Iterable, Iterator, Mapping, Sequence
 
+import numpy as np
 from parsec import (
     ParseError,
     Parser,
+    Value,
     count,
     eof,
     fail_with,
@@ -37,7 +42,9 @@ from parsec import (
     try_choice,
 )
 
-from pyibisami.ibis.model import Component, Model
+from pyibisami import __version__
+from pyibisami.ibis.model import Component, Model, PinTable
+from pyibisami.util.cache import DiskCache, make_key, parse_cache
 
 DEBUG = False
 
@@ -113,9 +120,10 @@ symbol: Parser = lexeme(regex(r"[a-zA-Z_][^\s()\[\]]*"))
 true: Parser = lexeme(string("True")).result(True)
 false: Parser = lexeme(string("False")).result(False)
 quoted_string: Parser = lexeme(regex(r'"[^"]*"'))
-skip_keyword: Parser = (skip_line >> many(none_of("[") >> skip_line)).result(
-    "(Skipped.)"
-)  # Skip over everything until the next keyword begins.
+# Skip over everything until the next keyword begins.
+# (Equivalent to: ``skip_line >> many(none_of("[") >> skip_line)``, but a single regular expression match,
+# rather than several parser invocations per character, which matters for large skipped sections.)
+skip_keyword: Parser = regex(r"[^\[\n\r]*(?:\s+|\|.*)*(?:[^\[][^\[\n\r]*(?:\s+|\|.*)*)*").result("(Skipped.)")
 
 IBIS_num_suf: dict[str, str] = {
     "T": "e12",
@@ -163,6 +171,81 @@ def typminmax() -> GenParser[list[float]]:
 
 vi_line: Parser = (number + typminmax) << ignore
 
+# Bulk I-V table parsing:
+# A whole table is matched by a single regular expression and its tokens converted a column at a time,
+# rather than running ``vi_line`` (several parsers per number) once per row,
+# which matters for the dense, many row, tables found in vendor models.
+_NUMBER = r"[-+]?[0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+|[TknGmpMuf][a-zA-Z]*)?[a-zA-Z]*"
+_table_region = re.compile(rf"(?:(?:{_NUMBER}|(?:NA|na)(?=\s))(?:\s+|\|.*)*)+")
+_table_token = re.compile(
+    r"\|.*|(NA|na)|([-+]?[0-9]*\.?[0-9]+)(?:([eE][-+]?[0-9]+)|([TknGmpMuf])[a-zA-Z]*)?[a-zA-Z]*"
+)
+
+
+def _table_rows(txt: str, tokens: list[tuple[int, int, Optional[float]]]) -> tuple[list[list[float]], int]:
+    """
+    Group the (start, end, value) tokens of an I-V table into rows, exactly as ``many1(vi_line)`` would,
+    with "NA" min./max. values (i.e. - None tokens) replaced by the typical value.
+
+    Returns:
+        The rows, and the number of tokens consumed by them.
+    """
+    rows: list[list[float]] = []
+    ix = 0
+    ntoks = len(tokens)
+    while ix + 1 < ntoks:
+        v, typ = tokens[ix][2], tokens[ix + 1][2]
+        if v is None or typ is None:
+            break
+        if ix + 3 < ntoks:
+            t2, t3 = tokens[ix + 2][2], tokens[ix + 3][2]
+            if t2 is not None and t3 is not None:
+                rows.append([v, typ, t2, t3])
+                ix += 4
+                continue
+            if t2 is None and t3 is None and txt[tokens[ix + 2][1]:tokens[ix + 3][0]].isspace():  # ``count(na, 2)``
+                rows.append([v, typ, typ, typ])
+                ix += 4
+                continue
+        rows.append([v, typ, typ, typ])
+        ix += 2
+    return rows, ix
+
+
+@Parser
+def iv_table(txt: Sequence[Any], ix: int) -> Value:
+    """
+    Parse an I-V table (e.g. - [Pulldown]), returning an (N, 4) array with columns: V, I(typ), I(min), I(max).
+
+    Notes:
+        1. Missing (i.e. - "NA") min./max. values are replaced by the typical ones.
+        2. Accepts exactly the same input as ``many1(vi_line)``.
+    """
+    if not isinstance(txt, str) or (region := _table_region.match(txt, ix)) is None:
+        return Value.failure(ix, "I-V table")
+    matches = [match for match in _table_token.finditer(txt, ix, region.end()) if match.group(0)[0] != "|"]
+    # Append any exponent, or the equivalent of any suffix, to each mantissa and convert in bulk,
+    # so that the values are identical to those returned by ``number``.
+    texts = [
+        None if match.group(1) else match.group(2) + (match.group(3) or IBIS_num_suf.get(match.group(4), ""))
+        for match in matches
+    ]
+    if None not in texts:
+        values = np.array(texts, dtype=float)
+        nrows = len(values) // 4
+        if nrows and nrows * 4 == len(values):
+            return Value.success(region.end(), values.reshape(nrows, 4))
+        floats: list[Optional[float]] = values.tolist()
+    else:
+        floats = [None if text is None else float(text) for text in texts]
+    tokens = [(match.start(), match.end(), value) for match, value in zip(matches, floats)]
+    rows, nused = _table_rows(txt, tokens)
+    if not rows:
+        return Value.failure(ix, "I-V table")
+    if nused < len(tokens):  # Stop where ``many1(vi_line)`` would have.
+        return Value.success(tokens[nused][0], np.array(rows))
+    return Value.success(region.end(), np.array(rows))
+
 
 @generate("ratio")
 def ratio() -> GenParser[Optional[float]]:
@@ -392,35 +475,145 @@ def ramp() -> GenParser[dict[str, Any]]:
     return rslt
 
 
-# ToDo: Implement: rising_waveform, falling_waveform, and composite_current.
+# [Rising Waveform], [Falling Waveform], and [Composite Current]:
+_fixture_param = re.compile(r"(?:\s+|\|.*)*([a-zA-Z]\w*)\s*=\s*([^\s|]+)")
+
+
+@dataclass
+class WaveformTable:
+    """
+    A [Rising Waveform], [Falling Waveform], or [Composite Current] table, which is only parsed upon first access.
+
+    These are, typically, the largest tables in an IBIS file;
+    so, only their text is kept by the file parser, leaving its conversion to those who actually use them.
+    """
+
+    keyword: str  # e.g. - "rising_waveform"
+    text: str = field(repr=False)  # The keyword's contents, up to (but excluding) the next keyword.
+    composite_current: Optional["WaveformTable"] = None  # The [Composite Current] following a waveform, if any.
+
+    @cached_property
+    def _parsed(self) -> tuple[dict[str, Optional[float]], np.ndarray]:
+        fixture: dict[str, Optional[float]] = {}
+        ix = 0
+        while match := _fixture_param.match(self.text, ix):
+            val = number(match.group(2), 0)
+            fixture[match.group(1).lower()] = val.value if val.status else None  # e.g. - "V_fixture_min = NA"
+            ix = match.end()
+        rslt = (ignore >> iv_table)(self.text, ix)
+        if not rslt.status or rslt.index != len(self.text):
+            raise ParseError(f"[{self.keyword.replace('_', ' ').title()}] table", self.text, rslt.index)
+        return fixture, rslt.value
+
+    @property
+    def fixture(self) -> dict[str, Optional[float]]:
+        "The fixture/DUT parameters (e.g. - ``r_fixture``, ``v_fixture_min``), keyed by lower cased name."
+        return self._parsed[0]
+
+    @property
+    def data(self) -> np.ndarray:
+        """
+        The table, as an (N, 4) array, with columns: time, typ., min., max.
+
+        Raises:
+            ParseError: If the table is malformed.
+        """
+        return self._parsed[1]
+
+
+def waveform_table(kw: str) -> Parser:
+    "Parser for keyword ``kw`` (e.g. - [Rising Waveform]), which skips its contents, returning a ``WaveformTable``."
+
+    @Parser
+    def fn(txt, ix):
+        end = skip_keyword(txt, ix).index
+        return Value.success(end, WaveformTable(kw, txt[ix:end]))
+
+    return fn
+
+
 Model_keywords: dict[str, Parser] = {
-    "pulldown": many1(vi_line),
-    "pullup": many1(vi_line),
+    "pulldown": iv_table,
+    "pullup": iv_table,
     "ramp": ramp,
     "algorithmic_model": algo_model,
     "voltage_range": typminmax,
     "temperature_range": typminmax,
-    "gnd_clamp": many1(vi_line),
-    "power_clamp": many1(vi_line),
-    "rising_waveform": skip_keyword,
-    "falling_waveform": skip_keyword,
-    "composite_current": skip_keyword,
+    "gnd_clamp": iv_table,
+    "power_clamp": iv_table,
+    "rising_waveform": waveform_table("rising_waveform"),
+    "falling_waveform": waveform_table("falling_waveform"),
+    "composite_current": waveform_table("composite_current"),
 }
+_waveform_keywords = ("rising_waveform", "falling_waveform", "composite_current")
+
+
+def _model_dict(nodes: list[tuple[str, Any]]) -> dict[str, Any]:
+    """
+    Gather the parsed (keyword, value) pairs of a [Model] into a dictionary,
+    keeping all of its (usually, several) waveform tables, as lists,
+    and linking each [Composite Current] to the waveform it follows.
+    """
+    rslt: dict[str, Any] = {}
+    waveform = None
+    for kw, val in nodes:
+        if kw in _waveform_keywords:
+            rslt.setdefault(kw, []).append(val)
+            if kw == "composite_current":
+                if waveform is not None:
+                    waveform.composite_current = val
+            else:
+                waveform = val
+        else:
+            rslt[kw] = val
+    return rslt
+
+
+def construct_section(kw: str, nm: str, fields: dict[str, Any]) -> tuple[Optional[Model | Component], str]:
+    """
+    Construct the object representing a parsed [Model] or [Component] section.
+
+    Args:
+        kw: The section keyword: "model" or "component".
+        nm: The section name.
+        fields: The parsed section contents (i.e. - its sub-keywords and parameters).
+
+    Returns:
+        A pair containing
+
+        - the ``Model`` or ``Component`` (None upon failure), and
+        - a message describing the nature of any failure (empty upon success).
+    """
+    if kw == "model":
+        try:
+            return Model(fields), ""
+        except LookupError as le:
+            return None, f"[Model] {nm}: {le!s}"
+    try:
+        return Component(fields), ""
+    except Exception as err:  # pylint: disable=broad-exception-caught
+        return None, f"[Component] {nm}: {err!s}"
 
 
 @generate("[Model]")
-def model():
-    "Parse [Model]."
+def model_fields():
+    "Parse [Model] contents, without constructing a ``Model``."
     nm = yield name << ignore
     if DEBUG:
         print(f"Parsing model: {nm}...", flush=True)
     res = yield many1(node(Model_keywords, IBIS_keywords, debug=DEBUG))
     if DEBUG:
         print(f"[Model] {nm} contains: {dict(res).keys()}", flush=True)
-    try:
-        theModel = Model(dict(res))
-    except LookupError as le:
-        return fail_with(f"[Model] {nm}: {le!s}")
+    return (nm, _model_dict(res))
+
+
+@generate("[Model]")
+def model():
+    "Parse [Model]."
+    nm, fields = yield model_fields
+    theModel, err = construct_section("model", nm, fields)
+    if err:
+        return fail_with(err)
     return {nm: theModel}
 
 
@@ -466,21 +659,54 @@ def pin(rlcs):
     return fn
 
 
+# Bulk [Pin] table parsing:
+# Large BGA components have thousands of pins; so, the whole table is matched by a single regular expression,
+# rather than running ``pin()`` (several parsers per pin) once per row.
+_PIN_NAME = r"[_a-zA-Z0-9/\.()#-]+"
+_pin_row = re.compile(rf"({_PIN_NAME})\s+({_PIN_NAME})\s+({_PIN_NAME})([^\[\n\r]*)(?:\s+|\|.*)*")
+_pin_rows = re.compile(rf"(?:{_PIN_NAME}\s+{_PIN_NAME}\s+{_PIN_NAME}[^\[\n\r]*(?:\s+|\|.*)*)+")
+_ibis_number = re.compile(r"([-+]?[0-9]*\.?[0-9]+)(?:([eE][-+]?[0-9]+)|([TknGmpMuf])[a-zA-Z]*)?[a-zA-Z]*")
+
+
+def _pin_rlcs(rlcs: list[str], rem_line: str) -> dict[str, float]:
+    "The per pin R/L/C values (if any) given in the remainder of a [Pin] table row, keyed by column name."
+    vals = rem_line.split("|", 1)[0].split()[:3]
+    if not rlcs or len(vals) < 3:
+        return {}
+    rslt = {}
+    for rlc, val in zip(rlcs, vals):
+        match = _ibis_number.fullmatch(val)
+        if match:  # Otherwise, "NA" (i.e. - use the [Package] value).
+            rslt[rlc] = float(match.group(1) + (match.group(2) or IBIS_num_suf.get(match.group(3), "")))
+    return rslt
+
+
+@Parser
+def pin_rows(txt: Sequence[Any], ix: int) -> Value:
+    """
+    Parse the rows of a [Pin] table, in bulk, returning them as a list of (pin, signal, model, remainder) tuples.
+
+    Notes:
+        1. Accepts exactly the same input as ``many1(pin(...))``.
+    """
+    if not isinstance(txt, str) or (region := _pin_rows.match(txt, ix)) is None:
+        return Value.failure(ix, "Component Pin")
+    return Value.success(region.end(), _pin_row.findall(txt, ix, region.end()))
+
+
 @generate("[Component].[Pin]")
 def pins():
     "Parse [Component].[Pin]."
 
-    def filt(x):
-        (_, (mod, _)) = x
-        m = mod.upper()
-        return m not in ("POWER", "GND", "NC")
-
     # Parse the section header.
     yield (lexeme(string("signal_name")) << lexeme(string("model_name")))
     rlcs = yield optional(count(rlc, 3), [])
-    prs = yield many1(pin(rlcs))
-    prs_filt = list(filter(filt, prs))
-    return dict(prs_filt)
+    rows = yield pin_rows
+    return PinTable(
+        (nm, sig, mod, _pin_rlcs(rlcs, rem_line))
+        for nm, sig, mod, rem_line in rows
+        if mod.upper() not in ("POWER", "GND", "NC")
+    )
 
 
 Component_keywords = {
@@ -493,19 +719,23 @@ Component_keywords = {
 
 
 @generate("[Component]")
-def comp():
-    "Parse [Component]."
+def comp_fields():
+    "Parse [Component] contents, without constructing a ``Component``."
     nm = yield rest_line
     if DEBUG:
         print(f"Parsing component: {nm}", flush=True)
     res = yield many1(node(Component_keywords, IBIS_keywords, debug=DEBUG))
-    try:
-        Component(dict(res))
-    except LookupError as le:
-        return fail_with(f"[Component] {nm}: {le!s}")
-    except Exception as err:  # pylint: disable=broad-exception-caught
-        return fail_with(f"[Component] {nm}: {err!s}")
-    return {nm: Component(dict(res))}
+    return (nm, dict(res))
+
+
+@generate("[Component]")
+def comp():
+    "Parse [Component]."
+    nm, fields = yield comp_fields
+    theComp, err = construct_section("component", nm, fields)
+    if err:
+        return fail_with(err)
+    return {nm: theComp}
 
 
 @generate("[Model Selector]")
@@ -555,16 +785,178 @@ IBIS_kywrd_parsers.update(
 )
 
 
-@generate("IBIS File")
-def ibis_file() -> GenParser[Any]:
-    "Parse IBIS file."
-    res = yield ignore >> many1True(node(IBIS_kywrd_parsers, {}, debug=DEBUG)) << end
-    return res
+def ibis_file_parser(kywrd_parsers: dict[str, Parser]) -> Parser:
+    "Build an IBIS file parser, using the given top level keyword parsers."
+
+    @generate("IBIS File")
+    def fn() -> GenParser[Any]:
+        "Parse IBIS file."
+        res = yield ignore >> many1True(node(kywrd_parsers, {}, debug=DEBUG)) << end
+        return res
+
+    return fn
+
+
+ibis_file: Parser = ibis_file_parser(IBIS_kywrd_parsers)
+
+# Section indexing and lazy parsing:
+
+_keyword_start = re.compile(r"^\[([^\]\n\r]*)\]", re.MULTILINE)
+_section_name_parsers: dict[str, Parser] = {
+    "model": ignore >> name,
+    "component": ignore >> rest_line,
+    "model_selector": ignore >> name,
+}
+_section_parser: Parser = node(IBIS_kywrd_parsers, {})
+_section_fields_parser: Parser = node({"model": model_fields, "component": comp_fields}, {})
+
+
+@dataclass(frozen=True)
+class IbisSection:
+    """
+    A top level section of an IBIS file.
+
+    Sections begin with one of ``IBIS_keywords`` and extend up to (but excluding) the next one.
+    """
+
+    keyword: str  # Canonicalized and lower cased (e.g. - "model_selector").
+    name: Optional[str]  # Of [Model], [Component], and [Model Selector] sections; None otherwise, or if not found.
+    start: int  # Offset of the opening '[' of the keyword.
+    end: int  # Offset of the opening '[' of the next top level keyword, or the file length.
+
+
+def scan_ibis_file(ibis_file_contents_str: str) -> list[IbisSection]:
+    """
+    Index the top level sections of an IBIS file, without parsing them.
+
+    Args:
+        ibis_file_contents_str: The contents of the IBIS file, as a single string.
+
+    Returns:
+        The top level sections, in file order.
+
+    Notes:
+        1. This is a fast, regular expression based, scan,
+        which doesn't validate anything but the section names.
+    """
+
+    starts = []
+    for match in _keyword_start.finditer(ibis_file_contents_str):
+        kw = "_".join(re.split(r"[ _]", match.group(1).strip())).lower()
+        if kw in IBIS_keywords:
+            starts.append((match.start(), match.end(), kw))
+    sections = []
+    for n, (start, kw_end, kw) in enumerate(starts):
+        end = starts[n + 1][0] if n + 1 < len(starts) else len(ibis_file_contents_str)
+        sec_name = None
+        if kw in _section_name_parsers:
+            rslt = _section_name_parsers[kw](ibis_file_contents_str, kw_end)
+            if rslt.status:
+                sec_name = rslt.value
+        sections.append(IbisSection(kw, sec_name, start, end))
+    return sections
+
+
+def parse_section(ibis_file_contents_str: str, section: IbisSection) -> tuple[str, Any]:
+    """
+    Parse one top level section of an IBIS file.
+
+    Args:
+        ibis_file_contents_str: The contents of the IBIS file, as a single string.
+        section: The section to parse (see ``scan_ibis_file()``).
+
+    Returns:
+        The same (keyword, value) pair produced, for the section, by a parse of the entire file.
+
+    Raises:
+        ParseError: If the section fails to parse. (Error locations are relative to the entire file.)
+    """
+    rslt = _section_parser(ibis_file_contents_str, section.start)
+    if not rslt.status:
+        raise ParseError(rslt.expected, ibis_file_contents_str, rslt.index)
+    return rslt.value
+
+
+class LazySections(Mapping):
+    """
+    Read-only dictionary of [Model] or [Component] sections, keyed by name, each parsed upon first access.
+
+    Notes:
+        1. A section which fails to parse raises ``ParseError`` upon access.
+    """
+
+    def __init__(self, ibis_file_contents_str: str, entries: Mapping[str, Any]):
+        """
+        Args:
+            ibis_file_contents_str: The contents of the IBIS file, as a single string.
+            entries: The sections, keyed by name, in file order.
+                (Values other than ``IbisSection`` are taken to be already parsed.)
+        """
+        self._text = ibis_file_contents_str
+        self._entries: dict[str, Any] = dict(entries)
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._entries[key]
+        if isinstance(value, IbisSection):
+            _, parsed = parse_section(self._text, value)
+            value = self._entries[key] = parsed[key]
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries  # Without parsing, unlike the ``Mapping`` default.
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self):
+        return f"LazySections({list(self._entries)!r})"
+
+    def is_parsed(self, key: str) -> bool:
+        "Has the named section been parsed yet?"
+        return not isinstance(self._entries[key], IbisSection)
+
+
+def _section_body(
+    sections: list[IbisSection], kywrd_parser: Parser, wanted: Optional[set[str]], lazy: bool
+) -> Parser:
+    """
+    Parser for the body of a [Model] or [Component] section, which uses the section index to:
+
+        - skip the section entirely, if it isn't wanted, or
+        - jump to the end of the section, returning the section itself, for later parsing, when ``lazy``,
+
+    and otherwise parses the section, using ``kywrd_parser``.
+
+    Sections whose names could not be found by ``scan_ibis_file()`` are always parsed, using ``kywrd_parser``,
+    so that any errors are reported as usual.
+    """
+    starts = [section.start for section in sections]
+
+    @Parser
+    def fn(txt, ix):
+        section = sections[bisect_right(starts, ix) - 1]
+        if section.name is None:
+            return kywrd_parser(txt, ix)
+        if wanted is not None and section.name not in wanted:
+            return Value.success(section.end, {})
+        if lazy:
+            return Value.success(section.end, {section.name: section})
+        return kywrd_parser(txt, ix)
+
+    return fn
 
 
 def parse_ibis_file(
     ibis_file_contents_str: str,
-    debug: bool = False
+    debug: bool = False,
+    cache: Optional[bool | DiskCache] = None,
+    lazy: bool = False,
+    models: Optional[Iterable[str]] = None,
+    components: Optional[Iterable[str]] = None,
+    workers: Optional[int] = None,
 ) -> tuple[str, dict[str, Any]]:
     """
     Parse the contents of an IBIS file.
@@ -575,6 +967,19 @@ def parse_ibis_file(
     Keyword Args:
         debug: Output debugging info to console when ``True``.
             Default = ``False``
+        cache: Cache of parse results, keyed by file contents and package version (see ``util.cache.parse_cache()``).
+            Default = ``None`` (Means "Use the default cache, if the ``PYIBISAMI_PARSE_CACHE`` env. variable is set.")
+        lazy: Defer the parsing of each [Model] and [Component] section until it is first accessed,
+            in which case the ``models`` and ``components`` dictionaries returned are ``LazySections``.
+            Default = ``False``
+        models: Names of the [Model]s (and/or [Model Selector]s, standing for all of their models) to parse;
+            all others are skipped, without being parsed.
+            Default = ``None`` (Means "Parse all models.")
+        components: Names of the [Component]s to parse; all others are skipped, without being parsed.
+            Default = ``None`` (Means "Parse all components.")
+        workers: Number of worker processes among which to divide the parsing of the [Model] and [Component] sections.
+            (Ignored in lazy mode.)
+            Default = ``None`` (Means "Parse everything in this process.")
 
     Example:
         ::
@@ -588,18 +993,129 @@ def parse_ibis_file(
 
         - A message describing the nature of any parse failure that occured.
         - A dictionary containing keyword definitions (empty upon failure).
+
+    Notes:
+        1. Only successful, complete, parses are cached, and the cache is bypassed
+        in debug and lazy modes, as well as when selecting models/components.
+        2. In lazy mode, errors in [Model] and [Component] sections are only reported
+        (as a ``ParseError``) when the section is accessed.
+        3. When using ``workers``, the results (including their ordering) are identical to those of a serial parse.
+        Should any section fail to parse, the file is re-parsed serially, so that the usual error message is returned.
     """
 
     global DEBUG  # pylint: disable=W0603
     DEBUG = debug
 
+    selective = lazy or models is not None or components is not None
+    parse_results = None if (debug or selective) else parse_cache(cache)
+    if parse_results is not None:
+        cache_key = make_key("IBIS", __version__, ibis_file_contents_str)
+        cached = parse_results.get_object(cache_key)
+        if cached is not None:
+            return "Success!", _from_cacheable(cached)
+
+    concurrent = bool(workers) and not lazy
+    wanted_models = None if models is None else set(models)
+    wanted_comps = None if components is None else set(components)
+    parser = ibis_file
+    if selective or concurrent:
+        sections = scan_ibis_file(ibis_file_contents_str)
+        if wanted_models:
+            for section in sections:
+                if section.keyword == "model_selector" and section.name in wanted_models:
+                    try:
+                        _, selector = parse_section(ibis_file_contents_str, section)
+                    except ParseError:
+                        continue  # Reported by the full parse, below.
+                    wanted_models.update(mname for mname, _ in selector[section.name])
+        parser = ibis_file_parser({
+            **IBIS_kywrd_parsers,
+            "model": _section_body(sections, model, wanted_models, lazy or concurrent),
+            "component": _section_body(sections, comp, wanted_comps, lazy or concurrent),
+        })
     try:
-        nodes = ibis_file.parse_strict(ibis_file_contents_str)  # Parse must consume the entire file.
+        nodes = parser.parse_strict(ibis_file_contents_str)  # Parse must consume the entire file.
         if debug:
             print("Parsed nodes:\n", nodes, flush=True)
     except ParseError as pe:
-        return str(pe), {}
+        if not concurrent:
+            return str(pe), {}
+        nodes = None
+
+    kw_dict: Optional[dict[str, Any]] = None
+    if nodes is not None:
+        kw_dict = _collect(nodes)
+        if concurrent and workers:
+            kw_dict = _parse_sections_concurrently(ibis_file_contents_str, kw_dict, workers)
+    if kw_dict is None:  # Something failed to parse concurrently; re-parse serially, for the usual error message.
+        return parse_ibis_file(
+            ibis_file_contents_str, debug=debug, cache=False, models=wanted_models, components=wanted_comps
+        )
+    if lazy:
+        kw_dict["models"] = LazySections(ibis_file_contents_str, kw_dict["models"])
+        kw_dict["components"] = LazySections(ibis_file_contents_str, kw_dict["components"])
+    if parse_results is not None:
+        parse_results.put_object(cache_key, _to_cacheable(kw_dict))
+    return "Success!", kw_dict
 
+
+def _parse_section_fields(section_text: str) -> Optional[tuple[str, str, dict[str, Any]]]:
+    """
+    Parse the contents of a single [Model] or [Component] section, given as a separate string.
+
+    Returns:
+        The section keyword, name, and contents, or None if the section doesn't parse in its entirety.
+
+    Notes:
+        1. This runs in the worker processes of ``_parse_sections_concurrently()``;
+        so, it returns only picklable data, leaving the construction of the ``Model``/``Component`` to the caller.
+    """
+    rslt = _section_fields_parser(section_text, 0)
+    if not rslt.status or rslt.index != len(section_text):
+        return None
+    kw, (nm, fields) = rslt.value
+    return kw, nm, fields
+
+
+def _parse_sections_concurrently(
+    ibis_file_contents_str: str, kw_dict: dict[str, Any], workers: int
+) -> Optional[dict[str, Any]]:
+    """
+    Parse the [Model] and [Component] sections, left as ``IbisSection`` placeholders by a lazy parse,
+    in a pool of worker processes.
+
+    Returns:
+        ``kw_dict``, with its "models" and "components" filled in, or None if any section failed to parse.
+    """
+    placeholders = [
+        (group, name, section)
+        for group in ("models", "components")
+        for name, section in kw_dict[group].items()
+        if isinstance(section, IbisSection)
+    ]
+    texts = [ibis_file_contents_str[section.start:section.end] for _, _, section in placeholders]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(_parse_section_fields, texts, chunksize=max(1, len(texts) // (4 * workers))))
+    parsed: dict[str, dict[str, Any]] = {"models": {}, "components": {}}
+    for (group, name, _), rslt in zip(placeholders, results):
+        if rslt is None:
+            return None
+        kw, nm, fields = rslt
+        obj, err = construct_section(kw, nm, fields)
+        if err:
+            return None
+        parsed[group][name] = {nm: obj}
+    rslt_dict = dict(kw_dict)
+    for group in ("models", "components"):
+        entries: dict[str, Any] = {}
+        for name, value in kw_dict[group].items():
+            entries.update(parsed[group].get(name, {name: value}))
+        rslt_dict[group] = entries
+    return rslt_dict
+
+
+def _collect(nodes: list[tuple[str, Any]]) -> dict[str, Any]:
+    "Gather the parsed top level (keyword, value) pairs into a single dictionary."
     kw_dict = {}
     components = {}
     models = {}
@@ -620,4 +1136,21 @@ def parse_ibis_file(
             "model_selectors": model_selectors,
         }
     )
-    return "Success!", kw_dict
+    return kw_dict
+
+
+def _to_cacheable(kw_dict: dict[str, Any]) -> dict[str, Any]:
+    "Replace the ``Component``/``Model`` instances (which hold GUI elements) with their parsed keyword dictionaries."
+    # pylint: disable=protected-access
+    rslt = dict(kw_dict)
+    rslt["components"] = {name: comp._subDict for name, comp in kw_dict["components"].items()}
+    rslt["models"] = {name: model._subDict for name, model in kw_dict["models"].items()}
+    return rslt
+
+
+def _from_cacheable(kw_dict: dict[str, Any]) -> dict[str, Any]:
+    "Inverse of ``_to_cacheable()``."
+    rslt = dict(kw_dict)
+    rslt["components"] = {name: Component(sub_dict) for name, sub_dict in kw_dict["components"].items()}
+    rslt["models"] = {name: Model(sub_dict) for name, sub_dict in kw_dict["models"].items()}
+    return rslt
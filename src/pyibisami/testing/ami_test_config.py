@@ -165,7 +165,7 @@ def _compare_ir(
     try:
         golden_ir  = _load_numeric_file(ibis_dir / config["golden_ir_file"])
         golden_amp = golden_ir[:, 1] if golden_ir.ndim == 2 else golden_ir
-        init_out   = np.array(ami_model.initOut)
+        init_out   = ami_model.initOut_array
         n          = min(len(init_out), len(golden_amp))
         diff       = init_out[:n] - golden_amp[:n]
         ir_max, ir_rms = _diff_metrics(diff)
@@ -280,7 +280,7 @@ def run_ami_test_config(
             num_aggressors=num_aggressors,
         )
         # Use the property setter so the ctypes array is built correctly.
-        initializer.channel_response = ir_amplitudes.tolist()
+        initializer.channel_response = ir_amplitudes
         ami_model.initialize(initializer)
     except Exception as exc:
         return AmiTestConfigResult(
@@ -456,7 +456,9 @@ def run_all_ami_test_configs(
               help="Absolute tolerance for impulse-response comparison.")
 @click.option("--tol-wave", default=1e-6, show_default=True,
               help="Absolute tolerance for waveform comparison.")
-def main(ibis_file, model_name, config, tol_ir, tol_wave):
+@click.option("--parse-cache", is_flag=True,
+              help="Reuse cached IBIS/AMI file parse results from previous runs (see `PYIBISAMI_PARSE_CACHE`).")
+def main(ibis_file, model_name, config, tol_ir, tol_wave, parse_cache):  # pylint: disable=too-many-arguments
     """Run [AMI Test Configuration] blocks embedded in an IBIS file (IBIS 8.0 §10.11).
 
     Parses IBIS_FILE, locates the target model, then calls AMI_Init() (and
@@ -465,17 +467,25 @@ def main(ibis_file, model_name, config, tol_ir, tol_wave):
 
     Exits with status 1 if any configuration fails.
     """
-    from ..ibis.parser import parse_ibis_file  # local import to avoid circular deps at module load
+    from ..ibis.parser import parse_ibis_file, scan_ibis_file  # local import to avoid circular deps at module load
 
     ibis_path = Path(ibis_file).resolve()
     ibis_dir  = ibis_path.parent
 
-    status, ibis_dict = parse_ibis_file(ibis_path.read_text(encoding="utf-8"))
+    # When a model is named, only that one is parsed; the others are skipped by the section scanner.
+    ibis_text = ibis_path.read_text(encoding="utf-8")
+    status, ibis_dict = parse_ibis_file(
+        ibis_text, cache=parse_cache or None, models=None if model_name is None else [model_name])
     if status != "Success!":
         click.echo(f"ERROR: failed to parse {ibis_path}: {status}", err=True)
         sys.exit(1)
 
     models = ibis_dict.get("models", {})
+    if model_name is not None and model_name not in models:
+        available = [section.name for section in scan_ibis_file(ibis_text) if section.keyword == "model"]
+        click.echo(f"ERROR: model '{model_name}' not found (available: {', '.join(available)}).", err=True)
+        sys.exit(1)
+
     if not models:
         click.echo("ERROR: no [Model] sections found in the IBIS file.", err=True)
         sys.exit(1)
@@ -490,10 +500,6 @@ def main(ibis_file, model_name, config, tol_ir, tol_wave):
                 err=True)
             sys.exit(1)
 
-    if model_name not in models:
-        click.echo(f"ERROR: model '{model_name}' not found (available: {', '.join(models)}).", err=True)
-        sys.exit(1)
-
     model_obj = models[model_name]
     if not model_obj.test_configs:
         click.echo(f"No [AMI Test Configuration] blocks found in model '{model_name}'.")
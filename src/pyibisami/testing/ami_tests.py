@@ -24,6 +24,7 @@ from reportlab.platypus     import Flowable, Image, ListFlowable, Paragraph
 from ..ami.model        import AMIModel, OUT_RESP_INIT
 from ..ami.parser       import AMIParamConfigurator
 from ..ibis.model       import Model
+from ..util.cache       import DiskCache
 from ..util.plot        import plt
 from ..util.reportlab   import (
     bold, fixed, page_break, spacer, preformatted,
@@ -273,7 +274,7 @@ class AmiTestLinearityChecker(AmiTester):
                     plt.figure(figsize=(fig_x, fig_y))
                     plt.plot(t * 1e9, resp_to_sum, label="Response to Sum")
                     # Test model against half channel response.
-                    initializer.channel_response = [x / 10 for x in initializer.channel_response]
+                    initializer.channel_response = initializer.channel_response_array / 10
                     ami_model.initialize(initializer)
                     model_resps = ami_model.get_responses(nbits=test_def.sim_params["nbits"])
                     t, _, _, sum_of_resps, _, _ = model_resps[OUT_RESP_INIT]
@@ -365,7 +366,10 @@ class AmiTestGetwaveInputLength(AmiTester):
 def test_ami_model(
     model_name: str, model: Model,
     ibis_file: Path, test_sweeps_dir: Path,
-    f_max: float = 40e9, f_step: float = 10e6
+    f_max: float = 40e9, f_step: float = 10e6,
+    init_cache: Optional[bool | DiskCache] = None,
+    instrument: Optional[bool] = None,
+    parse_cache: Optional[bool | DiskCache] = None,
 ) -> list[Flowable]:
     """
     Test an individual IBIS-AMI model.
@@ -383,6 +387,12 @@ def test_ami_model(
             Default: 40 GHz
         f_step: Frequency increment (Hz).
             Default: 10 MHz
+        init_cache: Cache of ``AMI_Init()`` results (see ``AMIModel``).
+            Default: None (Means "Use the default cache, if the ``PYIBISAMI_INIT_CACHE`` env. variable is set.")
+        instrument: Report AMI call timing/throughput statistics (see ``AMIModel``).
+            Default: None (Means "Report them, if the ``PYIBISAMI_INSTRUMENT`` env. variable is set.")
+        parse_cache: Cache of AMI file parse results (see ``parse_ami_file_contents()``).
+            Default: None (Means "Use the default cache, if the ``PYIBISAMI_PARSE_CACHE`` env. variable is set.")
 
     Returns:
         A list of *ReportLab* ``Flowable``s describing the test results.
@@ -423,12 +433,12 @@ def test_ami_model(
     ibis_file_dir = ibis_file.parent
     dll_file, ami_file = [ibis_file_dir / Path(f) for f in ami_files]
     try:
-        ami_model = AMIModel(str(dll_file))
+        ami_model = AMIModel(str(dll_file), init_cache=init_cache, instrument=instrument)
     except Exception as err:
         return [Paragraph(str(err), P), Paragraph(f"Error loading AMI DLL/SO: {dll_file}!", P)]
     try:
         with open(ami_file, mode="r", encoding="utf-8") as pfile:
-            pcfg = AMIParamConfigurator(pfile.read())
+            pcfg = AMIParamConfigurator(pfile.read(), cache=parse_cache)
         if pcfg.ami_parsing_errors:
             flowables.append(
                 Paragraph(preformatted(f"Non-fatal AMI file parsing errors:\n{pcfg.ami_parsing_errors}"),
@@ -503,4 +513,8 @@ def test_ami_model(
     for tester in testers:
         flowables.extend(tester.ami_tst())
 
+    if ami_model.stats is not None:
+        flowables.append(Paragraph("AMI Call Statistics", H2))
+        flowables.append(Paragraph(preformatted(ami_model.stats.summary()), P))
+
     return flowables
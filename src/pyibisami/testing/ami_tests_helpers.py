@@ -17,8 +17,8 @@ import numpy as np
 from matplotlib.figure      import Figure
 from reportlab.lib.units    import inch
 from reportlab.platypus     import Flowable, Image, Paragraph, Spacer
-from scipy.signal           import convolve
 
+from ..common           import convolve
 from ..ami.model        import AMIModel, AMIModelInitializer
 from ..ami.parser       import AMIParamConfigurator
 
@@ -151,7 +151,7 @@ class AmiTestHelperGetwaveInputLength(AmiTestHelper):
     ) -> Figure:
 
         sample_interval = initializer.sample_interval
-        channel_response = np.array(initializer.channel_response)
+        channel_response = initializer.channel_response_array
         bit_time = initializer.bit_time
         nspui = int(bit_time / sample_interval)
         if "Ignore_Bits" in initializer.ami_params:
@@ -17,6 +17,7 @@ from reportlab.lib.units    import inch
 from reportlab.platypus     import Flowable, Paragraph, Spacer
 
 from ..ibis.file import IBISModel
+from ..util.cache import DiskCache
 from ..util.reportlab import preformatted, page_break, styles, H1
 
 from .ami_tests import test_ami_model
@@ -28,7 +29,9 @@ spacer = Spacer(1, 0.25 * inch)
 
 def get_ibis_contents(
     ibis_file: Path,
-    debug: bool = False
+    debug: bool = False,
+    models: Optional[list[str]] = None,
+    cache: Optional[bool | DiskCache] = None,
 ) -> tuple[IBISModel, list[Flowable]]:
     """
     List the components and models available in an IBIS model file.
@@ -39,6 +42,10 @@ def get_ibis_contents(
     Keyword Args:
         debug: Operate in debugging mode when ``True``.
             Default: ``False``
+        models: Only parse these models (see ``IBISModel``).
+            Default: ``None`` (Means "Parse all models.")
+        cache: Cache of parse results (see ``IBISModel``).
+            Default: ``None`` (Means "Use the default cache, if the ``PYIBISAMI_PARSE_CACHE`` env. variable is set.")
 
     Returns:
         A pair containing
@@ -51,7 +58,7 @@ def get_ibis_contents(
 
     # Attempt to parse `*.ibs` file.
     try:
-        ibis_model = IBISModel(str(ibis_file), gui=False, debug=debug)
+        ibis_model = IBISModel(str(ibis_file), gui=False, debug=debug, cache=cache, models=models)
     except Exception as err:
         raise RuntimeError(f"An error occurred while trying to read/parse the IBIS model file: {ibis_file}") from err
 
@@ -86,7 +93,10 @@ def test_ami_models(
     ami_model_names: list[str],
     test_sweeps_dir: Path,
     model_name: Optional[str] = None,
-    debug: bool = False
+    debug: bool = False,
+    init_cache: Optional[bool | DiskCache] = None,
+    instrument: Optional[bool] = None,
+    parse_cache: Optional[bool | DiskCache] = None,
 ) -> list[Flowable]:
     """
     Test a subset of the IBIS-AMI models in the ``*.ibs`` file.
@@ -104,6 +114,12 @@ def test_ami_models(
             Default = ``None`` (Means test all IBIS-AMI models found.)
         debug: Include extra debugging output when ``True``.
             Default = ``False``
+        init_cache: Cache of ``AMI_Init()`` results (see ``AMIModel``).
+            Default = ``None`` (Means "Use the default cache, if the ``PYIBISAMI_INIT_CACHE`` env. variable is set.")
+        instrument: Report AMI call timing/throughput statistics (see ``AMIModel``).
+            Default = ``None`` (Means "Report them, if the ``PYIBISAMI_INSTRUMENT`` env. variable is set.")
+        parse_cache: Cache of AMI file parse results (see ``parse_ami_file_contents()``).
+            Default = ``None`` (Means "Use the default cache, if the ``PYIBISAMI_PARSE_CACHE`` env. variable is set.")
 
     Returns:
         The list of *ReportLab* ``Flowable``s describing the testing results.
@@ -124,7 +140,10 @@ def test_ami_models(
 
         flowables.append(Paragraph(f"Model: {model_name}", H1))
         model = ibis_model.model_dict['models'][model_name]
-        flowables.extend(test_ami_model(model_name, model, ibis_file, test_sweeps_dir))
+        flowables.extend(test_ami_model(
+            model_name, model, ibis_file, test_sweeps_dir,
+            init_cache=init_cache, instrument=instrument, parse_cache=parse_cache,
+        ))
         flowables.append(page_break)
         return flowables
 
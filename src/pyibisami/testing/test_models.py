@@ -25,9 +25,11 @@ from reportlab.platypus import (
     Paragraph, Spacer)
 from reportlab.platypus.tableofcontents import TableOfContents
 
+from ..util.cache       import DiskCache
 from ..util.reportlab   import P, bold, preformatted, title_page
 
-from .ibis_file_tests   import test_ami_models, get_ibis_contents
+# Note: The test harness (``.ibis_file_tests``) pulls in *Matplotlib* and *SciPy*;
+#       so, it is imported by ``test_ibis_ami_models()``, in order to keep ``test-model --help`` snappy.
 
 # Define the PDF document dimensions and grab some pre-defined styles.
 PAGE_WIDTH, PAGE_HEIGHT = letter
@@ -76,7 +78,10 @@ def test_ibis_ami_models(
     ibis_file: Path, test_sweeps_dir: Path,
     model_name: Optional[str] = None,
     max_models_per_file: int = 2,
-    debug: bool = False
+    debug: bool = False,
+    init_cache: Optional[bool | DiskCache] = None,
+    instrument: Optional[bool] = None,
+    parse_cache: Optional[bool | DiskCache] = None,
 ) -> None:
     """
     Test some subset of the IBIS-AMI models in a ``*.ibs`` file.
@@ -92,8 +97,16 @@ def test_ibis_ami_models(
             Default: 2
         debug: Include debugging output when ``True``.
             Default: ``False``
+        init_cache: Cache of ``AMI_Init()`` results (see ``AMIModel``).
+            Default: None (Means "Use the default cache, if the ``PYIBISAMI_INIT_CACHE`` env. variable is set.")
+        instrument: Report AMI call timing/throughput statistics (see ``AMIModel``).
+            Default: None (Means "Report them, if the ``PYIBISAMI_INSTRUMENT`` env. variable is set.")
+        parse_cache: Cache of IBIS/AMI file parse results (see ``IBISModel``).
+            Default: None (Means "Use the default cache, if the ``PYIBISAMI_PARSE_CACHE`` env. variable is set.")
     """
 
+    from .ibis_file_tests import get_ibis_contents, test_ami_models  # pylint: disable=import-outside-toplevel
+
     ibis_file_dir = ibis_file.parent
     pdf_filename = str((ibis_file_dir / (ibis_file.stem + "_test_results")).with_suffix('.pdf'))
 
@@ -103,7 +116,10 @@ def test_ibis_ami_models(
     doc.addPageTemplates([template])
     pages = title_page(ibis_file)
 
-    ibis_model, _ = get_ibis_contents(ibis_file, debug=debug)
+    # When a model is named, only that one is parsed; the others are skipped by the section scanner.
+    ibis_model, _ = get_ibis_contents(
+        ibis_file, debug=debug, models=[model_name] if model_name else None, cache=parse_cache
+    )
     if 'models' not in ibis_model.model_dict or len(ibis_model.model_dict['models']) == 0:
         raise RuntimeError("The IBIS file contains no model definitions!")
 
@@ -132,7 +148,8 @@ def test_ibis_ami_models(
     pages.extend(
         test_ami_models(
             ibis_file, ibis_model, ami_model_names,
-            test_sweeps_dir, model_name=model_name, debug=debug)
+            test_sweeps_dir, model_name=model_name, debug=debug,
+            init_cache=init_cache, instrument=instrument, parse_cache=parse_cache)
     )
     doc.multiBuild(pages)
 
@@ -146,16 +163,27 @@ def test_ibis_ami_models(
               help='Directory containing test configuration sweeps.',
               )
 @click.option("--debug", "-d", is_flag=True, help="Provide extra debugging information.")
+@click.option("--init-cache", is_flag=True,
+              help="Reuse cached AMI_Init() results from previous runs (see `PYIBISAMI_INIT_CACHE`).")
+@click.option("--parse-cache", is_flag=True,
+              help="Reuse cached IBIS/AMI file parse results from previous runs (see `PYIBISAMI_PARSE_CACHE`).")
+@click.option("--instrument", is_flag=True,
+              help="Include AMI call timing/throughput statistics in the report (see `PYIBISAMI_INSTRUMENT`).")
 @click.argument("ibis_file", type=click.Path(exists=True))
 @click.version_option(package_name="PyIBIS-AMI")
-def main(ibis_file, model, params, debug):
+def main(ibis_file, model, params, debug, init_cache, parse_cache, instrument):  # pylint: disable=too-many-arguments
     ibis_file_path = Path(ibis_file).resolve()
     if not ibis_file_path.exists():
         raise RuntimeError(f"IBIS file `{ibis_file_path}` does not exist!")
     test_sweeps_dir = Path(params).resolve()
     test_sweeps_dir.mkdir(parents=True, exist_ok=True)
     try:
-        test_ibis_ami_models(ibis_file_path, test_sweeps_dir, model_name=model, debug=debug)
+        test_ibis_ami_models(
+            ibis_file_path, test_sweeps_dir, model_name=model, debug=debug,
+            init_cache=init_cache or None,  # An absent flag defers to the environment.
+            instrument=instrument or None,
+            parse_cache=parse_cache or None,
+        )
     except RuntimeError as err:
         error_msg = traceback.format_exception_only(type(err), err)[-1].strip()
         print(error_msg)
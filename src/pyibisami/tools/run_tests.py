@@ -17,7 +17,6 @@ import em
 
 from pyibisami.ami.model    import AMIModel
 from pyibisami.common       import TestSweep
-from pyibisami.util.plot    import plot_name, color_picker
 
 
 def expand_params(input_parameters: str) -> list[TestSweep]:
@@ -62,6 +61,9 @@ def run_tests(**kwargs):  # pylint: disable=too-many-locals
     """Provide a thin wrapper around the click interface so that we can test
     the operation."""
 
+    # Imported here, rather than at module level, since it pulls in *Matplotlib*.
+    from pyibisami.util.plot import color_picker, plot_name  # pylint: disable=import-outside-toplevel
+
     # Fetch options and cast into local independent variables.
     test_dir = Path(kwargs["test_dir"]).resolve()
     ref_dir = Path(kwargs["ref_dir"]).resolve()
@@ -8,10 +8,186 @@ Original Date:   April 14, 2026
 Copyright (c) 2026 David Banas; All rights reserved World wide.
 """
 
+import re
+from collections.abc import Callable, Iterable, Sized
+from typing import Any, Optional
+
 import numpy as np
 
 from ..common     import Rvec
-from ..ami.parser import ami_parse
+from ..ami.parser import ami_parse, int2tap
+
+OutParamPath = tuple[str, ...]  # Node names, from (but excluding) the root, down to a leaf.
+
+# Token patterns for the output parameter string templates (see ``_OutParamTemplate``).
+# They deliberately recognize only the (common) subset of the AMI grammar
+# for which splitting on whitespace and parentheses yields the same atoms as ``ami_parse()``;
+# anything else simply falls back to a full parse.
+_NUMBER = r"[-+]?[0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?"
+_ATOM = rf'{_NUMBER}|[a-zA-Z_][^\s()]*|"[^"]*"'
+_token = re.compile(r'\s*(\(|\)|"[^"]*"|[^\s()]+)')
+_is_name = re.compile(r"[-+]?[0-9]+|[0-9a-zA-Z_][^\s()]*").fullmatch
+_is_tap = re.compile(r"[-+]?[0-9]+").fullmatch
+_is_atom = re.compile(_ATOM).fullmatch
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _lookup(nodes: list, path: OutParamPath) -> float:
+    "First value of the leaf at ``path`` in a parsed output parameter tree, or NaN if there is no such leaf."
+    values: Any = nodes
+    for name in path:
+        for node in values:
+            if isinstance(node, tuple) and node[0] == name:
+                values = node[1]
+                break
+        else:
+            return np.nan
+    return _to_float(values[0]) if values else np.nan
+
+
+class _OutParamTemplate:  # pylint: disable=too-few-public-methods
+    """
+    Compiled regular expression matching output parameter strings having the same structure as an example one,
+    with capture groups at the values of the requested leaves.
+
+    Models typically print the same output parameters, in the same order and format,
+    on every call to ``AMI_GetWave()``, with only the numeric values changing, which makes one ``re.match()`` per string sufficient,
+    in place of a full parse.
+    """
+
+    def __init__(self, text: str, paths: list[OutParamPath]):
+        """
+        Args:
+            text: Example output parameter string (typically, the first one returned).
+            paths: Paths to the leaves to be extracted.
+
+        Raises:
+            ValueError: If ``text`` cannot be templated.
+
+        Notes:
+            1. Leaves missing from ``text`` are simply reported as NaN by ``extract()``,
+            since any string matching the template is missing them, too.
+        """
+        tokens = _token.findall(text)
+        wanted = set(paths)
+        pieces = []
+        captures: dict[tuple[str, ...], int] = {}
+        stack: list[tuple[str, ...]] = []
+        pos = 0
+        while pos < len(tokens):
+            tok = tokens[pos]
+            if tok == "(":
+                if pos + 1 >= len(tokens) or not _is_name(tokens[pos + 1]):
+                    raise ValueError("Malformed node name.")
+                name = tokens[pos + 1]
+                path = (stack[-1] + (int2tap(name) if _is_tap(name) else name,)) if stack else ()
+                stack.append(path)
+                pieces.append(r"\s*\(\s*" + re.escape(name) + r"(?=[\s()])")
+                first_value = True
+                pos += 2
+                continue
+            if tok == ")":
+                if not stack:
+                    raise ValueError("Unbalanced parentheses.")
+                stack.pop()
+                pieces.append(r"\s*\)")
+                first_value = False
+                if not stack:
+                    break
+            else:
+                if len(stack) < 2 or not _is_atom(tok):  # Atoms may not exist at the root level.
+                    raise ValueError(f"Unsupported atom: {tok}")
+                path = stack[-1]
+                if first_value and path in wanted and path not in captures:
+                    captures[path] = len(captures)
+                    pieces.append(rf"\s+({_ATOM})(?=[\s()])")
+                else:
+                    pieces.append(rf"\s+(?:{_ATOM})(?=[\s()])")
+                first_value = False
+            pos += 1
+        if stack or not pieces:
+            raise ValueError("Unbalanced parentheses.")
+        self.regex = re.compile("".join(pieces))
+        self.groups = [captures.get(path) for path in paths]
+
+    def extract(self, text: str) -> Optional[list[float]]:
+        "Values of the leaves, or None if ``text`` does not match the template."
+        match = self.regex.match(text)
+        if match is None:
+            return None
+        values = match.groups()
+        return [np.nan if group is None else _to_float(values[group]) for group in self.groups]
+
+
+def extract_out_params(
+    ami_out_params: Iterable[str],
+    paths: Iterable[OutParamPath],
+    size_hint: Optional[int] = None,
+) -> dict[OutParamPath, Rvec]:
+    """
+    Extract time series of numeric output parameter values from a sequence of ``AMI_GetWave()`` output strings.
+
+    The structure of the first string is learned and compiled into a template,
+    which is then used to pull the requested values out of each subsequent string, without fully parsing it.
+    Strings not matching the template (e.g. - a model which adds a parameter mid-run) are fully parsed, instead.
+
+    Args:
+        ami_out_params: The output parameter strings, one per ``AMI_GetWave()`` call.
+            (May be any iterable, including a generator, which is consumed in a single pass.)
+        paths: The leaves to extract, given as tuples of parameter names, excluding the root name.
+            (e.g. - ``("dfe_tap1",)``, ``("cdr", "ui")``)
+
+    Keyword Args:
+        size_hint: Expected number of strings, used to preallocate the output arrays.
+            Default: None (Means "Use ``len(ami_out_params)``, if available.")
+
+    Returns:
+        Dictionary, keyed by path, of value vectors, with one element per string.
+        (Values missing from, or non-numeric in, a particular string are returned as NaN.)
+    """
+
+    paths = list(dict.fromkeys(paths))
+    if size_hint is None:
+        size_hint = len(ami_out_params) if isinstance(ami_out_params, Sized) else 1024
+    columns = np.full((len(paths), max(size_hint, 1)), np.nan)
+    template: Optional[_OutParamTemplate] = None
+    nrows = 0
+    for text in ami_out_params:
+        if nrows == columns.shape[1]:  # Out of room; double the allocation.
+            columns = np.concatenate([columns, np.full_like(columns, np.nan)], axis=1)
+        if nrows == 0:
+            try:
+                template = _OutParamTemplate(text, paths)
+            except ValueError:
+                template = None
+        values = template.extract(text) if template is not None else None
+        if values is None:
+            _, nodes = ami_parse(text)
+            values = [_lookup(nodes, path) for path in paths]
+        columns[:, nrows] = values
+        nrows += 1
+    return {path: columns[n, :nrows] for n, path in enumerate(paths)}
+
+
+def find_out_params(ami_out_param: str, predicate: Callable[[str], bool]) -> list[OutParamPath]:
+    """
+    Find the top level output parameters, in the given output parameter string, whose names satisfy a predicate.
+
+    Args:
+        ami_out_param: An output parameter string.
+        predicate: Function of the lower cased parameter name, returning True for the parameters of interest.
+
+    Returns:
+        Paths to the matching parameters, in order of appearance.
+    """
+    _, param_pairs = ami_parse(ami_out_param)
+    return [(key,) for key, _ in param_pairs if predicate(key.lower())]  # type: ignore
 
 
 def get_cdr_adaptation(ami_out_params: list[str]) -> Rvec:
@@ -25,25 +201,13 @@ def get_cdr_adaptation(ami_out_params: list[str]) -> Rvec:
         CDR adaptation if found; empty vector otherwise.
     """
 
-    cdr_ui_estimates: list[float] = []
-    cdr_ui_found: bool = False
-    _, param_pairs = ami_parse(ami_out_params[0])
-    for key, value_strs in param_pairs:  # type: ignore
-        key_lower_case = key.lower()
-        if "cdr" in key_lower_case and (
-           "ui" in key_lower_case or "per" in key_lower_case):
-            cdr_ui_estimates.append(float(value_strs[0]))
-            cdr_ui_found = True
-            break
-    if cdr_ui_found:
-        for _, param_pairs in map(ami_parse, ami_out_params[1:]):
-            for key, value_strs in param_pairs:  # type: ignore
-                key_lower_case = key.lower()
-                if "cdr" in key_lower_case and (
-                   "ui" in key_lower_case or "per" in key_lower_case):
-                    cdr_ui_estimates.append(float(value_strs[0]))
-                    break
-    return np.array(cdr_ui_estimates)
+    if not ami_out_params:
+        return np.array([])
+    paths = find_out_params(ami_out_params[0], lambda key: "cdr" in key and ("ui" in key or "per" in key))
+    if not paths:
+        return np.array([])
+    cdr_ui_estimates = extract_out_params(ami_out_params, paths[:1])[paths[0]]
+    return cdr_ui_estimates[~np.isnan(cdr_ui_estimates)]
 
 
 def get_dfe_adaptation(ami_out_params: list[str]) -> dict[str, Rvec]:
@@ -59,15 +223,10 @@ def get_dfe_adaptation(ami_out_params: list[str]) -> dict[str, Rvec]:
         (Dictionary keys are the dicovered parameter names.)
     """
 
-    dfe_tap_weights: dict[str, Rvec] = {}
-    _, param_pairs = ami_parse(ami_out_params[0])
-    for key, value_strs in param_pairs:  # type: ignore
-        key_lower_case = key.lower()
-        if "dfe" in key_lower_case and "tap" in key_lower_case:
-            dfe_tap_weights[key] = np.array([float(value_strs[0])])
-    for _, param_pairs in map(ami_parse, ami_out_params[1:]):
-        for key, value_strs in param_pairs:  # type: ignore
-            if key in dfe_tap_weights:
-                dfe_tap_weights[key] = np.append(dfe_tap_weights[key],
-                                                 float(value_strs[0]))
-    return dfe_tap_weights
+    if not ami_out_params:
+        return {}
+    paths = find_out_params(ami_out_params[0], lambda key: "dfe" in key and "tap" in key)
+    return {
+        path[0]: weights[~np.isnan(weights)]
+        for path, weights in extract_out_params(ami_out_params, paths).items()
+    }
@@ -0,0 +1,195 @@
+"""
+Content addressed, size bounded, on-disk cache of *NumPy* arrays.
+
+Entries are stored as ``.npz`` files, named by the hash of their key,
+and evicted in least recently used order, once the total size of the cache exceeds its limit.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+
+CACHE_DIR_ENV = "PYIBISAMI_CACHE_DIR"
+CACHE_SIZE_ENV = "PYIBISAMI_CACHE_MAX_BYTES"
+PARSE_CACHE_ENV = "PYIBISAMI_PARSE_CACHE"
+DEFAULT_MAX_BYTES = 1 << 30  # 1 GiB
+
+_file_digests: dict[tuple[str, int, int], str] = {}
+
+
+def default_cache_dir() -> Path:
+    "Root directory of all *PyIBIS-AMI* caches; may be overridden with the ``PYIBISAMI_CACHE_DIR`` env. variable."
+    return Path(os.environ.get(CACHE_DIR_ENV, Path.home() / ".cache" / "pyibisami"))
+
+
+def file_digest(filename: str | Path) -> str:
+    """
+    SHA-256 digest of a file's contents.
+
+    Digests are memoized, keyed on file name, size, and modification time,
+    so that large files (e.g. - model DLLs) are only hashed once per process.
+    """
+    path = Path(filename).resolve()
+    stat = path.stat()
+    memo_key = (str(path), stat.st_size, stat.st_mtime_ns)
+    if memo_key not in _file_digests:
+        hasher = hashlib.sha256()
+        with open(path, "rb") as file:
+            for block in iter(lambda: file.read(1 << 20), b""):
+                hasher.update(block)
+        _file_digests[memo_key] = hasher.hexdigest()
+    return _file_digests[memo_key]
+
+
+def make_key(*parts: str | bytes) -> str:
+    "Combine the given key parts into a single, fixed length, cache key."
+    hasher = hashlib.sha256()
+    for part in parts:
+        data = part.encode("utf-8") if isinstance(part, str) else bytes(part)
+        hasher.update(len(data).to_bytes(8, "little"))  # Prevents ambiguity between different part splits.
+        hasher.update(data)
+    return hasher.hexdigest()
+
+
+class DiskCache:
+    """
+    Size bounded, least recently used, on-disk cache of named *NumPy* array collections.
+    """
+
+    def __init__(self, directory: Optional[str | Path] = None, max_bytes: Optional[int] = None):
+        """
+        Keyword Args:
+            directory: Cache directory; created as needed.
+                Default: None (Means "Use ``default_cache_dir()``.")
+            max_bytes: Maximum total size of the cache, in bytes.
+                Default: None (Means "Use ``PYIBISAMI_CACHE_MAX_BYTES`` if set; 1 GiB otherwise.")
+        """
+        self.directory = Path(directory) if directory is not None else default_cache_dir()
+        if max_bytes is None:
+            max_bytes = int(os.environ.get(CACHE_SIZE_ENV, DEFAULT_MAX_BYTES))
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return f"DiskCache({str(self.directory)!r}, max_bytes={self.max_bytes})"
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.npz"
+
+    def get(self, key: str) -> Optional[dict[str, np.ndarray]]:
+        """
+        Fetch an entry from the cache.
+
+        Args:
+            key: The entry's key (see ``make_key()``).
+
+        Returns:
+            The dictionary of arrays stored under ``key``, or None if there is no such (readable) entry.
+        """
+        path = self._path(key)
+        try:
+            with np.load(path, allow_pickle=False) as entry:
+                rslt = {name: entry[name] for name in entry.files}
+            os.utime(path)  # Mark as recently used.
+        except (OSError, ValueError):  # Missing, or corrupted.
+            self.misses += 1
+            return None
+        self.hits += 1
+        return rslt
+
+    def put(self, key: str, **arrays) -> None:
+        """
+        Store an entry in the cache, evicting least recently used entries as needed.
+
+        Args:
+            key: The entry's key (see ``make_key()``).
+
+        Keyword Args:
+            Named arrays making up the entry.
+
+        Notes:
+            1. Caching is opportunistic; failure to write the cache (e.g. - a read-only directory) is not an error.
+        """
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as file:
+                    np.savez(file, **arrays)
+                os.replace(tmp_name, self._path(key))  # Atomic, so that concurrent readers never see partial entries.
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except OSError:
+            return
+        self.evict()
+
+    def get_object(self, key: str) -> Any:
+        """
+        Fetch a Python object, stored by ``put_object()``, from the cache.
+
+        Returns:
+            The object, or None if there is no such (readable) entry.
+
+        Notes:
+            1. The object is unpickled; so, only use cache directories which you trust.
+        """
+        entry = self.get(key)
+        if entry is None or "pickle" not in entry:
+            return None
+        try:
+            return pickle.loads(entry["pickle"].tobytes())
+        except Exception:  # pylint: disable=broad-exception-caught
+            return None  # e.g. - pickled by an incompatible version of some class.
+
+    def put_object(self, key: str, obj: Any) -> None:
+        "Store a (picklable) Python object in the cache."
+        self.put(key, pickle=np.frombuffer(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL), dtype=np.uint8))
+
+    def evict(self) -> None:
+        "Remove least recently used entries, until the total cache size is within its limit."
+        entries = []
+        for path in self.directory.glob("*.npz"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self) -> None:
+        "Remove all entries."
+        for path in self.directory.glob("*.npz"):
+            path.unlink(missing_ok=True)
+
+
+def parse_cache(cache: Optional[bool | DiskCache] = None) -> Optional[DiskCache]:
+    """
+    Resolve the ``cache`` argument of the IBIS and AMI file parsers.
+
+    Keyword Args:
+        cache: One of:
+            - None: Use the default parse cache,
+              if ``PYIBISAMI_PARSE_CACHE`` is set to a non-empty value other than "0".
+            - True/False: Use the default parse cache, or not.
+            - A ``DiskCache`` instance, to be used as is.
+
+    Returns:
+        The cache to use, or None if caching is disabled.
+    """
+    if cache is None:
+        cache = os.environ.get(PARSE_CACHE_ENV, "0") not in ("", "0")
+    if cache is True:
+        cache = DiskCache(default_cache_dir() / "parse")
+    return cache or None
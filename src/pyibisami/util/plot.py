@@ -19,7 +19,7 @@ from matplotlib.figure import Figure
 import numpy as np
 from scipy.interpolate import interp1d
 
-from ..common import EPS
+from ..common import EPS, convolve
 from ..ami.model import (
     AMIModel, AMIModelInitializer, AmiModelResponses,
     OUT_RESP_INIT, OUT_RESP_GETW
@@ -283,7 +283,7 @@ def plot_cdr_adaptation(
 
     cdr_adaptation = get_cdr_adaptation(getwave_out_params)
     if len(cdr_adaptation):
-        ax.plot(np.convolve(cdr_adaptation, np.ones(window_size) / window_size, mode='valid'))
+        ax.plot(convolve(cdr_adaptation, np.ones(window_size) / window_size, mode='valid'))
     ax.set_title("CDR Adaptation")
 
 
@@ -414,7 +414,7 @@ def do_samples_per_bit(
         A list of model response dictionaries, one for each oversampling rate tried.
     """
 
-    channel_response = np.array(initializer.channel_response)
+    channel_response = initializer.channel_response_array
     sample_interval  = initializer.sample_interval
     bit_rate         = 1 / initializer.bit_time
 
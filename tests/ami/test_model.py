@@ -1,9 +1,14 @@
+import glob
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from ctypes import c_double, c_void_p, cast
 from pathlib import Path
 
+import numpy as np
 import pytest
 
-from pyibisami.ami.model import AMIModel, AMIModelInitializer, loadWave
+from pyibisami.ami.model import AMIModel, AMIModelInitializer, encode_ami_params, interpFile, loadWave, sexpr
+from pyibisami.util.cache import DiskCache
 
 
 def test_loadWave(tmp_path):
@@ -22,6 +27,42 @@ def test_loadWave(tmp_path):
     assert len(wave[0]) == 5
 
 
+def test_interpFile(tmp_path):
+    waveform = tmp_path.joinpath("waveform.txt")
+    with open(waveform, "w") as test_file:
+        test_file.write("Time Voltage\n")
+        test_file.write("1.0 0.0\n")
+        test_file.write("1.5 1.0\n")
+        test_file.write("3.0 -2.0\n")
+
+    wave = interpFile(waveform, 0.25)
+    assert np.allclose(wave, [0.0, 0.5, 1.0, 0.5, 0.0, -0.5, -1.0, -1.5])
+
+
+@pytest.mark.parametrize("name", ["waveform.txt", "wave[1]*?.txt"])
+def test_loadWave_cache(tmp_path, name):
+    waveform = tmp_path.joinpath(name)
+    cache_glob = f"{glob.escape(name)}.*.npy"
+    with open(waveform, "w") as test_file:
+        test_file.write("Time Voltage\n")
+        test_file.write("0.00 .000\n")
+        test_file.write("0.01 .001\n")
+
+    wave = loadWave(waveform, cache=True)
+    cache_files = list(tmp_path.glob(cache_glob))
+    assert len(cache_files) == 1
+    cached_wave = loadWave(waveform, cache=True)
+    assert isinstance(cached_wave[0], np.memmap)
+    assert np.array_equal(cached_wave[1], wave[1])
+
+    with open(waveform, "a") as test_file:  # Invalidates the cache.
+        test_file.write("0.02 .002 extra columns are ignored\n")
+    wave = loadWave(waveform, cache=True)
+    assert len(wave[0]) == 3
+    assert list(tmp_path.glob(cache_glob)) != cache_files
+    assert len(list(tmp_path.glob(cache_glob))) == 1
+
+
 class Test_AMIModel(object):
     def test_init(self):
         """Verify that we can load in a .so file.
@@ -55,3 +96,212 @@ class Test_AMIModelInitializer(object):
         assert dut.ami_params == {"root_name": ""}
         data = ["channel_response", "row_size", "num_aggressors", "sample_interval", "bit_time"]
         assert all(name in dut._init_data for name in data)
+
+
+def _example_so() -> str:
+    if sys.platform == "win32":
+        return str(Path(__file__).parents[1].joinpath("examples", "example_tx_x86_amd64.dll"))
+    if sys.platform.startswith("linux"):
+        return str(Path(__file__).parents[1].joinpath("examples", "example_tx_x86_amd64.so"))
+    return str(Path(__file__).parents[1].joinpath("examples", "example_tx_x86_amd64_osx.so"))
+
+
+def _initialized_model(nm1: int = 3, private_copy: bool = False) -> AMIModel:
+    the_model = AMIModel(_example_so(), private_copy=private_copy)
+    the_model.initialize(
+        AMIModelInitializer(
+            {"root_name": "example_tx", "tx_tap_nm1": nm1},
+            sample_interval=c_double(3.125e-12),
+            bit_time=c_double(100e-12),
+        )
+    )
+    return the_model
+
+
+@pytest.mark.skipif(not Path(_example_so()).exists(), reason="Example AMI model not found.")
+class Test_AMIModelGetWave(object):
+    wave = np.repeat(np.random.default_rng(0).choice([-0.5, 0.5], 100), 32)
+
+    def test_default_leaves_input_untouched(self):
+        wave = self.wave.copy()
+        wave_out, clock_times, params_out = _initialized_model().getWave(wave)
+        assert np.array_equal(wave, self.wave)
+        assert not np.array_equal(wave_out, wave)
+        assert len(wave_out) == len(wave)
+        assert len(clock_times) == len(wave) // 32
+        assert len(params_out) == 25
+
+    def test_in_place(self):
+        expected, _, _ = _initialized_model().getWave(self.wave)
+        wave = self.wave.copy()
+        wave_out, _, _ = _initialized_model().getWave(wave, out=wave)
+        assert wave_out is wave
+        assert np.array_equal(wave_out, expected)
+
+    def test_chunk_size_invariance(self):
+        the_model = _initialized_model()
+        expected, _, _ = the_model.getWave(self.wave)
+        wave_out, clock_times, _ = _initialized_model().getWave(self.wave, bits_per_call=7)
+        assert np.array_equal(wave_out, expected)
+        assert len(clock_times) == len(self.wave) // 32
+
+    def test_bad_out(self):
+        with pytest.raises(ValueError):
+            _initialized_model().getWave(self.wave, out=np.zeros(len(self.wave), dtype=np.float32))
+        with pytest.raises(ValueError):
+            _initialized_model().getWave(self.wave, out=np.zeros(2 * len(self.wave))[::2])
+
+    def test_iter_getwave(self, tmp_path):
+        expected, expected_clocks, expected_params = _initialized_model().getWave(self.wave, bits_per_call=4)
+
+        def uneven_chunks():
+            idx = 0
+            for size in [1, 50, 300, 7, 1000]:
+                yield self.wave[idx: idx + size]
+                idx += size
+            yield from self.wave[idx:]  # Individual samples.
+
+        npy_file = tmp_path.joinpath("wave.npy")
+        np.save(npy_file, self.wave)
+        for source in [self.wave, uneven_chunks(), npy_file]:
+            results = list(_initialized_model().iter_getwave(source, bits_per_call=4))
+            assert len(results) == 25
+            assert np.array_equal(np.concatenate([r[0] for r in results]), expected)
+            assert np.array_equal(np.concatenate([r[1] for r in results]), expected_clocks)
+            assert [r[2] for r in results] == expected_params
+
+
+@pytest.mark.skipif(not Path(_example_so()).exists(), reason="Example AMI model not found.")
+class Test_AMIModelPrivateCopy(object):
+    def test_private_copies_are_independent(self):
+        first = AMIModel(_example_so(), private_copy=True)
+        second = AMIModel(_example_so(), private_copy=True)
+        assert cast(first._amiInit, c_void_p).value != cast(second._amiInit, c_void_p).value
+        tmp_dir = Path(first._tmp_dir)
+        assert tmp_dir.exists()
+        del first
+        assert not tmp_dir.exists()
+        maps = Path("/proc/self/maps")
+        if maps.exists():  # The private copy must also have been unloaded.
+            assert str(tmp_dir) not in maps.read_text()
+
+    def test_thread_pool(self):
+        wave = np.repeat(np.random.default_rng(0).choice([-0.5, 0.5], 100), 32)
+
+        def run(nm1):
+            the_model = _initialized_model(nm1, private_copy=True)
+            assert np.array_equal(the_model.initOut_array, the_model.initOut)
+            assert np.array_equal(the_model.channel_response_array, the_model.channel_response)
+            return the_model.ami_params_out, the_model.getWave(wave, bits_per_call=4)[0]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(run, range(4)))
+        for nm1, (params_out, wave_out) in enumerate(results):
+            assert f"(taps[2] {nm1})" in params_out
+            expected = _initialized_model(nm1).getWave(wave, bits_per_call=4)[0]
+            assert np.array_equal(wave_out, expected)
+
+
+class Test_AMIModelInitializerArrays(object):
+    def test_channel_response_array(self):
+        dut = AMIModelInitializer({})
+        h = np.array([0.0, 0.5, 0.25])
+        dut.channel_response = h
+        h[0] = 1.0  # The initializer keeps its own copy.
+        view = dut.channel_response_array
+        assert np.array_equal(view, [0.0, 0.5, 0.25])
+        assert not view.flags.writeable
+        assert np.shares_memory(view, np.ctypeslib.as_array(dut._init_data["channel_response"]))
+        assert dut.channel_response == [0.0, 0.5, 0.25]
+        assert dut.row_size == 3
+
+
+@pytest.mark.skipif(not Path(_example_so()).exists(), reason="Example AMI model not found.")
+def test_init_cache(tmp_path):
+    cache = DiskCache(tmp_path)
+    wave = np.repeat(np.random.default_rng(0).choice([-0.5, 0.5], 100), 32)
+    initializer = AMIModelInitializer(
+        {"root_name": "example_tx", "tx_tap_nm1": 2},
+        sample_interval=c_double(3.125e-12),
+        bit_time=c_double(100e-12),
+    )
+    reference = AMIModel(_example_so(), init_cache=False)
+    reference.initialize(initializer)
+
+    init_calls = []
+    for n in range(2):
+        the_model = AMIModel(_example_so(), init_cache=cache)
+        ami_init = the_model._amiInit
+        the_model._amiInit = lambda *args, ami_init=ami_init: init_calls.append(n) or ami_init(*args)
+        the_model.initialize(initializer)
+        assert the_model.initOut == reference.initOut
+        assert the_model.ami_params_out == reference.ami_params_out
+        assert the_model.msg == reference.msg
+    assert init_calls == [0]  # The second initialization came from the cache, and deferred `AMI_Init()`.
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    initializer.channel_response = np.zeros(len(initializer.channel_response))  # Mustn't affect deferred `AMI_Init()`.
+    expected, _, expected_params = reference.getWave(wave, bits_per_call=4)
+    wave_out, _, params_out = the_model.getWave(wave, bits_per_call=4)
+    assert init_calls == [0, 1]
+    assert np.array_equal(wave_out, expected)
+    assert params_out == expected_params
+    assert np.array_equal(the_model.initOut_array, reference.initOut_array)
+    assert the_model.msg == reference.msg
+
+
+@pytest.mark.skipif(not Path(_example_so()).exists(), reason="Example AMI model not found.")
+def test_instrumentation():
+    assert _initialized_model().stats is None
+    the_model = AMIModel(_example_so(), instrument=True)
+    the_model.initialize(
+        AMIModelInitializer(
+            {"root_name": "example_tx"},
+            sample_interval=c_double(3.125e-12),
+            bit_time=c_double(100e-12),
+        )
+    )
+    wave = np.zeros(100 * 32)
+    the_model.getWave(wave, bits_per_call=4)
+    stats = the_model.stats.to_dict()
+    assert stats["AMI_Init"]["calls"] == 1
+    assert stats["getWave"]["calls"] == 1
+    assert stats["getWave"]["chunks"] == 25
+    assert stats["getWave"]["samples"] == len(wave)
+    assert stats["AMI_GetWave"]["calls"] == 25
+    assert stats["AMI_GetWave"]["samples"] == len(wave)
+
+
+def reference_encoding(ami_params):
+    "The parameter string, as ``AMIModel.initialize()`` originally built it."
+    text = f"({ami_params['root_name']} "
+    for pname, pval in ami_params.items():
+        if pname != "root_name":
+            text += sexpr(pname, pval)
+    return (text + ")").encode("utf-8")
+
+
+class TestEncodeAmiParams:
+    params = {
+        "root_name": "rx",
+        "mode": "fast",
+        "enable": True,
+        "dfe": {"taps": {str(n): 0.01 * n for n in range(1, 9)}, "desc": "A DFE", "empty": {}},
+        "gain": 3,
+        "vector": [1, 2],
+    }
+
+    def test_matches_sexpr(self):
+        assert encode_ami_params(self.params) == reference_encoding(self.params)
+        assert encode_ami_params({"root_name": "empty"}) == reference_encoding({"root_name": "empty"})
+
+    def test_changed_leaves(self):
+        encode_ami_params(self.params)
+        for gain in [3, 3.0, True, 4, 3]:
+            params = {**self.params, "gain": gain, "dfe": {**self.params["dfe"], "taps": {"1": gain}}}
+            assert encode_ami_params(params) == reference_encoding(params)
+
+    def test_hashable_leaves_cached(self):
+        params = {k: v for k, v in self.params.items() if k != "vector"}
+        assert encode_ami_params(params) is encode_ami_params(params)
+        assert encode_ami_params({**params, "gain": 1}) != encode_ami_params({**params, "gain": True})
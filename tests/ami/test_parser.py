@@ -1,6 +1,8 @@
 import pytest
+from parsec import ParseError
 
 import pyibisami.ami.parser as ami_parser
+from pyibisami.util.cache import DiskCache
 
 
 @pytest.fixture
@@ -105,6 +107,62 @@ class TestAMIParse:
         assert ami.fetch_param_val(["Model_Specific", "tx_tap_np1"]) == 5
         assert ami.input_ami_params["tx_tap_np1"] == 5
 
+    def test_fetch_param_does_not_mutate_path(self, test_ami_config):
+        ami = ami_parser.AMIParamConfigurator(test_ami_config)
+        path = ["Model_Specific", "tx_tap_np1"]
+        assert ami.fetch_param(path).pname == "tx_tap_np1"
+        ami.set_param_val(path, 3)
+        assert path == ["Model_Specific", "tx_tap_np1"]
+        assert ami.fetch_param(["Model_Specific"]) is None
+
+    def test_set_param_val_errors(self, test_ami_config):
+        ami = ami_parser.AMIParamConfigurator(test_ami_config)
+        with pytest.raises(ValueError):
+            ami.set_param_val(["Model_Specific", "bad_name"], 1)
+        with pytest.raises(TypeError):
+            ami.set_param_val(["Model_Specific"], 1)
+
+    def test_get_set_many(self, test_ami_config):
+        ami = ami_parser.AMIParamConfigurator(test_ami_config)
+        ami.set_many({("Model_Specific", "tx_tap_np1"): 2.0, ("Model_Specific", "tx_tap_nm1"): 4})
+        ami.set_many([(("Model_Specific", "tx_tap_nm2"), 1)])
+        assert ami.get_many([
+            ("Model_Specific", "tx_tap_np1"), ("Model_Specific", "tx_tap_nm1"),
+            ("Model_Specific", "tx_tap_nm2"), ("Reserved_Parameters", "AMI_Version"),
+        ]) == [2, 4, 1, "5.1"]
+        assert isinstance(ami.input_ami_params["tx_tap_np1"], int)
+
+    def test_param_vector_map(self, test_ami_config):
+        ami = ami_parser.AMIParamConfigurator(test_ami_config)
+        vmap = ami.param_vector_map([("Model_Specific", "tx_tap_np1"), ("Model_Specific", "tx_tap_nm1")])
+        assert len(vmap) == 2
+        assert list(vmap.to_vector()) == [0.0, 0.0]
+        params = vmap.to_ami_params([1.0, 2.0])
+        assert params == {**ami.input_ami_params, "tx_tap_np1": 1, "tx_tap_nm1": 2}
+        assert list(vmap.to_vector(params)) == [1.0, 2.0]
+        assert vmap.to_ami_params([3, 4]) is not params
+        with pytest.raises(ValueError):
+            ami.param_vector_map([("Reserved_Parameters", "AMI_Version")])
+
+    def test_AMIParamConfigurator_headless(self, test_ami_config):
+        "No traits are built, unless the GUI is used."
+        ami = ami_parser.AMIParamConfigurator(test_ami_config)
+        assert "tx_tap_np1" not in ami.trait_names()
+        assert ami.input_ami_params == {
+            "root_name": "example_tx", "tx_tap_units": 27, "tx_tap_np1": 0,
+            "tx_tap_nm1": 0, "tx_tap_nm2": 0, "corner_test": 1,
+        }
+
+    def test_AMIParamConfigurator_gui_sync(self, test_ami_config):
+        ami = ami_parser.AMIParamConfigurator(test_ami_config)
+        ami.set_param_val(["Model_Specific", "tx_tap_np1"], 5)
+        ami.default_traits_view()  # Builds the traits, as ``open_gui()`` does.
+        assert ami.tx_tap_np1 == 5  # pylint: disable=no-member
+        ami.tx_tap_nm1 = 3  # As the user would, via the GUI.
+        assert ami.input_ami_params["tx_tap_nm1"] == 3
+        ami.set_param_val(["Model_Specific", "tx_tap_nm2"], 2)
+        assert ami.tx_tap_nm2 == 2  # pylint: disable=no-member
+
     def test_tunable_params(self, test_ami_config):
         ami = ami_parser.AMIParamConfigurator(test_ami_config)
         names = {"_".join(path) for path, _ in ami.tunable_params}
@@ -165,6 +223,17 @@ class TestNestedModelSpecificParams:
         # `input_ami_params`, not from `AMIParameter.pvalue` -- this is what was broken.
         assert ami.input_ami_params["tx_preset"]["coeffs"]["main"] == 0.75
 
+    def test_param_vector_map_nested(self, nested_ami_config):
+        ami = ami_parser.AMIParamConfigurator(nested_ami_config)
+        path = ("Model_Specific", "tx_preset", "coeffs", "main")
+        vmap = ami.param_vector_map([path])
+        before = ami.input_ami_params
+        params = vmap.to_ami_params([0.25])
+        assert params["tx_preset"]["coeffs"]["main"] == 0.25
+        assert vmap.to_ami_params([0.5])["tx_preset"]["coeffs"]["main"] == 0.5
+        assert params["tx_preset"]["coeffs"]["main"] == 0.25  # Earlier results are not clobbered.
+        assert ami.input_ami_params == before
+
 
 @pytest.fixture
 def described_group_ami_config():
@@ -278,3 +347,50 @@ class TestModeSelectorParams:
         assert ami.input_ami_params["eq_mode"] == 1
         # `pvalue` must still be the legal-value list, not clobbered with a scalar.
         assert eq_mode_param.pvalue == [0, 1]
+
+
+class TestFastParser:
+    "The hand-written parser must agree exactly with the original ``parsec`` one."
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "(root)",
+            "  | leading comment\n(root (a 1 -2 +3 .5 1.5e-3 3.0) (b \"quoted (text)\nspanning lines\") (c True False))",
+            "(root (-1 0.1) (+2 0.2) (3 0.3) (1abc x) | trailing comment\n) ignored trailing text",
+            "(root(a(b(c d)e)f)(g))",
+            "(root (a x|y z) (b \"\") (c))",
+            "(rx_model (cdr_locked True) (cdr_phase 1.25e-13) (dfe_tap1 0.01) (dfe_tap2 -0.002))",
+        ],
+    )
+    def test_agrees_with_parsec(self, text):
+        assert ami_parser.ami_parse_fast(text) == ami_parser.ami_parse_parsec(text)
+
+    def test_agrees_with_parsec_on_ami_file(self, test_ami_config):
+        assert ami_parser.ami_parse_fast(test_ami_config) == ami_parser.ami_parse_parsec(test_ami_config)
+
+    def test_tap_names(self):
+        assert ami_parser.ami_parse_fast("(tx (-1 a) (+1 b) (2 c))") == (
+            "tx", [("pre1", ["a"]), ("post1", ["b"]), ("post2", ["c"])]
+        )
+
+    @pytest.mark.parametrize("text", ["", "root", "(root", "(root (a 1)", "(root atom)", "(root (a -x))", "(root (a (1)"])
+    def test_errors(self, text):
+        with pytest.raises(ParseError):
+            ami_parser.ami_parse_parsec(text)
+        with pytest.raises(ParseError):
+            ami_parser.ami_parse_fast(text)
+
+    def test_default(self):
+        assert ami_parser.ami_parse is ami_parser.ami_parse_fast
+
+
+def test_parse_ami_file_contents_cache(test_ami_config, tmp_path):
+    cache = DiskCache(tmp_path)
+    uncached = ami_parser.parse_ami_file_contents(test_ami_config, cache=cache)
+    cached = ami_parser.parse_ami_file_contents(test_ami_config, cache=cache)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cached[:4] == uncached[:4]
+    assert cached[4].keys() == uncached[4].keys()
+    param, param0 = cached[5]["tx_tap_nm1"], uncached[5]["tx_tap_nm1"]
+    assert (param.pmin, param.pmax, param.pvalue) == (param0.pmin, param0.pmax, param0.pvalue)
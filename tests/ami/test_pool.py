@@ -0,0 +1,73 @@
+import pickle
+import sys
+from ctypes import c_double
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from pyibisami.ami.model import AMIModel, AMIModelInitializer
+from pyibisami.ami.pool import AMIModelPool
+
+if sys.platform == "win32":
+    EXAMPLE_SO = Path(__file__).parents[1].joinpath("examples", "example_tx_x86_amd64.dll")
+elif sys.platform.startswith("linux"):
+    EXAMPLE_SO = Path(__file__).parents[1].joinpath("examples", "example_tx_x86_amd64.so")
+else:  # darwin aka OS X
+    EXAMPLE_SO = Path(__file__).parents[1].joinpath("examples", "example_tx_x86_amd64_osx.so")
+
+
+def _initializer(nm1: int) -> AMIModelInitializer:
+    return AMIModelInitializer(
+        {"root_name": "example_tx", "tx_tap_nm1": nm1},
+        sample_interval=c_double(3.125e-12),
+        bit_time=c_double(100e-12),
+    )
+
+
+def test_initializer_pickles():
+    dut = _initializer(2)
+    dut.channel_response = [0.0, 0.5, 0.25]
+    clone = pickle.loads(pickle.dumps(dut))
+    assert clone.channel_response == dut.channel_response
+    assert clone.sample_interval == dut.sample_interval
+    assert clone.bit_time == dut.bit_time
+    assert clone.ami_params == dut.ami_params
+
+
+@pytest.mark.skipif(not EXAMPLE_SO.exists(), reason="Example AMI model not found.")
+class Test_AMIModelPool(object):
+    initializers = [_initializer(nm1) for nm1 in range(4)]
+    wave = np.repeat(np.random.default_rng(0).choice([-0.5, 0.5], 100), 32)
+
+    def serial(self, initializer):
+        model = AMIModel(str(EXAMPLE_SO))
+        model.initialize(initializer)
+        return model
+
+    def test_initialize(self):
+        with AMIModelPool(str(EXAMPLE_SO), max_workers=2) as pool:
+            results = pool.map_initialize(self.initializers)
+        for initializer, result in zip(self.initializers, results):
+            model = self.serial(initializer)
+            assert result["ami_params_out"] == model.ami_params_out
+            assert np.array_equal(result["initOut"], model.initOut)
+
+    def test_getwave(self):
+        with AMIModelPool(str(EXAMPLE_SO), max_workers=2) as pool:
+            results = pool.map_getwave(self.initializers, self.wave, bits_per_call=4)
+        for initializer, (wave_out, clock_times, params_out) in zip(self.initializers, results):
+            expected = self.serial(initializer).getWave(self.wave, bits_per_call=4)
+            assert np.array_equal(wave_out, expected[0])
+            assert np.array_equal(clock_times, expected[1])
+            assert params_out == expected[2]
+
+    def test_get_responses(self):
+        with AMIModelPool(str(EXAMPLE_SO), max_workers=2) as pool:
+            results = pool.map_get_responses(self.initializers, calc_getw=False)
+        for initializer, result in zip(self.initializers, results):
+            expected = self.serial(initializer).get_responses(calc_getw=False)
+            assert result.keys() == expected.keys()
+            for key, value in expected.items():
+                for got, want in zip(result[key], value):
+                    assert np.allclose(got, want)
@@ -0,0 +1,42 @@
+import json
+
+from pyibisami.ami.stats import HIST_BUCKETS, AMIModelStats, EntryPointStats, instrument_default
+
+
+def test_entry_point_stats():
+    dut = EntryPointStats()
+    dut.record(0.5e-6, samples=100, nbytes=800, chunks=1)
+    dut.record(3e-6, samples=100, nbytes=800, chunks=1)
+    dut.record(1e9)
+    assert dut.calls == 3
+    assert dut.samples == 200
+    assert dut.nbytes == 1600
+    assert dut.chunks == 2
+    assert dut.histogram[0] == 1  # <= 1 us
+    assert dut.histogram[2] == 1  # <= 4 us
+    assert dut.histogram[len(HIST_BUCKETS)] == 1  # Overflow bucket.
+    assert dut.min_time == 0.5e-6
+    assert dut.max_time == 1e9
+
+
+def test_model_stats_json(tmp_path):
+    dut = AMIModelStats()
+    dut.record("AMI_GetWave", 0.001, samples=128, nbytes=1024, chunks=1)
+    dut.record("AMI_GetWave", 0.003, samples=128, nbytes=1024, chunks=1)
+    json_file = tmp_path.joinpath("stats.json")
+    stats = json.loads(dut.to_json(json_file))
+    assert stats == json.loads(json_file.read_text())
+    assert stats["AMI_GetWave"]["calls"] == 2
+    assert stats["AMI_GetWave"]["samples_per_second"] == 256 / 0.004
+    assert "AMI_GetWave" in dut.summary()
+    dut.reset()
+    assert not dut.to_dict()
+
+
+def test_instrument_default(monkeypatch):
+    monkeypatch.delenv("PYIBISAMI_INSTRUMENT", raising=False)
+    assert not instrument_default()
+    monkeypatch.setenv("PYIBISAMI_INSTRUMENT", "0")
+    assert not instrument_default()
+    monkeypatch.setenv("PYIBISAMI_INSTRUMENT", "1")
+    assert instrument_default()
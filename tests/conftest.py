@@ -245,3 +245,69 @@ dV/dt_f    0.540/108.00p    0.512/511.58p    0.566/56.57p
 """
         )
     return ibis_file
+
+
+def synthetic_ibis(nmodels: int, npins: int = 4, nwave: int = 20, bad_model: int = -1) -> str:
+    """
+    Build the contents of an IBIS file with one component and ``nmodels`` models,
+    each with I-V tables and a [Rising Waveform] table of ``nwave`` points.
+
+    Model number ``bad_model`` (if any) is given an illegal ``Model_type``.
+    """
+    pins = "\n".join(f"{n}p     SIG_{n}             model_{n % nmodels}" for n in range(npins))
+    iv = "\n".join(f"{v:.2f}    {v * 1e-2:.3e}    {v * 1e-2:.3e}    {v * 1e-2:.3e}" for v in (-1.8, 0.0, 1.8, 3.6))
+    wave = "\n".join(f"{n * 10}p    {n / nwave:.4f}    {n / nwave:.4f}    {n / nwave:.4f}" for n in range(nwave))
+    models = "\n".join(
+        f"""[Model]   model_{n}
+Model_type   {"Bogus" if n == bad_model else "I/O"}
+C_comp     1.00p    0.01p    5.00p
+
+[Algorithmic Model]
+Executable linux_gcc4.1.2_64          model_{n}.so   model_{n}.ami
+[End Algorithmic Model]
+
+[Temperature_Range]     25.0      0.0    100.0
+[Voltage_Range]         1.80     1.62     1.98
+
+[Pulldown]
+{iv}
+
+[Pullup]
+{iv}
+
+[Ramp]
+dV/dt_r    0.540/108.00p    0.512/511.58p    0.566/56.57p
+dV/dt_f    0.540/108.00p    0.512/511.58p    0.566/56.57p
+
+[Rising Waveform]
+R_fixture = 50
+V_fixture = 0.0
+{wave}
+"""
+        for n in range(nmodels)
+    )
+    return f"""[IBIS Ver]   5.1
+[File Name]  synthetic.ibs
+[File Rev]   v0.1
+[Date]       2026-10-17
+
+[Component]    Synthetic
+[Manufacturer] (n/a)
+
+[Package]
+R_pkg     0.10     0.00     0.50
+L_pkg    10.00n    0.10n   50.00n
+C_pkg     1.00p    0.01p    5.00p
+
+[Pin]  signal_name        model_name
+{pins}
+
+{models}
+[END]
+"""
+
+
+@pytest.fixture
+def make_ibis():
+    "Factory for synthetic IBIS file contents (see ``synthetic_ibis()``)."
+    return synthetic_ibis
@@ -10,3 +10,83 @@ def test_ibis_model_construction(ibis_test_file):
     """
     model = IBISModel(ibis_test_file, debug=False, gui=False)
     assert model.file_name == "example_tx.ibs"
+
+
+def test_ibis_model_lazy(tmp_path, make_ibis):
+    ibis_file = tmp_path / "synthetic.ibs"
+    ibis_file.write_text(make_ibis(3))
+    model = IBISModel(str(ibis_file), gui=False, lazy=True)
+    assert model.pins == ["0p(SIG_0)", "1p(SIG_1)", "2p(SIG_2)", "3p(SIG_3)"]
+    assert model.model_dict["models"].is_parsed("model_0")
+    assert not model.model_dict["models"].is_parsed("model_2")
+    model.pin = "2p(SIG_2)"
+    assert model.mod == "model_2"
+    assert model.model_dict["models"].is_parsed("model_2")
+
+
+def test_ibis_model_selected(tmp_path, make_ibis):
+    ibis_file = tmp_path / "synthetic.ibs"
+    ibis_file.write_text(make_ibis(1000, npins=8))
+    model = IBISModel(str(ibis_file), gui=False, models=["model_5", "model_7"])
+    assert list(model.model_dict["models"]) == ["model_5", "model_7"]
+    assert model.pins == ["5p(SIG_5)", "7p(SIG_7)"]  # Only those pins whose models are available.
+    assert model.mod == "model_5"
+
+
+def test_ibis_model_selected_second_component(tmp_path, make_ibis):
+    second = """[Component]    Second
+[Manufacturer] (n/a)
+
+[Package]
+R_pkg     0.10     0.00     0.50
+L_pkg    10.00n    0.10n   50.00n
+C_pkg     1.00p    0.01p    5.00p
+
+[Pin]  signal_name        model_name
+9p     SIG_9             model_2
+
+"""
+    ibis_file = tmp_path / "synthetic.ibs"
+    ibis_file.write_text(make_ibis(3, npins=2).replace("[Model]   model_0", second + "[Model]   model_0", 1))
+    assert IBISModel(str(ibis_file), gui=False).comp == "Synthetic"
+    model = IBISModel(str(ibis_file), gui=False, models=["model_2"])  # Only used by the second component.
+    assert model.comp == "Second"
+    assert model.pins == ["9p(SIG_9)"]
+    assert model.mod == "model_2"
+
+
+def test_ibis_model_pin_indexes(tmp_path, make_ibis):
+    contents = (
+        make_ibis(3, npins=6)
+        .replace("[Model]   model_1\nModel_type   I/O", "[Model]   model_1\nModel_type   Input")
+        .replace("5p     SIG_5             model_2", "5p     SIG_5             sel")
+        .replace("[Model]   model_0", "[Model Selector] sel\nmodel_2  Fast\nmodel_1  Slow\n\n[Model]   model_0")
+    )
+    ibis_file = tmp_path / "synthetic.ibs"
+    ibis_file.write_text(contents)
+    model = IBISModel(str(ibis_file), gui=False)
+    comp = model.comp_
+    assert comp.pin_model("4p(SIG_4)") == "model_1"
+    assert comp.model_pins("model_1") == ["1p(SIG_1)", "4p(SIG_4)"]
+    assert comp.model_pins("no_such_model") == []
+    assert comp.signal_pins("SIG_3") == ["3p(SIG_3)"]
+    assert model.get_model_names("sel") == ["model_2", "model_1"]
+    assert model.get_model_names("model_0") == ["model_0"]
+    assert model.get_model_names("no_such_model") == []
+    assert model.get_pins_qualified(True) == ["0p(SIG_0)", "2p(SIG_2)", "3p(SIG_3)", "5p(SIG_5)"]
+    assert model.get_pins_qualified(False, comp_name="Synthetic") == ["1p(SIG_1)", "4p(SIG_4)"]
+
+
+def test_ibis_model_headless(ibis_test_file):
+    "No plots, nor GUI traits, are built until they're used."
+    model = IBISModel(ibis_test_file, gui=False)
+    tx_model, comp = model.model, model.comp_
+    assert tx_model._plot_iv is None
+    assert "model_type" not in tx_model.trait_names()
+    assert "_pin" not in comp.trait_names()
+    assert comp.pin == ("example_tx", {})
+    plot_iv = tx_model.plot_iv
+    assert list(plot_iv.plots) == ["PD-Typ", "PD-Min", "PD-Max", "PU-Typ", "PU-Min", "PU-Max"]
+    assert tx_model.plot_iv is plot_iv
+    tx_model.default_traits_view()
+    assert tx_model.trait_get("model_type") == {"model_type": "Output"}
@@ -0,0 +1,105 @@
+import os
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from pyibisami.ibis.library import IbisLibrary, main
+
+
+@pytest.fixture
+def library_dir(tmp_path, make_ibis, ami_test_file, ibis_test_file_with_ami_test_config):
+    "A small library of IBIS files: one good synthetic file (with an ``*.ami`` file), one bad, and one nested."
+    root = tmp_path / "lib"
+    (root / "vendor").mkdir(parents=True)
+    (root / "synthetic.ibs").write_text(make_ibis(2))
+    (root / "model_0.ami").write_text(ami_test_file.read_text())
+    (root / "bad.IBS").write_text(make_ibis(2, bad_model=1))
+    (root / "vendor" / "example_tx.ibs").write_text(ibis_test_file_with_ami_test_config.read_text())
+    return root
+
+
+def test_library_index(tmp_path, library_dir):
+    with IbisLibrary(tmp_path / "index.sqlite") as library:
+        summary = library.index(library_dir, jobs=1)
+        assert len(summary.indexed) == 3
+        assert [os.path.basename(path) for path, _ in summary.failed] == ["bad.IBS"]
+        assert [row[:2] for row in library.components()] == [("Synthetic", "(n/a)"), ("Example_Tx", "(n/a)")]
+        assert [row[:4] for row in library.pins("synth*")] == [
+            ("Synthetic", "0p", "SIG_0", "model_0"),
+            ("Synthetic", "1p", "SIG_1", "model_1"),
+            ("Synthetic", "2p", "SIG_2", "model_0"),
+            ("Synthetic", "3p", "SIG_3", "model_1"),
+        ]
+        linux64 = library.models(platform="linux", bits=64)
+        assert [name for name, _, _ in linux64] == ["model_0", "model_1", "example_tx"]
+        assert [name for name, _, _ in library.models(platform="windows")] == ["example_tx"]
+        assert [name for name, _, _ in library.models(params={"GetWave_Exists": "true"})] == ["model_0"]
+        assert library.models(model_type="output") == [
+            ("example_tx", "Output", str(library_dir / "vendor" / "example_tx.ibs"))
+        ]
+        assert [row[:3] for row in library.test_configs()] == [
+            ("Typ_stat", "Statistical", "example_tx"),
+            ("Typ_td", "Time_domain", "example_tx"),
+        ]
+
+
+def test_library_reindex(tmp_path, library_dir):
+    with IbisLibrary(tmp_path / "index.sqlite") as library:
+        library.index(library_dir, jobs=1)
+        summary = library.index(library_dir, jobs=1)
+        assert not summary.indexed and summary.unchanged == 3
+
+        synthetic = library_dir / "synthetic.ibs"
+        os.utime(synthetic, ns=(0, 0))  # Touched, but unchanged.
+        summary = library.index(library_dir, jobs=1)
+        assert not summary.indexed and summary.unchanged == 3
+
+        (library_dir / "model_0.ami").unlink()  # Referenced *.ami file changed.
+        (library_dir / "vendor" / "example_tx.ibs").unlink()
+        summary = library.index(library_dir, jobs=1)
+        assert summary.indexed == [str(synthetic)]
+        assert summary.removed == [str(library_dir / "vendor" / "example_tx.ibs")]
+        assert not library.models(params={"GetWave_Exists": "True"})
+        assert [name for name, _, _ in library.components()] == ["Synthetic"]
+
+
+def test_library_unreadable_file(tmp_path, library_dir, monkeypatch):
+    "A file that can't be read must be recorded as failed, without aborting the rest of the run."
+    read_bytes = Path.read_bytes
+
+    def unreadable(path):
+        if path.name == "synthetic.ibs":
+            raise PermissionError(13, "Permission denied", str(path))
+        return read_bytes(path)
+
+    monkeypatch.setattr(Path, "read_bytes", unreadable)
+    with IbisLibrary(tmp_path / "index.sqlite") as library:
+        summary = library.index(library_dir, jobs=1)
+        assert len(summary.indexed) == 3
+        failed = dict(summary.failed)
+        assert sorted(map(os.path.basename, failed)) == ["bad.IBS", "synthetic.ibs"]
+        assert failed[str(library_dir / "synthetic.ibs")].startswith("[Errno 13] Permission denied")
+        assert [name for name, _, _ in library.components()] == ["Example_Tx"]
+
+        monkeypatch.undo()
+        summary = library.index(library_dir, jobs=1)  # Same size and time, but never successfully read.
+        assert summary.indexed == [str(library_dir / "synthetic.ibs")] and summary.unchanged == 2
+
+
+def test_library_cli(tmp_path, library_dir):
+    runner = CliRunner()
+    db = str(tmp_path / "index.sqlite")
+    rslt = runner.invoke(main, ["--db", db, "index", "--jobs", "2", str(library_dir)])
+    assert rslt.exit_code == 0, rslt.output
+    assert "3 indexed (1 with errors), 0 unchanged, 0 removed." in rslt.output
+
+    rslt = runner.invoke(main, ["--db", db, "models", "--ami", "-p", "GetWave_Exists=True"])
+    assert rslt.exit_code == 0, rslt.output
+    assert rslt.output == f"model_0\tI/O\t{library_dir / 'synthetic.ibs'}\n"
+
+    rslt = runner.invoke(main, ["--db", db, "files", "--errors"])
+    assert rslt.output.startswith(f"{library_dir / 'bad.IBS'}\t")
+
+    rslt = runner.invoke(main, ["--db", db, "models", "-p", "GetWave_Exists"])
+    assert rslt.exit_code == 1
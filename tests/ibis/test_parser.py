@@ -1,4 +1,13 @@
-from pyibisami.ibis.parser import parse_ibis_file
+
+import numpy as np
+import pytest
+from parsec import ParseError, many, many1, none_of
+
+from pyibisami.ibis import parser as ibis_parser
+from pyibisami.ibis.parser import (
+    iv_table, parse_ibis_file, pins, scan_ibis_file, skip_keyword, skip_line, vi_line
+)
+from pyibisami.util.cache import DiskCache
 
 
 def test_parse_ibis_file_with_ideal_file(ibis_test_file):
@@ -37,3 +46,213 @@ def test_parse_ibis_file_with_ami_test_config(ibis_test_file_with_ami_test_confi
     assert td["input_waveform_file"] == "four_tap_input_bits.txt"
     assert td["golden_waveform_file"] == "four_tap_output_wave_typ.txt"
     assert td["executable_index"] == "2"
+
+
+def test_parse_ibis_file_cache(ibis_test_file, tmp_path):
+    """Cached parse results must reproduce the original ones."""
+    cache = DiskCache(tmp_path / "cache")
+    ibis_file_contents = ibis_test_file.read_text()
+    status, uncached = parse_ibis_file(ibis_file_contents, cache=cache)
+    assert status == "Success!"
+    assert (cache.hits, cache.misses) == (0, 1)
+    status, cached = parse_ibis_file(ibis_file_contents, cache=cache)
+    assert status == "Success!"
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert set(cached) == set(uncached)
+    assert cached["file_name"] == uncached["file_name"]
+    model, model0 = cached["models"]["example_tx"], uncached["models"]["example_tx"]
+    assert model is not model0
+    np.testing.assert_equal(model._subDict, model0._subDict)
+    assert (model.zout, model.slew) == (model0.zout, model0.slew)
+    assert cached["components"]["Example_Tx"].pins == uncached["components"]["Example_Tx"].pins
+    parse_ibis_file(ibis_file_contents + "\n", cache=cache)  # Different contents mean a different entry.
+    assert cache.misses == 2
+
+
+def test_skip_keyword():
+    "The regular expression based ``skip_keyword`` must stop exactly where the original parser combination did."
+    original = skip_line >> many(none_of("[") >> skip_line)
+    for text in ["abc\n  def | [not a keyword]\nghi\n[Next]", "x [y]\n", "\n\n| c\n  [K]", "", "[K]", "a\r\nb\n"]:
+        assert skip_keyword(text, 0).index == original(text, 0).index
+
+
+def test_scan_ibis_file(make_ibis):
+    contents = make_ibis(3)
+    sections = scan_ibis_file(contents)
+    assert [sec.keyword for sec in sections] == [
+        "ibis_ver", "file_name", "file_rev", "date", "component", "model", "model", "model", "end"]
+    assert [sec.name for sec in sections if sec.keyword in ("component", "model")] == [
+        "Synthetic", "model_0", "model_1", "model_2"]
+    assert all(this.end == that.start for this, that in zip(sections, sections[1:]))
+    assert contents[sections[5].start:].startswith("[Model]   model_0")
+
+
+def test_parse_ibis_file_lazy(ibis_test_file, make_ibis):
+    for contents in [ibis_test_file.read_text(), make_ibis(3)]:
+        status, eager = parse_ibis_file(contents)
+        assert status == "Success!"
+        status, lazy = parse_ibis_file(contents, lazy=True)
+        assert status == "Success!"
+        assert set(lazy) == set(eager)
+        assert list(lazy["models"]) == list(eager["models"])
+        for name, model in eager["models"].items():
+            assert not lazy["models"].is_parsed(name)
+            np.testing.assert_equal(lazy["models"][name]._subDict, model._subDict)
+            assert lazy["models"].is_parsed(name)
+        for name, comp in eager["components"].items():
+            assert lazy["components"][name].pins == comp.pins
+
+
+def test_parse_ibis_file_lazy_error(make_ibis):
+    contents = make_ibis(3, bad_model=1)
+    status, _ = parse_ibis_file(contents)
+    assert status != "Success!"
+    status, lazy = parse_ibis_file(contents, lazy=True)
+    assert status == "Success!"  # Errors in deferred sections are only found upon access.
+    assert lazy["models"]["model_0"].mtype == "I/O"
+    with pytest.raises(ParseError):
+        lazy["models"]["model_1"]  # pylint: disable=pointless-statement
+
+
+def test_parse_ibis_file_selected(make_ibis):
+    contents = make_ibis(4)
+    status, selected = parse_ibis_file(contents, models=["model_2"], components=[])
+    assert status == "Success!"
+    assert list(selected["models"]) == ["model_2"]
+    assert not selected["components"]
+    _, full = parse_ibis_file(contents)
+    np.testing.assert_equal(selected["models"]["model_2"]._subDict, full["models"]["model_2"]._subDict)
+    status, selected = parse_ibis_file(contents, models=["model_1", "no_such_model"], lazy=True)
+    assert status == "Success!"
+    assert list(selected["models"]) == ["model_1"]
+    assert not selected["models"].is_parsed("model_1")
+
+
+def test_parse_ibis_file_selected_errors(make_ibis):
+    "Errors in skipped sections go unnoticed, while those in selected sections are reported."
+    contents = make_ibis(3, bad_model=1)
+    assert parse_ibis_file(contents, models=["model_2"])[0] == "Success!"
+    assert parse_ibis_file(contents, models=["model_1"])[0] != "Success!"
+
+
+def test_parse_ibis_file_selected_skips_others(make_ibis, monkeypatch):
+    "Picking one model out of a large file must not parse any of the others."
+    parsed = []
+    construct = ibis_parser.construct_section
+
+    def construct_section(kw, nm, fields):
+        parsed.append(nm)
+        return construct(kw, nm, fields)
+
+    monkeypatch.setattr(ibis_parser, "construct_section", construct_section)
+    status, selected = parse_ibis_file(make_ibis(50), cache=False, models=["model_25"])
+    assert status == "Success!"
+    assert list(selected["models"]) == ["model_25"]
+    assert parsed == ["Synthetic", "model_25"]
+
+
+def test_parse_ibis_file_workers(ibis_test_file, make_ibis):
+    for contents in [ibis_test_file.read_text(), make_ibis(6)]:
+        _, serial = parse_ibis_file(contents, cache=False)
+        status, parallel = parse_ibis_file(contents, cache=False, workers=2)
+        assert status == "Success!"
+        assert set(parallel) == set(serial)
+        assert list(parallel["models"]) == list(serial["models"])
+        assert list(parallel["components"]) == list(serial["components"])
+        for name, model in serial["models"].items():
+            np.testing.assert_equal(parallel["models"][name]._subDict, model._subDict)
+        for name, comp in serial["components"].items():
+            assert parallel["components"][name].pins == comp.pins
+        assert parallel["model_selectors"] == serial["model_selectors"]
+    status, selected = parse_ibis_file(make_ibis(4), models=["model_3"], workers=2)
+    assert status == "Success!"
+    assert list(selected["models"]) == ["model_3"]
+
+
+def test_parse_ibis_file_workers_error(make_ibis):
+    "Errors must be reported exactly as by a serial parse."
+    contents = make_ibis(4, bad_model=2)
+    status, _ = parse_ibis_file(contents, cache=False)
+    assert status != "Success!"
+    assert parse_ibis_file(contents, cache=False, workers=2) == (status, {})
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "0.0  1.0m  0.9m  1.1m\n1.8  2.5mA 2.2mA 2.8mA\n[Next]",
+        "-1.8 -1e-3 NA NA | Comment\n0.0 0.0 na na\n3.3 4u 3u 5u\n",
+        "0.0 1.0\n1.0 2.0 1.5 2.5\n2.0 3.0 | Missing min./max.\n",
+        "0.0 1.0 NA | Broken NA pair.\nNA 2.0 1.0 3.0\n",
+        "1.0 2.0 3.0 4.0 5.0 R_fixture = 50",
+    ],
+)
+def test_iv_table(text):
+    "The bulk I-V table parser must agree with ``many1(vi_line)``, with any missing min./max. values filled in."
+    old, new = many1(vi_line)(text, 0), iv_table(text, 0)
+    assert new.status and new.index == old.index
+    rows = [[v] + (ityps if len(ityps) == 3 else ityps * 3) for v, ityps in old.value]
+    np.testing.assert_array_equal(new.value, np.array(rows))
+    assert new.value.shape == (len(rows), 4)
+
+
+def test_waveform_tables(make_ibis):
+    contents = make_ibis(2).replace(
+        "[Rising Waveform]",
+        """[Falling Waveform]
+R_fixture = 50
+V_fixture = 1.8
+V_fixture_min = NA
+| time  V(typ)  V(min)  V(max)
+0.0    1.8     NA      NA
+1n     0.0     0.1m    0.2m
+[Composite Current]
+0.0    1mA     2mA     3mA
+1n     2mA     NA      NA
+[Rising Waveform]""",
+        1,
+    )
+    status, ibis = parse_ibis_file(contents, cache=False)
+    assert status == "Success!"
+    model = ibis["models"]["model_0"]
+    (falling,) = model.falling_waveforms
+    (rising,) = model.rising_waveforms
+    assert model.composite_currents == [falling.composite_current]
+    assert rising.composite_current is None
+    assert "_parsed" not in vars(falling)  # Nothing is parsed until used.
+    assert falling.fixture == {"r_fixture": 50, "v_fixture": 1.8, "v_fixture_min": None}
+    np.testing.assert_array_equal(falling.data, [[0.0, 1.8, 1.8, 1.8], [1e-9, 0.0, 1e-4, 2e-4]])
+    np.testing.assert_array_equal(falling.composite_current.data, [[0.0, 1e-3, 2e-3, 3e-3], [1e-9, 2e-3, 2e-3, 2e-3]])
+    assert rising.fixture == {"r_fixture": 50, "v_fixture": 0}
+    assert rising.data.shape == (20, 4)
+    assert not ibis["models"]["model_1"].falling_waveforms
+
+
+def test_waveform_tables_error(make_ibis):
+    "Malformed waveform tables only raise when used."
+    status, ibis = parse_ibis_file(make_ibis(1).replace("R_fixture = 50", "R_fixture = 50\nBogus"), cache=False)
+    assert status == "Success!"
+    with pytest.raises(ParseError):
+        ibis["models"]["model_0"].rising_waveforms[0].data  # pylint: disable=expression-not-assigned
+
+
+def test_pins():
+    text = """signal_name  model_name  R_pin  L_pin  C_pin
+A1  DQ0   io_model  0.1   1.5n  0.5p  | Ball A1.
+A2  VDD   POWER
+A3  DQ1   io_model  NA    NA    NA
+B1  DQ1   io_model
+B2  CLK   sel
+[Diff Pin]"""
+    rslt = pins(text, 0)
+    assert rslt.status and text[rslt.index:] == "[Diff Pin]"
+    table = rslt.value
+    assert table == {
+        "A1(DQ0)": ("io_model", {"R_pin": 0.1, "L_pin": 1.5e-9, "C_pin": 0.5e-12}),
+        "A3(DQ1)": ("io_model", {}),
+        "B1(DQ1)": ("io_model", {}),
+        "B2(CLK)": ("sel", {}),
+    }
+    assert table.model_pins == {"io_model": ["A1(DQ0)", "A3(DQ1)", "B1(DQ1)"], "sel": ["B2(CLK)"]}
+    assert table.signal_pins["DQ1"] == ["A3(DQ1)", "B1(DQ1)"]
+    assert table.pin_signals["B2(CLK)"] == "CLK"
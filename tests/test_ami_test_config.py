@@ -13,11 +13,13 @@ from unittest.mock import MagicMock
 
 import numpy as np
 import pytest
+from click.testing import CliRunner
 
 from pyibisami.ami.model import AMIModel, AMIModelInitializer
 from pyibisami.testing.ami_test_config import (
     AmiTestConfigResult,
     _parse_ami_input_params_file,
+    main,
     run_ami_test_config,
     run_all_ami_test_configs,
 )
@@ -368,3 +370,26 @@ class TestRunAll:
         assert names == {"stat", "td"}
         assert all(r.passed for r in results), \
             "\n".join(str(r) for r in results if not r.passed)
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+class TestCLI:
+    "Tests for the ``check-ami`` command line interface."
+
+    def test_unknown_model(self, tmp_path, make_ibis):
+        ibis_file = tmp_path / "synthetic.ibs"
+        ibis_file.write_text(make_ibis(3))
+        result = CliRunner().invoke(main, [str(ibis_file), "-m", "no_such_model"])
+        assert result.exit_code == 1
+        assert "available: model_0, model_1, model_2" in result.output
+
+    def test_selected_model(self, tmp_path, make_ibis):
+        "Only the selected model is parsed; so, errors in the others don't matter."
+        ibis_file = tmp_path / "synthetic.ibs"
+        ibis_file.write_text(make_ibis(3, bad_model=0))
+        result = CliRunner().invoke(main, [str(ibis_file), "-m", "model_2"])
+        assert result.exit_code == 0
+        assert "No [AMI Test Configuration] blocks found in model 'model_2'" in result.output
@@ -0,0 +1,71 @@
+import os
+import time
+
+import numpy as np
+
+from pyibisami.util.cache import CACHE_DIR_ENV, PARSE_CACHE_ENV, DiskCache, file_digest, make_key, parse_cache
+
+
+def test_make_key():
+    assert make_key("ab", "c") != make_key("a", "bc")
+    assert make_key("a", b"b") == make_key(b"a", "b")
+
+
+def test_file_digest(tmp_path):
+    a_file = tmp_path.joinpath("a_file")
+    a_file.write_bytes(b"contents")
+    digest = file_digest(a_file)
+    assert digest == file_digest(str(a_file))
+    a_file.write_bytes(b"new contents")
+    assert file_digest(a_file) != digest
+
+
+def test_get_put(tmp_path):
+    cache = DiskCache(tmp_path)
+    assert cache.get("key") is None
+    cache.put("key", x=np.arange(3.0), s=np.frombuffer(b"abc", dtype=np.uint8))
+    entry = cache.get("key")
+    assert np.array_equal(entry["x"], [0.0, 1.0, 2.0])
+    assert entry["s"].tobytes() == b"abc"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_corrupt_entry(tmp_path):
+    cache = DiskCache(tmp_path)
+    tmp_path.joinpath("key.npz").write_bytes(b"garbage")
+    assert cache.get("key") is None
+
+
+def test_lru_eviction(tmp_path):
+    cache = DiskCache(tmp_path)
+    for key in ["a", "b", "c"]:
+        cache.put(key, x=np.zeros(1000))
+        time.sleep(0.01)
+    entry_size = os.path.getsize(tmp_path.joinpath("a.npz"))
+    cache.get("a")  # Now, "b" is the least recently used.
+    cache.max_bytes = 2 * entry_size
+    cache.evict()
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+def test_get_put_object(tmp_path):
+    cache = DiskCache(tmp_path)
+    assert cache.get_object("key") is None
+    cache.put_object("key", {"a": [1, 2.0, "three"], "b": (None, True)})
+    assert cache.get_object("key") == {"a": [1, 2.0, "three"], "b": (None, True)}
+    cache.put("key", x=np.arange(3.0))  # Not a pickled object.
+    assert cache.get_object("key") is None
+
+
+def test_parse_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+    monkeypatch.delenv(PARSE_CACHE_ENV, raising=False)
+    assert parse_cache() is None
+    assert parse_cache(True).directory == tmp_path / "parse"
+    monkeypatch.setenv(PARSE_CACHE_ENV, "1")
+    assert parse_cache() is not None
+    assert parse_cache(False) is None
+    cache = DiskCache(tmp_path)
+    assert parse_cache(cache) is cache
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from pyibisami.common import DECONV_LSTSQ_MAX_LEN, convolve, deconv_same
+
+
+def _settled_case(n):
+    """Channel & filter responses, which settle well within the observation window."""
+    x = np.zeros(n)
+    x[3:] = 0.2 * 0.8 ** np.arange(n - 3)  # Delayed first order low-pass response.
+    h = np.zeros(n)
+    h[[0, n // 8, n // 4]] = [1.0, -0.3, 0.1]
+    y = np.convolve(x, h)[:n]
+    return y, x, np.roll(h, (n - 1) // 2)  # Deconvolution in "same" mode delays the response.
+
+
+@pytest.mark.parametrize("n", [128, 256, 512])
+def test_deconv_same_fft_matches_lstsq(n):
+    y, x, h = _settled_case(n)
+    h_lstsq = deconv_same(y, x, method="lstsq")
+    h_fft = deconv_same(y, x, method="fft")
+    lstsq_err = np.abs(h_lstsq - h).max()
+    assert lstsq_err < 0.02  # The dense solution is poorly conditioned, where `h` must be zero.
+    assert np.allclose(h_fft, h, atol=1e-8)
+    assert np.abs(h_fft - h_lstsq).max() <= lstsq_err + 1e-8
+
+
+def test_deconv_same_fft_large():
+    y, x, h = _settled_case(1 << 16)
+    assert np.allclose(deconv_same(y, x), h, atol=1e-6)
+
+
+def test_deconv_same_auto():
+    y, x, _ = _settled_case(DECONV_LSTSQ_MAX_LEN)
+    assert np.array_equal(deconv_same(y, x), deconv_same(y, x, method="lstsq"))
+    y, x, _ = _settled_case(2 * DECONV_LSTSQ_MAX_LEN)
+    assert np.array_equal(deconv_same(y, x), deconv_same(y, x, method="fft"))
+
+
+def test_deconv_same_bad_method():
+    y, x, _ = _settled_case(64)
+    with pytest.raises(ValueError):
+        deconv_same(y, x, method="bogus")
+
+
+@pytest.mark.parametrize("mode", ["full", "same", "valid"])
+@pytest.mark.parametrize("len_x, len_h", [(10, 3), (1000, 100), (100_000, 128), (5000, 5000)])
+def test_convolve_matches_numpy(len_x, len_h, mode):
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal(len_x)
+    h = rng.standard_normal(len_h)
+    assert np.allclose(convolve(x, h, mode=mode), np.convolve(x, h, mode=mode))
+
+
+def test_convolve_batched():
+    rng = np.random.default_rng(0)
+    xs = rng.standard_normal((4, 1000))
+    h = rng.standard_normal(50)
+    expected = np.array([np.convolve(x, h) for x in xs])
+    assert np.allclose(convolve(xs, h), expected)
+    assert np.allclose(convolve(h, xs), expected)
+    assert np.allclose(convolve(xs, np.tile(h, (4, 1))), expected)
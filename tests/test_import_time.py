@@ -0,0 +1,45 @@
+"""
+Guard against regressions in import time, by checking that the heavy GUI/plotting/numerics packages
+are only imported when actually needed.
+
+(The import times themselves are machine dependent; see ``benchmarks/bench_import_time.py``.)
+"""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ["traitsui.api", "chaco.api", "enable.api", "matplotlib.pyplot", "scipy.signal"]
+
+
+def heavy_imports_in_subprocess(module: str) -> list[str]:
+    "Import a module in a fresh interpreter; return the heavy modules which got imported."
+    code = (
+        "import json, sys\n"
+        f"import {module}\n"
+        f"print(json.dumps([mod for mod in {HEAVY_MODULES!r} if mod in sys.modules]))\n"
+    )
+    rslt = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return json.loads(rslt.stdout.splitlines()[-1])
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "pyibisami.ami.model",
+        "pyibisami.ami.parser",
+        "pyibisami.ibis.parser",
+        "pyibisami.ibis.file",
+        "pyibisami.ibis.library",
+        "pyibisami.ami.config",
+        "pyibisami.tools.run_tests",
+        "pyibisami.tools.run_notebook",
+        "pyibisami.testing.test_models",
+        "pyibisami.testing.ami_test_config",
+    ],
+)
+def test_import_is_light(module):
+    heavy = heavy_imports_in_subprocess(module)
+    assert not heavy, f"Importing {module} pulled in: {heavy}"
@@ -0,0 +1,23 @@
+import os
+
+from click.testing import CliRunner
+
+from pyibisami.testing import test_models
+
+
+def test_cli_flags_are_passed_not_exported(tmp_path, monkeypatch):
+    "The cache/instrumentation flags must reach the test harness as arguments, not leak into ``os.environ``."
+    calls = []
+    monkeypatch.setattr(test_models, "test_ibis_ami_models", lambda *args, **kwargs: calls.append(kwargs))
+    ibis_file = tmp_path / "dummy.ibs"
+    ibis_file.write_text("")
+    environ = dict(os.environ)
+    params = ["-p", str(tmp_path / "runs"), str(ibis_file)]
+
+    rslt = CliRunner().invoke(test_models.main, ["--init-cache", "--instrument", "--parse-cache", *params])
+    assert rslt.exit_code == 0, rslt.output
+    assert (calls[-1]["init_cache"], calls[-1]["instrument"], calls[-1]["parse_cache"]) == (True, True, True)
+    rslt = CliRunner().invoke(test_models.main, params)
+    assert rslt.exit_code == 0, rslt.output
+    assert (calls[-1]["init_cache"], calls[-1]["instrument"], calls[-1]["parse_cache"]) == (None, None, None)
+    assert dict(os.environ) == environ
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from pyibisami.util.ami import extract_out_params, get_cdr_adaptation, get_dfe_adaptation
+
+
+def _out_params(n):
+    return [
+        f'(rx (cdr_locked {"True" if k % 2 else 1}) (cdr_ui {100e-12 + k * 1e-15:.6e}) '
+        f'(dfe (tap1 {0.01 * k:.4f}) (tap2 {-0.002 * k})) (-1 {k}) (msg "hi there"))'
+        for k in range(n)
+    ]
+
+
+@pytest.mark.parametrize("size_hint", [None, 1, 7])
+def test_extract_out_params(size_hint):
+    strings = _out_params(20)
+    paths = [("cdr_ui",), ("dfe", "tap2"), ("pre1",), ("cdr_locked",), ("missing",), ("dfe",)]
+    rslt = extract_out_params(iter(strings) if size_hint else strings, paths, size_hint=size_hint)
+    k = np.arange(20)
+    assert np.allclose(rslt[("cdr_ui",)], 100e-12 + k * 1e-15)
+    assert np.allclose(rslt[("dfe", "tap2")], -0.002 * k)
+    assert np.array_equal(rslt[("pre1",)], k)
+    assert np.array_equal(rslt[("cdr_locked",)], np.where(k % 2, np.nan, 1), equal_nan=True)
+    assert np.isnan(rslt[("missing",)]).all() and len(rslt[("missing",)]) == 20
+    assert np.isnan(rslt[("dfe",)]).all()
+
+
+def test_extract_out_params_fallback():
+    "Strings not matching the learned structure must still be handled correctly."
+    strings = _out_params(3) + ["(rx (dfe (tap2 5)) | A comment.\n (cdr_ui 2))", "(rx (cdr_ui 1e-10) (dfe))"]
+    rslt = extract_out_params(strings, [("cdr_ui",), ("dfe", "tap2")])
+    assert np.allclose(rslt[("cdr_ui",)], [100e-12, 100.001e-12, 100.002e-12, 2, 1e-10])
+    assert np.array_equal(rslt[("dfe", "tap2")], [0, -0.002, -0.004, 5, np.nan], equal_nan=True)
+
+
+def test_extract_out_params_empty():
+    assert len(extract_out_params([], [("cdr_ui",)])[("cdr_ui",)]) == 0
+
+
+def test_adaptation():
+    strings = [f"(rx (dfe_tap1 {0.1 * k}) (dfe_tap2 {-0.1 * k}) (cdr_ui_est {k}) (other 3))" for k in range(10)]
+    strings[5] = "(rx (dfe_tap1 0.5) (cdr_ui_est 5))"  # Missing values are skipped.
+    dfe = get_dfe_adaptation(strings)
+    assert list(dfe) == ["dfe_tap1", "dfe_tap2"]
+    assert np.allclose(dfe["dfe_tap1"], 0.1 * np.arange(10))
+    assert np.allclose(dfe["dfe_tap2"], -0.1 * np.delete(np.arange(10), 5))
+    assert np.array_equal(get_cdr_adaptation(strings), np.arange(10))
+    assert len(get_cdr_adaptation(["(rx (other 1))"])) == 0